@@ -22,8 +22,11 @@ class Alien(Sprite):
         screen (pygame.Surface): The game screen where the alien is rendered.
         boundaries (pygame.Rect): The screen boundaries for edge detection.
         settings (object): Game settings containing alien image, size, and speed.
-        image (pygame.Surface): The alien's image.
+        image (pygame.Surface): The alien's image, shared through the asset cache.
+        blend_flags (int): Blit flags matching the image's alpha mode.
         rect (pygame.Rect): The position and size of the alien sprite.
+        origin_x (int): Horizontal position the alien was created at.
+        origin_y (int): Vertical position the alien was created at.
         x (float): Horizontal position of the alien (float for smooth movement).
         y (float): Vertical position of the alien.
     """
@@ -44,24 +47,29 @@ class Alien(Sprite):
         self.boundaries = fleet.game.screen.get_rect()
         self.settings = fleet.game.settings
 
-        self.image = pygame.image.load(str(self.settings.alien_file))
-        self.image = pygame.transform.scale(self.image,
-                (self.settings.alien_w, self.settings.alien_h)
+        assets = fleet.game.assets
+        self.image = assets.get_image(self.settings.alien_file,
+                fleet.formation, assets.alpha_mode
                 )
+        self.blend_flags = assets.blend_flags
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
+        self.origin_x = self.rect.x
+        self.origin_y = self.rect.y
         self.y = float(self.rect.y)
         self.x = float(self.rect.x)
 
     def update(self):
         """
-        Update the alien's position based on fleet direction and speed.
+        Update the alien's position from the distance the fleet has travelled.
+
+        Every alien applies the same whole-pixel shift, so the formation never
+        drifts apart through per-alien float rounding.
         """
-        temp_speed = self.settings.fleet_speed
-        self.x += temp_speed * self.fleet.fleet_direction
-        self.rect.x = self.x
+        self.x = self.origin_x + self.fleet.shift
+        self.rect.x = self.origin_x + self.fleet.shift_px
         self.rect.y = self.y
 
     def check_edges(self) -> bool:
@@ -78,4 +86,4 @@ class Alien(Sprite):
         """
         Draw the alien at its current location on the screen.
         """
-        self.screen.blit(self.image, self.rect)
+        self.screen.blit(self.image, self.rect, special_flags=self.blend_flags)
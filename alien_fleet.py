@@ -3,11 +3,15 @@ alien_fleet.py
 
 This module defines the AlienFleet class, which manages a group of Alien
 instances in a triangular formation. The fleet handles creation, movement,
-collision detection, edge checking, and rendering.
+collision detection, edge checking, and rendering. Because the formation moves
+rigidly, it can optionally be drawn from a single pre-composited surface, and
+its collision grid and bounding box never need rebuilding as it moves.
 """
 
 import pygame
 from alien import Alien
+from spatial_grid import SpatialGrid
+from fleet_bounds import FleetBounds
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,8 +25,28 @@ class AlienFleet:
         game (AlienInvasion): The main game instance.
         settings (object): Game settings including screen and fleet configuration.
         fleet (pygame.sprite.Group): Group of all alien sprites.
+        aliens (list): Every alien of the current formation in creation
+            order, destroyed or not.
+        formation (Tuple[float, float] | None): Alien width and height the
+            current formation was created with.
         fleet_direction (int): Direction the fleet is currently moving.
         fleet_drop_speed (int): Distance to drop when the fleet hits the edge.
+        render_mode (str): 'sprites' to blit each alien, or 'composite' to blit
+            the whole formation from one cached surface.
+        composite (pygame.Surface | None): Cached image of the formation, built
+            lazily in composite mode.
+        composite_cells (dict): Each alien's rect inside the composite surface.
+        shift (float): Horizontal distance the formation has travelled since it
+            was created.
+        shift_px (int): `shift` rounded to whole pixels, shared by every alien so
+            the formation stays rigid on screen.
+        prev_shift (float): `shift` before the last simulation step, for
+            interpolation.
+        drop (int): Distance the formation has dropped since it was created.
+        grid (SpatialGrid): Collision broadphase holding each alien's rect in
+            formation coordinates, i.e. offset by (-shift_px, -drop).
+        bounds (FleetBounds): Extents of the living aliens in formation
+            coordinates, updated as aliens are destroyed.
     """
 
     def __init__(self, game: 'AlienInvasion'):
@@ -35,17 +59,40 @@ class AlienFleet:
         self.game = game
         self.settings = game.settings
         self.fleet = pygame.sprite.Group()
+        self.aliens = []
+        self.formation = None
         self.fleet_direction = self.settings.fleet_direction
         self.fleet_drop_speed = self.settings.fleet_drop_speed
+        self.render_mode = self.settings.fleet_render_mode
+        self.composite = None
+        self.composite_cells = {}
+        self.shift = 0.0
+        self.shift_px = 0
+        self.prev_shift = 0.0
+        self.drop = 0
+        self.grid = SpatialGrid(self.settings.fleet_grid_cell)
+        self.bounds = FleetBounds()
 
         self.create_fleet()
 
-    def create_fleet(self):
+    def create_fleet(self, formation=None):
         """
         Calculate dimensions and initialize a triangular alien fleet formation.
+
+        Args:
+            formation (Tuple[float, float] | None): Alien width and height to
+                build with, defaulting to the current settings.
         """
-        alien_w = self.settings.alien_w
-        alien_h = self.settings.alien_h
+        self.composite = None
+        self.shift = 0.0
+        self.shift_px = 0
+        self.prev_shift = 0.0
+        self.drop = 0
+        self.aliens = []
+        if formation is None:
+            formation = (self.settings.alien_w, self.settings.alien_h)
+        alien_w, alien_h = formation
+        self.formation = (alien_w, alien_h)
         screen_w = self.settings.screen_w
         screen_h = self.settings.screen_h
 
@@ -53,6 +100,18 @@ class AlienFleet:
         x_offset, y_offset = self.calculate_offsets(alien_w, alien_h, screen_w, fleet_w, fleet_h)
 
         self._create_triangle_fleet(alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
+        self._index_fleet()
+
+    def _index_fleet(self):
+        """
+        Rebuild the collision grid and bounds from the aliens in the fleet.
+        """
+        self.grid.clear()
+        self.bounds.clear()
+        for alien in self.fleet:
+            local_rect = alien.rect.move(-self.shift_px, -self.drop)
+            self.grid.insert(alien, local_rect)
+            self.bounds.add(local_rect)
 
     def _create_triangle_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
         """
@@ -66,7 +125,7 @@ class AlienFleet:
             x_offset (int): Horizontal margin offset.
             y_offset (int): Vertical margin offset.
         """
-        triangle_base_width = 17  # Maximum aliens in bottom row
+        triangle_base_width = self.settings.fleet_base_width  # Maximum aliens in a row
 
         for row in range((triangle_base_width + 1) // 2):
             aliens_in_row = triangle_base_width - 2 * row
@@ -129,22 +188,37 @@ class AlienFleet:
             current_y (int): Y-position for the alien.
         """
         new_alien = Alien(self, current_x, current_y)
+        self.aliens.append(new_alien)
         self.fleet.add(new_alien)
 
     def _check_fleet_edges(self):
         """
         Check if any aliens hit the screen edge and reverse direction if so.
         """
-        for alien in self.fleet:
-            if alien.check_edges():
-                self._drop_alien_fleet()
-                self.fleet_direction *= -1
-                break
+        if self._at_screen_edge():
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
+
+    def _at_screen_edge(self) -> bool:
+        """
+        Check if any alien touches the left or right edge of the screen.
+
+        Uses the tracked bounds, which gives the same answer as calling
+        `Alien.check_edges` on every alien.
+
+        Returns:
+            bool: True if the fleet touches an edge; False otherwise.
+        """
+        if not self.fleet or self.bounds.left is None:
+            return False
+        return (self.bounds.right + self.shift_px >= self.settings.screen_w
+                or self.bounds.left + self.shift_px <= 0)
 
     def _drop_alien_fleet(self):
         """
         Drop the entire fleet downward when hitting the screen edge.
         """
+        self.drop += self.fleet_drop_speed
         for alien in self.fleet:
             alien.y += self.fleet_drop_speed
 
@@ -153,26 +227,227 @@ class AlienFleet:
         Update fleet position and check for edge collisions.
         """
         self._check_fleet_edges()
+        self.prev_shift = self.shift
+        self.shift += self.settings.fleet_speed * self.settings.step_scale * self.fleet_direction
+        self.shift_px = round(self.shift)
         self.fleet.update()
 
+    def _interpolated_dx(self, alpha: float) -> int:
+        """
+        Get the horizontal offset from the current positions to where the fleet
+        should be drawn between the last two simulation steps.
+
+        Args:
+            alpha (float): How far between the previous and current step, from 0 to 1.
+
+        Returns:
+            int: Pixels to add to every alien's x position.
+        """
+        if alpha >= 1.0:
+            return 0
+        shift = self.prev_shift + (self.shift - self.prev_shift) * alpha
+        return round(shift) - self.shift_px
+
+    def get_blits(self, alpha: float = 1.0) -> list:
+        """
+        Build the blit sequence for the fleet.
+
+        In composite mode this is a single blit of the cached formation,
+        positioned from any living alien's rect.
+
+        Args:
+            alpha (float): How far between the previous and current simulation
+                step to draw the fleet, from 0 to 1.
+
+        Returns:
+            list: (image, rect, area, special_flags) tuples for `Surface.blits`.
+        """
+        dx = self._interpolated_dx(alpha)
+        if self.render_mode != 'composite':
+            if dx:
+                return [(alien.image, alien.rect.move(dx, 0), None, alien.blend_flags)
+                        for alien in self.fleet]
+            return [(alien.image, alien.rect, None, alien.blend_flags)
+                    for alien in self.fleet]
+        if not self.fleet:
+            return []
+        if self.composite is None:
+            self._build_composite()
+
+        alien = next(iter(self.fleet))
+        cell = self.composite_cells[alien]
+        dest = (alien.rect.x - cell.x + dx, alien.rect.y - cell.y)
+        return [(self.composite, dest, None, alien.blend_flags)]
+
+    def _build_composite(self):
+        """
+        Render every alien into one transparent surface covering the formation.
+        """
+        aliens = self.fleet.sprites()
+        bounds = aliens[0].rect.unionall([alien.rect for alien in aliens])
+        self.composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self.composite_cells = {}
+        for alien in aliens:
+            cell = alien.rect.move(-bounds.x, -bounds.y)
+            self.composite_cells[alien] = cell
+            # Cells start fully transparent, so MAX copies the pixels unblended.
+            self.composite.blit(alien.image, cell, special_flags=pygame.BLEND_RGBA_MAX)
+
+    def _clear_composite_cells(self, aliens):
+        """
+        Erase destroyed aliens from the composite surface.
+
+        Any surviving alien overlapping a cleared cell is copied back in.
+
+        Args:
+            aliens (Iterable[Alien]): The aliens that were removed from the fleet.
+        """
+        if self.composite is None:
+            return
+        for alien in aliens:
+            cell = self.composite_cells.pop(alien, None)
+            if cell is None:
+                continue
+            self.composite.fill((0, 0, 0, 0), cell)
+            for other, other_cell in self.composite_cells.items():
+                if other_cell.colliderect(cell):
+                    self.composite.blit(other.image, other_cell,
+                                        special_flags=pygame.BLEND_RGBA_MAX)
+
     def draw(self):
         """
-        Draw all aliens in the fleet to the screen.
+        Draw all aliens in the fleet to the screen in a single batched call.
         """
-        for alien in self.fleet:
-            alien.draw_alien()
+        self.game.screen.blits(self.get_blits(), False)
+
+    def collide_rect(self, rect):
+        """
+        Find the first alien, in fleet order, overlapping a rect.
+
+        Only aliens in the grid cells the rect covers are tested.
+
+        Args:
+            rect (pygame.Rect): The area to test, in screen coordinates.
+
+        Returns:
+            Alien | None: The colliding alien, or None.
+        """
+        local_rect = rect.move(-self.shift_px, -self.drop)
+        for alien in self.grid.query(local_rect):
+            if alien.alive() and alien.rect.colliderect(rect):
+                return alien
+        return None
 
     def check_collisions(self, other_group):
         """
         Detect and process collisions with another sprite group.
 
+        Matches `pygame.sprite.groupcollide(fleet, other_group, True, True)`:
+        each colliding sprite is credited to the first alien it overlaps, and
+        both are removed.
+
         Args:
             other_group (pygame.sprite.Group): The group to check collisions against.
 
         Returns:
             dict: Dictionary of collided sprites.
         """
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)
+        hits = {}
+        for sprite in other_group.sprites():
+            alien = self.collide_rect(sprite.rect)
+            if alien is not None:
+                hits.setdefault(alien, []).append(sprite)
+        if not hits:
+            return hits
+
+        order = self.grid.order
+        collisions = dict(sorted(hits.items(), key=lambda hit: order[hit[0]]))
+        for alien, sprites in collisions.items():
+            alien.kill()
+            self.grid.remove(alien)
+            self.bounds.remove(alien.rect.move(-self.shift_px, -self.drop))
+            for sprite in sprites:
+                sprite.kill()
+        self._clear_composite_cells(collisions)
+        return collisions
+
+    def get_state(self) -> tuple:
+        """
+        Get the fleet's simulation state for a snapshot.
+
+        Returns:
+            tuple: fleet_direction, shift, shift_px, prev_shift, drop, the
+                formation's alien width and height, its alien count and a
+                bitmask of the living aliens.
+        """
+        return (self.fleet_direction, self.shift, self.shift_px, self.prev_shift,
+                self.drop, *self.formation, len(self.aliens), self._get_alive_mask())
+
+    def set_state(self, state: tuple):
+        """
+        Restore the fleet from a snapshot.
+
+        The current aliens are reused; the formation is only rebuilt when the
+        snapshot's formation has a different alien size. That size is stored
+        rather than taken from the settings, since a cleared level builds the
+        next formation before the settings shrink the aliens.
+
+        Args:
+            state (tuple): Values from `get_state`.
+
+        Raises:
+            ValueError: If the snapshot's formation has a different alien count.
+        """
+        direction, shift, shift_px, prev_shift, drop, alien_w, alien_h, count, mask = state
+        if self.formation != (alien_w, alien_h):
+            self.fleet.empty()
+            self.create_fleet((alien_w, alien_h))
+        if count != len(self.aliens):
+            raise ValueError(f'Snapshot has {count} aliens, the formation has {len(self.aliens)}')
+        self.fleet_direction = direction
+        self.shift = shift
+        self.shift_px = shift_px
+        self.prev_shift = prev_shift
+        self.drop = drop
+        self._set_alive_mask(mask)
+
+    def _get_alive_mask(self) -> bytes:
+        """
+        Pack which aliens are alive into bits, in creation order.
+
+        Returns:
+            bytes: Little-endian bitmask, one bit per alien.
+        """
+        bits = 0
+        for index, alien in enumerate(self.aliens):
+            if alien.alive():
+                bits |= 1 << index
+        return bits.to_bytes((len(self.aliens) + 7) // 8, 'little')
+
+    def _set_alive_mask(self, mask: bytes):
+        """
+        Place the living aliens of a bitmask at the current shift and drop.
+        The group, grid and bounds are only rebuilt if a different set of
+        aliens is alive, since they do not depend on the fleet's position.
+
+        Args:
+            mask (bytes): Bitmask from `_get_alive_mask`.
+        """
+        changed = mask != self._get_alive_mask()
+        bits = int.from_bytes(mask, 'little')
+        living = []
+        for index, alien in enumerate(self.aliens):
+            if bits >> index & 1:
+                alien.x = alien.origin_x + self.shift
+                alien.y = float(alien.origin_y + self.drop)
+                alien.rect.x = alien.origin_x + self.shift_px
+                alien.rect.y = alien.y
+                living.append(alien)
+        if changed:
+            self.fleet.empty()
+            self.fleet.add(living)
+            self.composite = None
+            self._index_fleet()
 
     def check_fleet_bottom(self) -> bool:
         """
@@ -181,10 +456,9 @@ class AlienFleet:
         Returns:
             bool: True if any alien touches the bottom; False otherwise.
         """
-        for alien in self.fleet:
-            if alien.rect.bottom >= self.settings.screen_h:
-                return True
-        return False
+        if not self.fleet or self.bounds.bottom is None:
+            return False
+        return self.bounds.bottom + self.drop >= self.settings.screen_h
 
     def check_destroyed_status(self) -> bool:
         """
@@ -3,75 +3,374 @@ alien_invasion.py
 
 This module initializes and runs the Alien Invasion game using Pygame.
 It manages the game loop, event handling, rendering, collisions, and
-game state transitions such as restarting and leveling up.
+game state transitions such as restarting and leveling up. The game can also
+run headless, without a window, audio or frame cap, driven by scripted input.
+A staged startup shows the Play screen at once and loads the remaining assets
+on a background thread. Handled input can be recorded to an InputLog and
+replayed deterministically.
 """
 
+import random
 import sys
+import time
 import pygame
+from copy import copy
 from settings import Settings
 from ship import Ship
 from arsenal import Arsenal
 from alien_fleet import AlienFleet
 from game_stats import GameStats
-from time import sleep
 from button import Button
 from hud import HUD
+from asset_cache import AssetCache
+from renderer import Renderer
+from frame_profiler import FrameProfiler
+from asset_loader import AssetLoader
+from asset_bundle import AssetBundle
+from audio import Audio
+from input_log import InputLog
+from game_snapshot import take_snapshot, restore_snapshot
 
 class AlienInvasion:
     """
     The main class for managing game state, rendering, input, and logic
     for the Alien Invasion game.
+
+    In headless mode the game draws nothing and plays no sound: the screen is
+    an offscreen surface used only for its bounds, there is no HUD, renderer
+    or font, and each tick advances the simulation by one fixed step with no
+    frame cap. Input comes from `input_source` instead of the event queue.
+
+    While a game is active it is in one of two states: 'playing', or 'respawn'
+    after a life is lost. The respawn state holds the simulation for
+    `respawn_pause` seconds' worth of steps while events are still handled and
+    frames still drawn, then returns to 'playing'.
+
+    With a staged startup the constructor only opens the window and prepares
+    the Play button. The background, sounds and the ship, alien and bullet art
+    are decoded by an AssetLoader thread, and the HUD, ship, fleet and renderer
+    are built by `finish_loading` once it is done. Until then `run_game` shows
+    the Play screen with a progress bar, and only blocks if Play is clicked
+    early. `startup_times` records milliseconds from construction to the
+    first frame and to the assets being ready.
+
+    With `record_input` set, every event passed to the keyboard and Play button
+    handlers is recorded with its tick, and the log is written to
+    `input_log_file` on quit. Any game randomness must come from `rng`, whose
+    seed is recorded too, so a replay reproduces the session exactly.
+
+    `snapshot` packs the simulation state into a few kilobytes and `restore`
+    returns to it in microseconds, for instant retries, rewinding and seeding
+    benchmarks from the middle of a game.
     """
 
-    def __init__(self):
+    def __init__(self, headless: bool = False, input_source=None,
+                 settings: Settings = None, staged: bool = False, seed: int = None):
         """
         Initialize the game, settings, screen, and all game components.
+
+        Args:
+            headless (bool): Run without a display, audio or frame cap.
+            input_source (ScriptedInput | None): Where to read events from
+                instead of the Pygame event queue.
+            settings (Settings | None): Settings to use instead of the defaults.
+            staged (bool): Load assets on a background thread and leave the
+                game objects to `finish_loading`. Ignored when headless.
+            seed (int | None): Seed for `rng`, random if not given.
         """
-        pygame.init()
-        self.settings = Settings()
+        self.started_at = time.perf_counter()
+        self.startup_times = {}
+        self.headless = headless
+        self.input_source = input_source
+        self.tick = 0
+        self.settings = settings if settings is not None else Settings()
         self.settings.initialize__dynamic_settings()
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.recorder = None
+        if self.settings.record_input and input_source is None:
+            self.recorder = InputLog(self.seed, self.settings)
+        screen_size = (self.settings.screen_w, self.settings.screen_h)
 
-        self.screen = pygame.display.set_mode(
-            (self.settings.screen_w, self.settings.screen_h)
-        )
-        pygame.display.set_caption(self.settings.name)
+        if headless:
+            self.screen = pygame.Surface(screen_size)
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode(screen_size)
+            pygame.display.set_caption(self.settings.name)
 
-        self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg,
-            (self.settings.screen_w, self.settings.screen_h)
+        self.bundle = None
+        if self.settings.asset_bundle_file.exists():
+            self.bundle = AssetBundle(self.settings.asset_bundle_file)
+        self.assets = AssetCache(self.settings.asset_cache_capacity,
+            self.settings.premultiply_alpha, self.bundle
         )
+        self.bg = None
+
+        self.profiler = None
+        if self.settings.profile_frames:
+            self.profiler = FrameProfiler(self.settings.profile_capacity)
 
         self.game_stats = GameStats(self)
-        self.HUD = HUD(self)
         self.running = True
         self.clock = pygame.time.Clock()
+        self.play_button = Button(self, 'Play')
+        self.game_active = False
+        self.state = 'playing'
+        self.respawn_ticks = 0
+
+        self.HUD = None
+        self.audio = None
+        self.ship = None
+        self.alien_fleet = None
+        self.renderer = None
+        self.loaded = False
+        if not headless:
+            pygame.mixer.init()
 
-        pygame.mixer.init()
-        self.laser_sound = pygame.mixer.Sound(self.settings.laser_sound)
-        self.laser_sound.set_volume(0.3)
+        self.loader = AssetLoader(self._get_asset_tasks())
+        if staged and not headless:
+            self.loader.start()
+        else:
+            self.loader.run()
+            self.finish_loading()
+
+    def _get_asset_tasks(self) -> list:
+        """
+        List the slow decoding work that can run off the main thread.
+
+        Returns:
+            list: (name, callable) pairs for the AssetLoader.
+        """
+        settings = self.settings
+        assets = self.assets
+        tasks = [] if self.headless else [
+            ('background', lambda: assets.preload(settings.bg_file)),
+        ]
+        tasks += [
+            ('ship_image', lambda: assets.preload(settings.ship_file)),
+            ('alien_image', lambda: assets.preload(settings.alien_file)),
+            ('bullet_image', lambda: assets.preload(settings.bullet_file)),
+        ]
+        if not self.headless:
+            tasks += [
+                ('laser', lambda: self._load_sound(settings.laser_sound)),
+                ('impact', lambda: self._load_sound(settings.impact_sound)),
+            ]
+        return tasks
+
+    def _load_sound(self, path) -> pygame.mixer.Sound:
+        """
+        Load a sound from the asset bundle, or decode its file if it is not bundled.
+
+        Args:
+            path (Path): File path to the sound.
+
+        Returns:
+            pygame.mixer.Sound: The sound.
+        """
+        if self.bundle is not None:
+            sound = self.bundle.get_sound(path)
+            if sound is not None:
+                return sound
+        return pygame.mixer.Sound(path)
+
+    def finish_loading(self):
+        """
+        Wait for the asset loader, then build the background, HUD, sounds, ship,
+        fleet and renderer from the decoded assets.
+        """
+        if self.loaded:
+            return
+        results = self.loader.wait()
 
-        self.impact_sound = pygame.mixer.Sound(self.settings.impact_sound)
-        self.impact_sound.set_volume(0.3)
+        if not self.headless:
+            self._prepare_background()
+            self.HUD = HUD(self)
+            self.audio = Audio(self.settings,
+                {'laser': results['laser'], 'impact': results['impact']}
+            )
 
         self.ship = Ship(self, Arsenal(self))
-        self.alien_fleet = AlienFleet(self)
+        if self.settings.fleet_backend == 'numpy':
+            from swarm_fleet import SwarmFleet
+            self.alien_fleet = SwarmFleet(self)
+        else:
+            self.alien_fleet = AlienFleet(self)
         self.alien_fleet.create_fleet()
 
-        self.play_button = Button(self, 'Play')
-        self.game_active = False
+        if not self.headless:
+            self.renderer = Renderer(self)
+        self.loaded = True
+        self._record_startup('assets_ready')
+
+    def _prepare_background(self):
+        """
+        Scale and convert the decoded background to the screen, once.
+        """
+        if self.bg is None:
+            self.bg = self.assets.get_image(self.settings.bg_file,
+                (self.settings.screen_w, self.settings.screen_h), 'opaque'
+            )
+
+    def _record_startup(self, stage: str):
+        """
+        Record the first time a startup stage is reached.
+
+        Args:
+            stage (str): The stage name.
+        """
+        if stage not in self.startup_times:
+            self.startup_times[stage] = (time.perf_counter() - self.started_at) * 1000
 
     def run_game(self):
         """
         The main game loop. Handles input, updates game objects, and renders the screen.
+
+        The simulation advances in fixed steps of `1 / sim_rate` seconds, as
+        many as the elapsed time calls for, independent of the render rate.
+        Each frame is drawn between the last two steps so motion stays smooth
+        when the two rates differ. Headless runs step as fast as possible.
         """
+        if self.headless:
+            while self.running:
+                self.step()
+            return
+
+        if not self.loaded:
+            self._run_startup()
+        profiler = self.profiler
+        step_time = 1 / self.settings.sim_rate
+        lag = 0.0
+        previous = time.perf_counter()
         while self.running:
-            self._check_events()
-            if self.game_active:
+            if profiler:
+                profiler.begin_frame()
+            now = time.perf_counter()
+            lag += min(now - previous, self.settings.max_frame_time)
+            previous = now
+
+            while lag >= step_time and self.running:
+                self.step()
+                lag -= step_time
+
+            interpolate = (self.settings.interpolate and self.game_active
+                and self.state == 'playing')
+            alpha = lag / step_time if interpolate else 1.0
+            self._update_screen(alpha)
+
+            if profiler:
+                start = profiler.start()
+            self.clock.tick(self.settings.FPS)
+            if profiler:
+                profiler.stop('clock.tick', start)
+                profiler.end_frame()
+                self._update_profile_overlay()
+
+    def _run_startup(self):
+        """
+        Show the Play screen with a loading bar until the assets are ready.
+
+        Clicking Play before then waits for the loader and starts the game.
+        """
+        play_clicked = False
+        while self.running and not self.loader.ready() and not play_clicked:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self._quit()
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    play_clicked = self.play_button.check_clicked(event.pos)
+                    if play_clicked and self.recorder:
+                        self.recorder.record(self.tick, event)
+            self._draw_startup_screen()
+            self.clock.tick(self.settings.FPS)
+
+        self.finish_loading()
+        if play_clicked:
+            self.restart_game()
+
+    def _draw_startup_screen(self):
+        """
+        Draw the background, the Play button and a bar showing loading progress.
+        Until the background is decoded the screen is cleared to black.
+        """
+        if 'background' in self.loader.results:
+            self._prepare_background()
+        if self.bg is None:
+            self.screen.fill((0, 0, 0))
+        else:
+            self.screen.blit(self.bg, (0, 0))
+        self.play_button.draw()
+        bar = self.play_button.rect.copy()
+        bar.top = bar.bottom + self.settings.HUD_font_size // 2
+        bar.height = self.settings.HUD_font_size // 4
+        bar.width = round(bar.width * self.loader.progress)
+        self.screen.fill(self.settings.text_color, bar)
+        pygame.display.flip()
+        self._record_startup('first_frame')
+
+    def _update_profile_overlay(self):
+        """
+        Refresh the HUD's frame-time overlay every `profile_overlay_interval` frames.
+        """
+        settings = self.settings
+        if not settings.profile_overlay:
+            return
+        if self.profiler.frame_count % settings.profile_overlay_interval == 0:
+            self.HUD.update_profile(self.profiler.percentile(50),
+                self.profiler.percentile(99)
+            )
+
+    def step(self):
+        """
+        Advance the game by one fixed simulation step: handle input and update
+        the simulation.
+        """
+        profiler = self.profiler
+        if profiler:
+            start = profiler.start()
+        self._check_events()
+        if profiler:
+            start = profiler.stop('_check_events', start)
+        if self.game_active:
+            if self.state == 'respawn':
+                self._update_respawn()
+            elif profiler:
                 self.ship.update()
+                start = profiler.stop('ship.update', start)
                 self.alien_fleet.update_fleet()
+                start = profiler.stop('alien_fleet.update_fleet', start)
                 self._check_collisions()
-            self._update_screen()
-            self.clock.tick(self.settings.FPS)
+                start = profiler.stop('_check_collisions', start)
+            else:
+                self.ship.update()
+                self.alien_fleet.update_fleet()
+                self._check_collisions()
+            self.assets.warm_pending()
+        self.tick += 1
+
+    def _update_respawn(self):
+        """
+        Count down the respawn pause and resume play when it runs out.
+        """
+        self.respawn_ticks -= 1
+        if self.respawn_ticks <= 0:
+            self.state = 'playing'
+
+    def simulate(self, ticks: int) -> int:
+        """
+        Run the simulation as fast as possible, without drawing.
+
+        Args:
+            ticks (int): Maximum number of ticks to run.
+
+        Returns:
+            int: Number of ticks run before the limit or a scripted quit.
+        """
+        start = self.tick
+        while self.running and self.tick - start < ticks:
+            self.step()
+        return self.tick - start
 
     def _check_collisions(self):
         """
@@ -81,7 +380,7 @@ class AlienInvasion:
         - Projectiles hitting aliens
         - Check for level completion
         """
-        if self.ship.check_collisions(self.alien_fleet.fleet):
+        if self.ship.check_collisions(self.alien_fleet):
             self._check_game_status()
 
         if self.alien_fleet.check_fleet_bottom():
@@ -89,27 +388,37 @@ class AlienInvasion:
 
         collisions = self.alien_fleet.check_collisions(self.ship.arsenal.arsenal)
         if collisions:
-            self.impact_sound.play()
-            self.impact_sound.fadeout(500)
+            if self.audio:
+                self.audio.play('impact')
             self.game_stats.update(collisions)
-            self.HUD.update_scores()
 
         if self.alien_fleet.check_destroyed_status():
             self._reset_level()
             self.settings.increase_difficulty()
             self.game_stats.update_level()
-            self.HUD.update_level()
+            self._prewarm_next_level()
 
     def _check_game_status(self):
         """
         Manage lives and game over logic. Restart or end the game if conditions are met.
+
+        Losing a life resets the level and enters the respawn state, which holds
+        the simulation without blocking the game loop.
         """
         if self.game_stats.ships_left > 0:
             self.game_stats.ships_left -= 1
             self._reset_level()
-            sleep(0.5)
+            self._start_respawn()
         else:
             self.game_active = False
+            self.game_stats.end_session()
+
+    def _start_respawn(self):
+        """
+        Enter the respawn state for `respawn_pause` seconds of simulation steps.
+        """
+        self.respawn_ticks = round(self.settings.respawn_pause * self.settings.sim_rate)
+        self.state = 'respawn' if self.respawn_ticks > 0 else 'playing'
 
     def _reset_level(self):
         """
@@ -125,49 +434,109 @@ class AlienInvasion:
         """
         self.settings.initialize__dynamic_settings()
         self.game_stats.reset_stats()
-        self.HUD.update_scores()
         self._reset_level()
         self.ship._center_ship()
+        self._prewarm_next_level()
+        self.state = 'playing'
+        self.respawn_ticks = 0
         self.game_active = True
-        pygame.mouse.set_visible(False)
+        if not self.headless:
+            pygame.mouse.set_visible(False)
+
+    def snapshot(self) -> bytes:
+        """
+        Capture the simulation state.
+
+        Returns:
+            bytes: A compact snapshot for `restore`.
+        """
+        return take_snapshot(self)
+
+    def restore(self, snapshot: bytes):
+        """
+        Return the simulation to a captured state.
+
+        Args:
+            snapshot (bytes): A snapshot from `snapshot`.
+        """
+        restore_snapshot(self, snapshot)
+
+    def _prewarm_next_level(self):
+        """
+        Queue the alien and bullet art at the sizes the next level will use,
+        so they are scaled during play instead of on the level transition.
+        """
+        upcoming = copy(self.settings)
+        upcoming.increase_difficulty()
+        self.assets.prewarm(self.settings.alien_file,
+            (upcoming.alien_w, upcoming.alien_h), self.assets.alpha_mode
+        )
+        self.assets.prewarm(self.settings.bullet_file,
+            (upcoming.bullet_w, upcoming.bullet_h), self.assets.alpha_mode
+        )
 
-    def _update_screen(self):
+    def _update_screen(self, alpha: float = 1.0):
         """
         Redraw the screen and all elements. Show the play button when inactive.
+
+        Args:
+            alpha (float): How far between the previous and current simulation
+                step to draw moving sprites, from 0 to 1.
         """
-        self.screen.blit(self.bg, (0, 0))
-        self.ship.draw()
-        self.alien_fleet.draw()
-        self.HUD.draw()
+        self.renderer.render(alpha)
+        self._record_startup('first_frame')
 
         if not self.game_active:
-            self.play_button.draw()
             pygame.mouse.set_visible(True)
 
-        pygame.display.flip()
-
     def _check_events(self):
         """
         Handle Pygame events: keyboard, mouse, and quit events.
         """
-        for event in pygame.event.get():
+        if self.input_source is not None:
+            events = self.input_source.get_events(self.tick)
+        else:
+            events = pygame.event.get()
+
+        for event in events:
             if event.type == pygame.QUIT:
-                self.running = False
-                self.game_stats.save_scores()
-                pygame.quit()
-                sys.exit()
+                self._quit()
             elif event.type == pygame.KEYDOWN and self.game_active:
                 self._check_keydown_events(event)
             elif event.type == pygame.KEYUP:
                 self._check_keyup_events(event)
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._check_button_clicked()
+                self._check_button_clicked(event.pos)
+
+    def _quit(self):
+        """
+        Stop the game loop. Outside headless mode, also write the frame trace
+        when profiling, the input log when recording, save the high score, shut
+        down Pygame and exit.
+        """
+        self.running = False
+        if self.headless:
+            return
+        if self.profiler:
+            self.profiler.export_chrome_trace(self.settings.profile_trace_file)
+        if self.recorder:
+            self.recorder.save(self.settings.input_log_file, self.tick)
+        if self.audio:
+            self.audio.close()
+        self.game_stats.save_scores()
+        pygame.quit()
+        sys.exit()
 
-    def _check_button_clicked(self):
+    def _check_button_clicked(self, mouse_pos):
         """
         Check if the play button was clicked to start or restart the game.
+
+        Args:
+            mouse_pos (Tuple[int, int]): The position of the click.
         """
-        mouse_pos = pygame.mouse.get_pos()
+        if self.recorder:
+            self.recorder.record(self.tick, pygame.event.Event(
+                pygame.MOUSEBUTTONDOWN, pos=mouse_pos, button=1))
         if self.play_button.check_clicked(mouse_pos):
             self.restart_game()
 
@@ -178,19 +547,17 @@ class AlienInvasion:
         Args:
             event (pygame.event.Event): The keydown event object.
         """
+        if self.recorder:
+            self.recorder.record(self.tick, event)
         if event.key == pygame.K_RIGHT:
             self.ship.moving_right = True
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left = True
-        elif event.key == pygame.K_SPACE:
-            if self.ship.fire():
-                self.laser_sound.play()
-                self.laser_sound.fadeout(250)
+        elif event.key == pygame.K_SPACE and self.state == 'playing':
+            if self.ship.fire() and self.audio:
+                self.audio.play('laser')
         elif event.key == pygame.K_q:
-            self.running = False
-            self.game_stats.save_scores()
-            pygame.quit()
-            sys.exit()
+            self._quit()
 
     def _check_keyup_events(self, event):
         """
@@ -199,11 +566,13 @@ class AlienInvasion:
         Args:
             event (pygame.event.Event): The keyup event object.
         """
+        if self.recorder:
+            self.recorder.record(self.tick, event)
         if event.key == pygame.K_RIGHT:
             self.ship.moving_right = False
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left = False
 
 if __name__ == '__main__':
-    ai = AlienInvasion()
+    ai = AlienInvasion(staged=True)
     ai.run_game()
@@ -2,8 +2,10 @@
 arsenal.py
 
 This module defines the Arsenal class, which manages a group of bullets fired
-by the player. It handles bullet creation, updating, rendering, and cleanup
-when bullets go off-screen.
+by the player. It handles bullet firing, updating, rendering, and cleanup
+when bullets go off-screen, recycling a fixed pool of preallocated bullets.
+The active bullets live in a BulletGroup, so firing and recycling them
+allocates nothing.
 """
 
 import pygame
@@ -13,6 +15,58 @@ from bullet import Bullet
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
+class BulletGroup(pygame.sprite.Group):
+    """
+    A sprite group with a fixed capacity whose membership changes allocate nothing.
+
+    A plain Group keeps its sprites in a dict, which rebuilds its table every few
+    additions when sprites keep being added and removed. This group keeps them
+    in a preallocated list of slots instead, in the order they were added, so
+    it behaves like a Group everywhere the game uses one. `Group.draw` is not
+    supported; bullets are drawn through `Arsenal.get_blits`.
+
+    Attributes:
+        slots (list): The sprites in the order they were added, then None.
+        count (int): Number of sprites in the group.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty group.
+
+        Args:
+            capacity (int): Maximum number of sprites held at once.
+        """
+        super().__init__()
+        self.slots = [None] * capacity
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def sprites(self) -> list:
+        """
+        Get the sprites in the group.
+
+        Returns:
+            list: The sprites, in the order they were added.
+        """
+        return self.slots[:self.count]
+
+    def add_internal(self, sprite, layer=None):
+        self.slots[self.count] = sprite
+        self.count += 1
+
+    def remove_internal(self, sprite):
+        index = self.slots.index(sprite)
+        self.count -= 1
+        self.slots[index:self.count] = self.slots[index + 1:self.count + 1]
+        self.slots[self.count] = None
+
+    def has_internal(self, sprite) -> bool:
+        return sprite in self.slots
+
+
 class Arsenal:
     """
     A class to manage the player's arsenal of bullets.
@@ -20,7 +74,9 @@ class Arsenal:
     Attributes:
         game (AlienInvasion): Reference to the main game instance.
         settings (object): Game settings object.
-        arsenal (pygame.sprite.Group): Group of active bullet sprites.
+        arsenal (BulletGroup): Group of active bullet sprites.
+        pool (list): Every preallocated bullet, active or not. A bullet is free
+            when it is not in `arsenal`.
     """
 
     def __init__(self, game: 'AlienInvasion'):
@@ -32,7 +88,8 @@ class Arsenal:
         """
         self.game = game
         self.settings = game.settings
-        self.arsenal = pygame.sprite.Group()
+        self.arsenal = BulletGroup(self.settings.bullet_amount)
+        self.pool = [Bullet(game) for _ in range(self.settings.bullet_amount)]
 
     def update_arsenal(self):
         """
@@ -43,28 +100,72 @@ class Arsenal:
 
     def _remove_bullets_offscreen(self):
         """
-        Remove bullets that have moved off the top of the screen.
+        Remove bullets that have moved off the top of the screen, returning
+        them to the pool.
         """
-        for bullet in self.arsenal.copy():
-            if bullet.rect.bottom <= 0:
+        for bullet in self.pool:
+            if bullet.rect.bottom <= 0 and bullet.alive():
                 self.arsenal.remove(bullet)
 
+    def get_blits(self, alpha: float = 1.0) -> list:
+        """
+        Build the blit sequence for every bullet in the arsenal.
+
+        Args:
+            alpha (float): How far between the previous and current simulation
+                step to draw the bullets, from 0 to 1.
+
+        Returns:
+            list: (image, rect, area, special_flags) tuples for `Surface.blits`.
+        """
+        return [(bullet.image, bullet.get_dest(alpha), None, bullet.blend_flags)
+                for bullet in self.arsenal]
+
     def draw(self):
         """
-        Draw all bullets in the arsenal on the screen.
+        Draw all bullets in the arsenal on the screen in a single batched call.
+        """
+        self.game.screen.blits(self.get_blits(), False)
+
+    def get_state(self) -> list:
+        """
+        Get the active bullets for a snapshot, in group order.
+
+        Returns:
+            list: (pool index, y, prev_y, x, rect y, width, height) per bullet.
+        """
+        return [(self.pool.index(bullet), bullet.y, bullet.prev_y, *bullet.rect)
+                for bullet in self.arsenal]
+
+    def set_state(self, state: list):
+        """
+        Restore the active bullets from a snapshot. Settings must already be
+        restored, since a bullet's image follows the current bullet size.
+
+        Args:
+            state (list): Values from `get_state`.
         """
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
+        self.arsenal.empty()
+        for index, y, prev_y, x, rect_y, w, h in state:
+            bullet = self.pool[index]
+            if bullet.rect.size != (w, h):
+                bullet._load_image()
+            bullet.rect.update(x, rect_y, w, h)
+            bullet.y = y
+            bullet.prev_y = prev_y
+            self.arsenal.add(bullet)
 
     def fire_bullet(self) -> bool:
         """
-        Fire a new bullet if the maximum number hasn't been reached.
+        Fire a free bullet from the pool if the maximum number hasn't been reached.
 
         Returns:
             bool: True if a bullet was fired, False otherwise.
         """
         if len(self.arsenal) < self.settings.bullet_amount:
-            new_bullet = Bullet(self.game)
-            self.arsenal.add(new_bullet)
-            return True
+            for bullet in self.pool:
+                if not bullet.alive():
+                    bullet.launch()
+                    self.arsenal.add(bullet)
+                    return True
         return False
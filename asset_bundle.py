@@ -0,0 +1,327 @@
+"""
+asset_bundle.py
+
+This module builds and reads the asset bundle: a single file holding the game's
+images already scaled to their Settings sizes and converted to raw 32-bit BGRA
+pixels, and its sounds decoded to raw PCM. The reader memory-maps the file and
+creates surfaces directly over the mapped pages, so nothing is decoded or
+copied at startup and every running game shares one copy of the pixels through
+the OS page cache.
+
+Build the bundle from the project root after changing art, sounds or sizes:
+
+    python asset_bundle.py
+"""
+
+import json
+import mmap
+import os
+import struct
+from copy import copy
+from pathlib import Path
+import pygame
+
+MAGIC = b'AIBUNDL1'
+HEADER = struct.Struct('<8sI')
+ALIGN = 64
+
+
+class AssetBundle:
+    """
+    A read-only, memory-mapped view of a built asset bundle.
+
+    Image entries are keyed like AssetCache keys, with paths relative to the
+    working directory. Entries whose source file has changed since the bundle
+    was built are ignored, so stale art falls back to decoding; a missing
+    source file is fine and the bundled copy is used.
+
+    Surfaces returned by the bundle point into the read-only mapping, so they
+    must never be drawn on; AssetCache already treats its surfaces that way.
+
+    Attributes:
+        path (Path): The bundle file.
+        file (BinaryIO): The open bundle file.
+        data (mmap.mmap): Read-only mapping of the whole file.
+        images (dict): Image entries keyed by (relative path, size, mode).
+        sounds (dict): Sound entries keyed by relative path.
+        sources (set): Relative paths of the images with at least one entry.
+        data_start (int): File offset of the data section; entry offsets are
+            relative to it.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and map a bundle file and read its index.
+
+        Args:
+            path (Path): The bundle file.
+
+        Raises:
+            ValueError: If the file is not an asset bundle.
+        """
+        self.path = Path(path)
+        self.file = open(self.path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_size = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f'Not an asset bundle: {self.path}')
+        index = json.loads(self.data[HEADER.size:HEADER.size + index_size])
+        self.data_start = _padded(HEADER.size + index_size)
+
+        self.images = {}
+        for entry in index['images']:
+            if self._is_current(entry):
+                key = (entry['path'], tuple(entry['size']), entry['mode'])
+                self.images[key] = entry
+        self.sounds = {entry['path']: entry for entry in index['sounds']
+                       if self._is_current(entry)}
+        self.sources = {path for path, _, _ in self.images}
+
+    @staticmethod
+    def _relative(path) -> str:
+        """
+        Express a path relative to the working directory, as stored in the index.
+
+        Args:
+            path (Path | str): An asset file path.
+
+        Returns:
+            str: The relative POSIX-style path, or the path unchanged if it is
+                outside the working directory.
+        """
+        path = Path(path)
+        try:
+            return path.relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    @staticmethod
+    def _is_current(entry: dict) -> bool:
+        """
+        Check that an entry's source file has not changed since the build.
+
+        Args:
+            entry (dict): An index entry.
+
+        Returns:
+            bool: False if the source exists with a different size or mtime.
+        """
+        try:
+            stat = os.stat(entry['path'])
+        except OSError:
+            return True
+        return stat.st_size == entry['source_size'] and stat.st_mtime_ns == entry['source_mtime']
+
+    def has_source(self, path) -> bool:
+        """
+        Check whether the bundle holds any prepared image for a file.
+
+        Args:
+            path (Path | str): File path to the image.
+
+        Returns:
+            bool: True if at least one size of the image is bundled.
+        """
+        return self._relative(path) in self.sources
+
+    def get_image(self, path, size, mode):
+        """
+        Create a surface over the bundled pixels for an AssetCache key.
+
+        The surface shares the mapped memory. It is converted with a copy only
+        when the display uses a pixel layout other than 32-bit BGRA.
+
+        Args:
+            path (Path | str): File path to the image.
+            size (Tuple[int, int] | None): The prepared size.
+            mode (str | None): The conversion mode.
+
+        Returns:
+            pygame.Surface | None: The surface, or None if it is not bundled.
+        """
+        key = (self._relative(path), tuple(size) if size is not None else None, mode)
+        entry = self.images.get(key)
+        if entry is None:
+            return None
+
+        start = self.data_start + entry['offset']
+        pixels = memoryview(self.data)[start:start + entry['length']]
+        surface = pygame.image.frombuffer(pixels, tuple(entry['pixel_size']), 'BGRA')
+        display = pygame.display.get_surface()
+        if display is not None and display.get_masks()[:3] != surface.get_masks()[:3]:
+            return surface.convert() if mode == 'opaque' else surface.convert_alpha()
+        if mode == 'opaque':
+            surface.set_alpha(None)
+        return surface
+
+    def get_sound(self, path):
+        """
+        Create a sound from bundled PCM samples.
+
+        The samples are passed to the mixer as a view of the mapping, which is
+        released once the mixer has copied them, so no intermediate bytes
+        object is made and the bundle can still be closed.
+
+        Args:
+            path (Path | str): File path to the sound.
+
+        Returns:
+            pygame.mixer.Sound | None: The sound, or None if it is not bundled
+                or was decoded for a different mixer format.
+        """
+        entry = self.sounds.get(self._relative(path))
+        if entry is None or list(pygame.mixer.get_init() or ()) != entry['mixer']:
+            return None
+        start = self.data_start + entry['offset']
+        with memoryview(self.data)[start:start + entry['length']] as samples:
+            return pygame.mixer.Sound(buffer=samples)
+
+    def close(self):
+        """
+        Unmap and close the bundle file.
+
+        Surfaces from `get_image` keep views of the mapping. While any are
+        alive the mapping stays open, and it is unmapped once they are freed.
+        """
+        if not self.data.closed:
+            try:
+                self.data.close()
+            except BufferError:
+                pass
+        self.file.close()
+
+
+def get_bundle_keys(settings) -> list:
+    """
+    List every image key the game will request, for the first
+    `asset_bundle_levels` levels.
+
+    Args:
+        settings (Settings): The game settings.
+
+    Returns:
+        list: Unique (path, size, mode) AssetCache keys.
+    """
+    alpha_mode = 'premultiplied' if settings.premultiply_alpha else 'alpha'
+    keys = [
+        (settings.bg_file, (settings.screen_w, settings.screen_h), 'opaque'),
+        (settings.ship_file, (settings.ship_w, settings.ship_h), alpha_mode),
+        (settings.ship_file, (settings.ship_w, settings.ship_h), 'alpha'),
+    ]
+    level = copy(settings)
+    level.initialize__dynamic_settings()
+    for _ in range(settings.asset_bundle_levels):
+        if min(level.alien_w, level.alien_h, level.bullet_w, level.bullet_h) < 1:
+            break
+        keys.append((settings.alien_file, (level.alien_w, level.alien_h), alpha_mode))
+        keys.append((settings.bullet_file, (level.bullet_w, level.bullet_h), alpha_mode))
+        level.increase_difficulty()
+
+    unique = {}
+    for path, size, mode in keys:
+        size = (int(size[0]), int(size[1]))
+        unique[(AssetBundle._relative(path), size, mode)] = (path, size, mode)
+    return list(unique.values())
+
+
+def build_bundle(settings, path: Path = None) -> dict:
+    """
+    Prepare every bundled image and sound and write them to one file.
+
+    Images are prepared by an AssetCache exactly as the game prepares them,
+    which needs a display mode for conversion; call this after `set_mode`
+    (the dummy video driver is enough) and `pygame.mixer.init`.
+
+    Args:
+        settings (Settings): The game settings to prepare assets for.
+        path (Path | None): Output file, defaulting to `asset_bundle_file`.
+
+    Returns:
+        dict: The number of images and sounds written and the file size.
+    """
+    from asset_cache import AssetCache
+
+    path = Path(path or settings.asset_bundle_file)
+    assets = AssetCache(premultiply=settings.premultiply_alpha)
+    blobs = []
+    images = []
+    for source, size, mode in get_bundle_keys(settings):
+        surface = assets.get_image(source, size, mode)
+        images.append(_describe(source, {
+            'size': list(size),
+            'mode': mode,
+            'pixel_size': list(surface.get_size()),
+        }))
+        blobs.append(pygame.image.tobytes(surface, 'BGRA'))
+
+    sounds = []
+    mixer = list(pygame.mixer.get_init())
+    for source in (settings.laser_sound, settings.impact_sound):
+        sounds.append(_describe(source, {'mixer': mixer}))
+        blobs.append(pygame.mixer.Sound(source).get_raw())
+
+    entries = images + sounds
+    offset = 0
+    for entry, blob in zip(entries, blobs):
+        entry['offset'] = offset
+        entry['length'] = len(blob)
+        offset += _padded(len(blob))
+
+    index = json.dumps({'images': images, 'sounds': sounds}).encode()
+    data_start = _padded(HEADER.size + len(index))
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, len(index)))
+        file.write(index)
+        file.write(b'\0' * (data_start - HEADER.size - len(index)))
+        for blob in blobs:
+            file.write(blob)
+            file.write(b'\0' * (_padded(len(blob)) - len(blob)))
+    return {'images': len(images), 'sounds': len(sounds), 'bytes': path.stat().st_size}
+
+
+def _describe(source, entry: dict) -> dict:
+    """
+    Add a source file's relative path, size and mtime to an index entry.
+
+    Args:
+        source (Path | str): The asset's source file.
+        entry (dict): The entry to complete.
+
+    Returns:
+        dict: The entry.
+    """
+    stat = os.stat(source)
+    entry['path'] = AssetBundle._relative(source)
+    entry['source_size'] = stat.st_size
+    entry['source_mtime'] = stat.st_mtime_ns
+    return entry
+
+
+def _padded(size: int) -> int:
+    """
+    Round a size up to the bundle's alignment.
+
+    Args:
+        size (int): Size in bytes.
+
+    Returns:
+        int: The aligned size.
+    """
+    return -(-size // ALIGN) * ALIGN
+
+
+if __name__ == '__main__':
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from settings import Settings
+
+    settings = Settings()
+    settings.initialize__dynamic_settings()
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.mixer.init()
+    result = build_bundle(settings)
+    print(f"Wrote {result['images']} images and {result['sounds']} sounds "
+          f"({result['bytes']:,} bytes) to {settings.asset_bundle_file}")
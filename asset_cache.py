@@ -0,0 +1,275 @@
+"""
+asset_cache.py
+
+This module defines the AssetCache class, a central registry for image assets.
+Each image file is decoded from disk once, and every scaled variant is converted
+to the display pixel format and stored so that sprites can share the same
+Surface instead of reloading it per instance. Variants found in a prebuilt
+AssetBundle are taken from it without decoding at all.
+"""
+
+import threading
+import pygame
+from collections import OrderedDict, deque
+
+
+class AssetCache:
+    """
+    A registry of shared image surfaces keyed by (path, size, mode).
+
+    Surfaces returned by the cache are shared between every sprite that asks
+    for the same key, so callers must treat them as read-only. Sizes are
+    quantized to whole pixels, and prepared surfaces are kept in LRU order so
+    the cache stays bounded as difficulty keeps shrinking the aliens.
+
+    Conversion modes:
+        None: Keep the decoded pixel format.
+        'opaque': Convert to the display format without per-pixel alpha.
+        'alpha': Convert to the display format with per-pixel alpha.
+        'premultiplied': Like 'alpha', with colors pre-multiplied by alpha.
+            Draw these with `blend_flags`.
+
+    Attributes:
+        capacity (int): Maximum number of prepared surfaces kept at once.
+        premultiply (bool): Whether sprite art uses pre-multiplied alpha.
+        sources (dict): Decoded source images keyed by file path.
+        surfaces (OrderedDict): Prepared surfaces keyed by (path, size, mode),
+            least recently used first.
+        pending (deque): Keys queued by `prewarm` that have not been built yet.
+        hits (int): Number of requests served from the cache.
+        misses (int): Number of requests that had to build a new surface.
+        loads (int): Number of image files decoded from disk.
+        evictions (int): Number of surfaces dropped to respect the capacity.
+        bundle (AssetBundle | None): Prebuilt surfaces checked before decoding.
+        bundled (int): Number of misses served from the bundle.
+        lock (threading.Lock): Guards `sources` and `loads`, which a loader
+            thread fills through `preload` while the game uses the cache.
+    """
+
+    def __init__(self, capacity: int = 32, premultiply: bool = False, bundle=None):
+        """
+        Initialize an empty asset cache.
+
+        Args:
+            capacity (int): Maximum number of prepared surfaces to keep.
+            premultiply (bool): Prepare sprite art with pre-multiplied alpha.
+            bundle (AssetBundle | None): Prebuilt surfaces to use when available.
+        """
+        self.capacity = capacity
+        self.premultiply = premultiply
+        self.bundle = bundle
+        self.bundled = 0
+        self.sources = {}
+        self.surfaces = OrderedDict()
+        self.pending = deque()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @property
+    def alpha_mode(self) -> str:
+        """
+        str: The conversion mode sprites with transparency should request.
+        """
+        return 'premultiplied' if self.premultiply else 'alpha'
+
+    @property
+    def blend_flags(self) -> int:
+        """
+        int: The `special_flags` to blit surfaces prepared with `alpha_mode`.
+        """
+        return pygame.BLEND_PREMULTIPLIED if self.premultiply else 0
+
+    @staticmethod
+    def _make_key(path, size, mode) -> tuple:
+        """
+        Build a cache key, quantizing the size to whole pixels.
+
+        `pygame.transform.scale` truncates float sizes, so truncating here keeps
+        every float size that produces the same image on the same key.
+
+        Args:
+            path (Path | str): File path to the image.
+            size (Tuple[float, float] | None): Requested (width, height).
+            mode (str | None): Conversion mode.
+
+        Returns:
+            tuple: The (path, size, mode) key.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        return (str(path), size, mode)
+
+    def get_image(self, path, size=None, mode=None) -> pygame.Surface:
+        """
+        Return the shared surface for an image file at the requested size.
+
+        Args:
+            path (Path | str): File path to the image.
+            size (Tuple[float, float] | None): Target (width, height), or None to
+                keep the original size.
+            mode (str | None): Conversion mode the surface was prepared with.
+
+        Returns:
+            pygame.Surface: The cached surface for this key.
+        """
+        key = self._make_key(path, size, mode)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        return self._build(key)
+
+    def prewarm(self, path, size=None, mode=None):
+        """
+        Queue a surface to be built ahead of time by `warm_pending`.
+
+        Args:
+            path (Path | str): File path to the image.
+            size (Tuple[float, float] | None): Target (width, height).
+            mode (str | None): Conversion mode.
+        """
+        key = self._make_key(path, size, mode)
+        if key not in self.surfaces and key not in self.pending:
+            self.pending.append(key)
+
+    def preload(self, path):
+        """
+        Decode an image file without preparing any surface from it. Files the
+        bundle holds are skipped, since their surfaces need no decoding.
+
+        This only touches `sources` and `loads`, which are guarded by `lock`,
+        so it can run on a loader thread while the game keeps using the cache,
+        e.g. to draw the Play screen.
+
+        Args:
+            path (Path | str): File path to the image.
+        """
+        if self.bundle is not None and self.bundle.has_source(path):
+            return
+        self._load_source(str(path))
+
+    def warm_pending(self, limit: int = 1):
+        """
+        Build up to `limit` queued surfaces so the work is spread over frames.
+
+        Args:
+            limit (int): Maximum number of surfaces to build in this call.
+        """
+        while self.pending and limit > 0:
+            key = self.pending.popleft()
+            if key not in self.surfaces:
+                self._build(key)
+            limit -= 1
+
+    def _build(self, key: tuple) -> pygame.Surface:
+        """
+        Create the surface for a key, store it and evict old entries.
+
+        Args:
+            key (tuple): The (path, size, mode) key.
+
+        Returns:
+            pygame.Surface: The newly prepared surface.
+        """
+        path, size, mode = key
+        surface = None
+        if self.bundle is not None:
+            surface = self.bundle.get_image(path, size, mode)
+        if surface is None:
+            surface = self._load_source(path)
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            surface = self._convert(surface, mode)
+        else:
+            self.bundled += 1
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    @staticmethod
+    def _convert(surface: pygame.Surface, mode) -> pygame.Surface:
+        """
+        Convert a surface to the display pixel format for fast blitting.
+
+        Conversion needs a display mode, so before `set_mode` is called the
+        surface is returned unchanged.
+
+        Args:
+            surface (pygame.Surface): The scaled surface.
+            mode (str | None): Conversion mode.
+
+        Returns:
+            pygame.Surface: The converted surface.
+        """
+        if mode is None or pygame.display.get_surface() is None:
+            return surface
+        if mode == 'opaque':
+            return surface.convert()
+        surface = surface.convert_alpha()
+        if mode == 'premultiplied':
+            surface = surface.premul_alpha()
+        return surface
+
+    def _load_source(self, path: str) -> pygame.Surface:
+        """
+        Decode an image file once and remember the result.
+
+        Decoding happens outside the lock, so a thread waiting for one file is
+        not held up by another thread decoding a different file. If two
+        threads decode the same file at once, the first result is kept.
+
+        Args:
+            path (str): File path to the image.
+
+        Returns:
+            pygame.Surface: The decoded, unscaled image.
+        """
+        with self.lock:
+            source = self.sources.get(path)
+        if source is None:
+            decoded = pygame.image.load(path)
+            with self.lock:
+                source = self.sources.setdefault(path, decoded)
+                if source is decoded:
+                    self.loads += 1
+        return source
+
+    def stats(self) -> dict:
+        """
+        Report cache counters.
+
+        Returns:
+            dict: Hits, misses, decoded files, evictions, bundled surfaces
+                and cached surfaces.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'loads': self.loads,
+            'evictions': self.evictions,
+            'bundled': self.bundled,
+            'surfaces': len(self.surfaces),
+            'pending': len(self.pending),
+        }
+
+    def clear(self):
+        """
+        Drop every cached surface and reset the counters.
+        """
+        with self.lock:
+            self.sources.clear()
+            self.loads = 0
+        self.surfaces.clear()
+        self.pending.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bundled = 0
@@ -0,0 +1,107 @@
+"""
+asset_loader.py
+
+This module defines the AssetLoader class, which runs a list of named loading
+tasks (decoding images, sounds) on a background thread while the game keeps
+its window responsive, and reports how far along it is.
+"""
+
+import threading
+
+
+class AssetLoader:
+    """
+    Run named loading tasks in order, either on a background thread or inline.
+
+    Tasks must not touch state the main thread is using at the same time; the
+    game only draws its startup screen while the loader runs.
+
+    Attributes:
+        tasks (list): (name, callable) pairs to run.
+        results (dict): Each finished task's return value, keyed by name.
+        done (int): Number of finished tasks.
+        current (str | None): Name of the task being run.
+        error (BaseException | None): The exception that stopped loading, if any.
+        thread (threading.Thread | None): The background thread, once started.
+    """
+
+    def __init__(self, tasks):
+        """
+        Initialize the loader.
+
+        Args:
+            tasks (Iterable[Tuple[str, Callable[[], object]]]): The tasks to run.
+        """
+        self.tasks = list(tasks)
+        self.results = {}
+        self.done = 0
+        self.current = None
+        self.error = None
+        self.thread = None
+
+    @property
+    def progress(self) -> float:
+        """
+        float: Fraction of tasks finished, from 0 to 1.
+        """
+        if not self.tasks:
+            return 1.0
+        return self.done / len(self.tasks)
+
+    def ready(self) -> bool:
+        """
+        Check whether loading has finished or failed.
+
+        Returns:
+            bool: True once every task has run or one has raised.
+        """
+        return self.done == len(self.tasks) or self.error is not None
+
+    def start(self):
+        """
+        Run the tasks on a daemon thread.
+        """
+        self.thread = threading.Thread(target=self._run, name='asset-loader', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """
+        Run the tasks on the calling thread.
+        """
+        self._run()
+        self._raise_error()
+
+    def wait(self) -> dict:
+        """
+        Block until loading is finished.
+
+        Returns:
+            dict: Each task's result, keyed by name.
+        """
+        if self.thread is not None:
+            self.thread.join()
+        elif not self.ready():
+            self._run()
+        self._raise_error()
+        return self.results
+
+    def _run(self):
+        """
+        Run every task, stopping at the first one that raises.
+        """
+        try:
+            for name, task in self.tasks[self.done:]:
+                self.current = name
+                self.results[name] = task()
+                self.done += 1
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.current = None
+
+    def _raise_error(self):
+        """
+        Re-raise a task's exception on the calling thread.
+        """
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,117 @@
+"""
+audio.py
+
+This module defines the Audio class, which plays the game's sound effects.
+Each effect gets its own reserved pool of mixer channels, which also caps how
+many copies of it can sound at once, and plays are queued to a background
+thread so the game loop never waits on the mixer.
+"""
+
+import threading
+from collections import deque
+from queue import SimpleQueue
+import pygame
+
+
+class Audio:
+    """
+    Play sound effects on per-effect channel pools from a worker thread.
+
+    Sounds are given already decoded (from the asset bundle or the loader), so
+    playing one only hands PCM to the mixer. A play fades out on its own
+    channel, so rapid repeats no longer cut off every copy of the shared Sound.
+    When all of an effect's channels are busy, the one started longest ago is
+    reused.
+
+    Attributes:
+        settings (object): Game settings.
+        sounds (dict): Decoded sounds keyed by effect name.
+        channels (dict): Deques of reserved channels keyed by effect name, the
+            least recently started first.
+        fadeouts (dict): Fade-out length in milliseconds keyed by effect name.
+        queue (SimpleQueue): Effect names waiting to be played; None stops
+            the worker.
+        thread (threading.Thread): The worker that plays queued effects.
+        played (int): Number of effects played.
+        stolen (int): Number of plays that cut off an older copy of the effect.
+    """
+
+    def __init__(self, settings, sounds: dict):
+        """
+        Reserve the channel pools and start the worker thread.
+
+        Args:
+            settings (Settings): Game settings with the audio options.
+            sounds (dict): Decoded pygame.mixer.Sound objects keyed by effect name.
+        """
+        self.settings = settings
+        self.sounds = sounds
+        for sound in sounds.values():
+            sound.set_volume(settings.audio_volume)
+
+        reserved = sum(settings.audio_channels[name] for name in sounds)
+        if pygame.mixer.get_num_channels() < reserved:
+            pygame.mixer.set_num_channels(reserved)
+        pygame.mixer.set_reserved(reserved)
+        self.channels = {}
+        first = 0
+        for name in sounds:
+            count = settings.audio_channels[name]
+            self.channels[name] = deque(pygame.mixer.Channel(i)
+                                        for i in range(first, first + count))
+            first += count
+
+        self.fadeouts = settings.audio_fadeouts
+        self.played = 0
+        self.stolen = 0
+        self.queue = SimpleQueue()
+        self.thread = threading.Thread(target=self._run, name='audio', daemon=True)
+        self.thread.start()
+
+    def play(self, name: str):
+        """
+        Queue an effect to be played. Returns immediately.
+
+        Args:
+            name (str): The effect name, e.g. 'laser' or 'impact'.
+        """
+        self.queue.put(name)
+
+    def _run(self):
+        """
+        Play queued effects until told to stop.
+        """
+        while True:
+            name = self.queue.get()
+            if name is None:
+                return
+            self._play_now(name)
+
+    def _play_now(self, name: str):
+        """
+        Play an effect on a free channel from its pool, or on the one that was
+        started longest ago if they are all busy.
+
+        Args:
+            name (str): The effect name.
+        """
+        channels = self.channels[name]
+        channel = next((channel for channel in channels if not channel.get_busy()), None)
+        if channel is None:
+            channel = channels[0]
+            self.stolen += 1
+        channels.remove(channel)
+        channels.append(channel)
+
+        channel.play(self.sounds[name])
+        fadeout = self.fadeouts.get(name)
+        if fadeout:
+            channel.fadeout(fadeout)
+        self.played += 1
+
+    def close(self):
+        """
+        Stop the worker after it plays anything already queued.
+        """
+        self.queue.put(None)
+        self.thread.join(timeout=1.0)
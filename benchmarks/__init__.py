@@ -0,0 +1,11 @@
+"""
+benchmarks
+
+Headless performance benchmarks for Alien Invasion. Run them from the project
+root so the game modules and the Assets folder resolve, for example:
+
+    python -m benchmarks.blit_benchmark
+
+`benchmarks.suite` runs every scripted scenario and checks the results against
+a saved JSON baseline.
+"""
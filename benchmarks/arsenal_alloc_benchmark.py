@@ -0,0 +1,91 @@
+"""
+arsenal_alloc_benchmark.py
+
+This module fires the ship's arsenal at the maximum rate and uses tracemalloc
+to confirm that, once warmed up, firing and recycling bullets from the pool
+allocates no memory. It runs the game headless and exits with a nonzero status
+if any tick of the measured window keeps an allocation.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import sys
+import tracemalloc
+import pygame
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+
+def fire_at_max_rate(game: AlienInvasion, ticks: int) -> int:
+    """
+    Try to fire every tick while updating the arsenal.
+
+    Args:
+        game (AlienInvasion): The game whose ship is firing.
+        ticks (int): Number of ticks to simulate.
+
+    Returns:
+        int: Number of bullets fired.
+    """
+    ship = game.ship
+    fired = 0
+    for _ in range(ticks):
+        if ship.fire():
+            fired += 1
+        ship.arsenal.update_arsenal()
+    return fired
+
+
+def run(warmup: int = 500, ticks: int = 20_000) -> dict:
+    """
+    Count the ticks whose firing and recycling allocate memory.
+
+    Traces are cleared before every tick, so whatever is still traced after
+    it was allocated during that tick and outlived it. Temporaries that the
+    interpreter frees within the tick, such as loop iterators, are not counted.
+
+    Args:
+        warmup (int): Ticks to run before measuring.
+        ticks (int): Ticks to measure.
+
+    Returns:
+        dict: Bullets fired, the number of ticks that kept an allocation and
+            the bytes they kept.
+    """
+    game = AlienInvasion(headless=True, input_source=ScriptedInput(), settings=Settings())
+    fire_at_max_rate(game, warmup)
+    ship = game.ship
+    arsenal = ship.arsenal
+
+    fired = allocating_ticks = kept_bytes = 0
+    tracemalloc.start()
+    for _ in range(ticks):
+        tracemalloc.clear_traces()
+        shot = ship.fire()
+        arsenal.update_arsenal()
+        kept = tracemalloc.get_traced_memory()[0]
+        fired += shot
+        if kept:
+            allocating_ticks += 1
+            kept_bytes += kept
+    tracemalloc.stop()
+    pygame.quit()
+    return {
+        'fired': fired,
+        'ticks': ticks,
+        'allocating_ticks': allocating_ticks,
+        'kept_bytes': kept_bytes,
+    }
+
+
+if __name__ == '__main__':
+    result = run()
+    print(f"fired {result['fired']:,} bullets in {result['ticks']:,} ticks; "
+          f"{result['allocating_ticks']:,} ticks allocated "
+          f"({result['kept_bytes']:,} bytes kept)")
+    if result['allocating_ticks']:
+        print('FAIL: firing allocated memory')
+        sys.exit(1)
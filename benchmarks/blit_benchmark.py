@@ -0,0 +1,87 @@
+"""
+blit_benchmark.py
+
+This module measures blits per second for the game's art before and after
+display-format conversion, using the SDL dummy video driver so it runs headless.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import time
+import pygame
+from settings import Settings
+from asset_cache import AssetCache
+
+
+def measure_blits(screen: pygame.Surface, image: pygame.Surface,
+                  duration: float = 0.5, special_flags: int = 0) -> float:
+    """
+    Blit an image repeatedly for a fixed time and report the rate.
+
+    Args:
+        screen (pygame.Surface): The display surface to blit onto.
+        image (pygame.Surface): The surface being measured.
+        duration (float): Seconds to keep blitting.
+        special_flags (int): Blend flags passed to every blit.
+
+    Returns:
+        float: Blits per second.
+    """
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        screen.blit(image, (0, 0), special_flags=special_flags)
+        count += 1
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def run(duration: float = 0.5) -> dict:
+    """
+    Compare raw, converted and pre-multiplied surfaces for each asset.
+
+    Args:
+        duration (float): Seconds to measure each variant.
+
+    Returns:
+        dict: Blits per second keyed by asset name and variant.
+    """
+    pygame.init()
+    settings = Settings()
+    settings.initialize__dynamic_settings()
+    screen = pygame.display.set_mode((settings.screen_w, settings.screen_h))
+    assets = AssetCache()
+
+    sprites = {
+        'background': (settings.bg_file, (settings.screen_w, settings.screen_h), 'opaque'),
+        'ship': (settings.ship_file, (settings.ship_w, settings.ship_h), 'alpha'),
+        'alien': (settings.alien_file, (settings.alien_w, settings.alien_h), 'alpha'),
+        'bullet': (settings.bullet_file, (settings.bullet_w, settings.bullet_h), 'alpha'),
+    }
+
+    results = {}
+    for name, (path, size, mode) in sprites.items():
+        raw = assets.get_image(path, size)
+        converted = assets.get_image(path, size, mode)
+        results[name] = {
+            'raw': measure_blits(screen, raw, duration),
+            mode: measure_blits(screen, converted, duration),
+        }
+        if mode == 'alpha':
+            premultiplied = assets.get_image(path, size, 'premultiplied')
+            results[name]['premultiplied'] = measure_blits(
+                screen, premultiplied, duration, pygame.BLEND_PREMULTIPLIED
+            )
+
+    pygame.quit()
+    return results
+
+
+if __name__ == '__main__':
+    for name, variants in run().items():
+        raw = variants['raw']
+        line = ', '.join(f'{variant}: {rate:,.0f}/s ({rate / raw:.2f}x)'
+                         for variant, rate in variants.items())
+        print(f'{name:<11} {line}')
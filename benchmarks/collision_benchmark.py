@@ -0,0 +1,110 @@
+"""
+collision_benchmark.py
+
+This module compares the fleet's spatial-grid collision broadphase against the
+brute-force `pygame.sprite` scans it replaced, for fleets of roughly 100, 1,000
+and 10,000 aliens. It runs the game headless. tests/test_collision_grid.py
+checks that both find the same hits.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import time
+import pygame
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+# Widest triangle row -> aliens in the fleet (base 2n - 1 gives n * n aliens).
+FLEET_BASES = {100: 19, 1_000: 63, 10_000: 199}
+
+
+def build_game(base_width: int) -> AlienInvasion:
+    """
+    Create a game whose fleet is a triangle with the given widest row.
+
+    Args:
+        base_width (int): Aliens in the widest row of the formation.
+
+    Returns:
+        AlienInvasion: The game, with five bullets fired across the formation,
+            each overlapping aliens in its upper rows.
+    """
+    settings = Settings()
+    settings.fleet_base_width = base_width
+    settings.alien_w = settings.alien_h = min(40, settings.screen_w // base_width)
+    game = AlienInvasion(headless=True, input_source=ScriptedInput(), settings=settings)
+    game._reset_level()
+
+    fleet_rect = game.alien_fleet.fleet.sprites()[0].rect.unionall(
+        [alien.rect for alien in game.alien_fleet.fleet])
+    for i in range(settings.bullet_amount):
+        game.ship.rect.centerx = fleet_rect.left + fleet_rect.width * (i + 1) // 6
+        game.ship.fire()
+    for i, bullet in enumerate(game.ship.arsenal.arsenal):
+        bullet.rect.top = fleet_rect.top + i * bullet.rect.height // 2
+    game.ship._center_ship()
+    return game
+
+
+def time_ticks(check, ticks: int) -> float:
+    """
+    Time a collision check repeated for a number of ticks.
+
+    Args:
+        check (Callable[[], object]): The collision check to run.
+        ticks (int): Number of repetitions.
+
+    Returns:
+        float: Average microseconds per tick.
+    """
+    start = time.perf_counter()
+    for _ in range(ticks):
+        check()
+    return (time.perf_counter() - start) / ticks * 1_000_000
+
+
+def run(ticks: int = 200) -> dict:
+    """
+    Measure brute-force and grid collision checks for each fleet size.
+
+    Both checks are non-destructive: they find bullet and ship hits without
+    removing anything, so every tick does the same work.
+
+    Args:
+        ticks (int): Ticks to average over for each measurement.
+
+    Returns:
+        dict: Alien count mapped to microseconds per tick for each method.
+    """
+    results = {}
+    for base_width in FLEET_BASES.values():
+        game = build_game(base_width)
+        fleet = game.alien_fleet
+        ship = game.ship
+        bullets = ship.arsenal.arsenal
+
+        def brute_force():
+            pygame.sprite.groupcollide(fleet.fleet, bullets, False, False)
+            return pygame.sprite.spritecollideany(ship, fleet.fleet)
+
+        def grid():
+            for bullet in bullets:
+                fleet.collide_rect(bullet.rect)
+            return fleet.collide_rect(ship.rect)
+
+        results[len(fleet.fleet)] = {
+            'brute_force': time_ticks(brute_force, ticks),
+            'grid': time_ticks(grid, ticks),
+        }
+    pygame.quit()
+    return results
+
+
+if __name__ == '__main__':
+    for aliens, timings in run().items():
+        speedup = timings['brute_force'] / timings['grid']
+        print(f"{aliens:>6} aliens  brute force: {timings['brute_force']:9.1f} us/tick"
+              f"  grid: {timings['grid']:7.1f} us/tick  ({speedup:.1f}x)")
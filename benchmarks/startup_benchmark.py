@@ -0,0 +1,84 @@
+"""
+startup_benchmark.py
+
+This module measures cold-start time to the first frame, and to the assets
+being ready, for the blocking and the staged startup. Each run is a fresh
+Python process so nothing is already decoded or cached. It runs headless on
+the SDL dummy drivers.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import json
+import statistics
+import subprocess
+import sys
+
+# Runs in the child process: start the game, draw its first frame the way
+# run_game would, wait for the assets and print the recorded times.
+CHILD = """
+import json
+from alien_invasion import AlienInvasion
+game = AlienInvasion(staged={staged})
+if game.loaded:
+    game._update_screen()
+else:
+    game._draw_startup_screen()
+    game.finish_loading()
+print(json.dumps(game.startup_times))
+"""
+
+
+def cold_start(staged: bool) -> dict:
+    """
+    Start the game in a new process and collect its startup times.
+
+    Args:
+        staged (bool): Use the staged startup.
+
+    Returns:
+        dict: Milliseconds to 'first_frame' and to 'assets_ready'.
+
+    Raises:
+        RuntimeError: If the game fails to start, with the child's error.
+    """
+    child = subprocess.run(
+        [sys.executable, '-c', CHILD.format(staged=staged)],
+        capture_output=True, text=True, env=os.environ,
+    )
+    if child.returncode:
+        lines = child.stderr.strip().splitlines()
+        error = lines[-1] if lines else f'exit status {child.returncode}'
+        mode = 'staged' if staged else 'blocking'
+        raise RuntimeError(f'{mode} startup failed: {error}')
+    return json.loads(child.stdout.strip().splitlines()[-1])
+
+
+def run(runs: int = 5) -> dict:
+    """
+    Measure median cold-start times for both startup modes.
+
+    Args:
+        runs (int): Processes to start per mode.
+
+    Returns:
+        dict: 'blocking' and 'staged' mapped to median milliseconds for each stage.
+    """
+    results = {}
+    for label, staged in (('blocking', False), ('staged', True)):
+        samples = [cold_start(staged) for _ in range(runs)]
+        results[label] = {stage: statistics.median(sample[stage] for sample in samples)
+                          for stage in ('first_frame', 'assets_ready')}
+    return results
+
+
+if __name__ == '__main__':
+    try:
+        results = run()
+    except RuntimeError as error:
+        sys.exit(str(error))
+    for label, times in results.items():
+        print(f"{label:<9} first frame {times['first_frame']:7.1f} ms"
+              f"  assets ready {times['assets_ready']:7.1f} ms")
@@ -0,0 +1,351 @@
+"""
+suite.py
+
+This module runs the headless benchmark suite. Each scenario drives the real
+AlienInvasion game with scripted input and records ticks per second, per-phase
+p50/p99 times from the FrameProfiler and memory allocated by tracemalloc.
+Results can be saved as a JSON baseline, and later runs fail when they regress
+beyond a tolerance or a scenario raises an error. Recorded input logs can be
+run as extra scenarios, which replay a real session's workload exactly. For
+example:
+
+    python -m benchmarks.suite --save
+    python -m benchmarks.suite idle firing --tolerance 0.15
+    python -m benchmarks.suite --replay Assets/file/input.ailog
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+import pygame
+from alien_invasion import AlienInvasion
+from input_log import InputLog
+from scripted_input import ScriptedInput
+from settings import Settings
+
+BASELINE_FILE = Path(__file__).with_name('baselines.json')
+
+# Metric -> True if higher is better. Only these are checked for regressions.
+CHECKED_METRICS = {'ticks_per_second': True, 'peak_kib': False}
+
+
+class Scenario:
+    """
+    A repeatable scripted workload for the game.
+
+    Attributes:
+        name (str): Name used on the command line and in baselines.
+        description (str): One-line summary of the workload.
+        ticks (int): Simulation steps to measure.
+        render (bool): Whether to run with a display and draw every tick.
+        configure (Callable[[Settings], None] | None): Adjusts the settings
+            before the game is created.
+        script (Callable[[ScriptedInput, int], None] | None): Adds input
+            events for the measured ticks, after the Play click on tick 0.
+        per_tick (Callable[[AlienInvasion], None] | None): Extra work done
+            before each step.
+        click_play (bool): Whether to click Play on tick 0.
+        seed (int | None): Seed for the game's random number generator.
+    """
+
+    def __init__(self, name: str, description: str, ticks: int, render: bool = False,
+                 configure=None, script=None, per_tick=None, click_play: bool = True,
+                 seed: int = None):
+        """
+        Initialize the scenario.
+
+        Args:
+            name (str): Name used on the command line and in baselines.
+            description (str): One-line summary of the workload.
+            ticks (int): Simulation steps to measure.
+            render (bool): Run with a display and draw every tick.
+            configure (Callable[[Settings], None] | None): Settings hook.
+            script (Callable[[ScriptedInput, int], None] | None): Input hook.
+            per_tick (Callable[[AlienInvasion], None] | None): Per-step hook.
+            click_play (bool): Click Play on tick 0; off when the script does.
+            seed (int | None): Seed for the game's random number generator.
+        """
+        self.name = name
+        self.description = description
+        self.ticks = ticks
+        self.render = render
+        self.configure = configure
+        self.script = script
+        self.per_tick = per_tick
+        self.click_play = click_play
+        self.seed = seed
+
+    def build(self, profile: bool = False) -> AlienInvasion:
+        """
+        Create a game for this scenario, already past the Play button unless
+        the script clicks it.
+
+        Args:
+            profile (bool): Attach a FrameProfiler covering every tick.
+
+        Returns:
+            AlienInvasion: The game, one tick in.
+        """
+        settings = Settings()
+        settings.profile_frames = profile
+        settings.profile_capacity = self.ticks
+        if self.configure:
+            self.configure(settings)
+
+        source = ScriptedInput()
+        game = AlienInvasion(headless=not self.render, input_source=source,
+            settings=settings, seed=self.seed
+        )
+        if self.click_play:
+            source.click(0, game.play_button.rect.center)
+        if self.script:
+            self.script(source, self.ticks)
+        game.step()
+        return game
+
+    def run_ticks(self, game: AlienInvasion):
+        """
+        Run the measured ticks, timing each as one profiler frame if attached.
+
+        Args:
+            game (AlienInvasion): A game returned by `build`.
+        """
+        profiler = game.profiler
+        for _ in range(self.ticks):
+            if profiler:
+                profiler.begin_frame()
+                start = profiler.start()
+            if self.per_tick:
+                self.per_tick(game)
+                if profiler:
+                    profiler.stop('scenario', start)
+            game.step()
+            if self.render:
+                game._update_screen()
+            if profiler:
+                profiler.end_frame()
+
+    def measure(self) -> dict:
+        """
+        Measure speed with the profiler attached, then memory with tracemalloc
+        on a fresh game, since tracing allocations distorts timings.
+
+        Returns:
+            dict: Ticks per second, per-phase times, peak traced memory and net
+                bytes allocated per tick.
+        """
+        game = self.build(profile=True)
+        start = time.perf_counter()
+        self.run_ticks(game)
+        elapsed = time.perf_counter() - start
+        phases = game.profiler.summary()
+
+        game = self.build()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        self.run_ticks(game)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        pygame.quit()
+
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'filename')
+        return {
+            'ticks': self.ticks,
+            'ticks_per_second': self.ticks / elapsed,
+            'peak_kib': peak / 1024,
+            'net_bytes_per_tick': sum(stat.size_diff for stat in stats) / self.ticks,
+            'phases': phases,
+        }
+
+
+def _tap_fire(source: ScriptedInput, ticks: int):
+    """
+    Press and release space on alternate ticks, firing whenever a bullet is free.
+    """
+    for tick in range(1, ticks, 2):
+        source.tap(tick, pygame.K_SPACE)
+
+
+def _sweep(source: ScriptedInput, ticks: int):
+    """
+    Sweep the ship left and right across the screen while firing.
+    """
+    for start in range(1, ticks, 240):
+        source.hold(start, start + 120, pygame.K_RIGHT)
+        source.hold(start + 120, start + 240, pygame.K_LEFT)
+    _tap_fire(source, ticks)
+
+
+def _clear_fleet(game: AlienInvasion):
+    """
+    Destroy the whole fleet so the step runs a level transition, restarting
+    before the aliens shrink to nothing.
+
+    Alien size is a static setting that each level shrinks, so it is restored
+    by hand before restarting.
+    """
+    if game.game_stats.level >= 25:
+        defaults = Settings()
+        game.settings.alien_w = defaults.alien_w
+        game.settings.alien_h = defaults.alien_h
+        game.restart_game()
+    game.alien_fleet.fleet.empty()
+
+
+def _large_swarm(settings: Settings):
+    """
+    Use the NumPy backend with a triangle of 10,000 aliens, on a screen tall
+    enough that the formation starts clear of the bottom.
+    """
+    settings.screen_h *= 2
+    settings.fleet_backend = 'numpy'
+    settings.fleet_base_width = 199
+    settings.alien_w = settings.alien_h = settings.screen_w // 199
+
+
+def _score_every_tick(game: AlienInvasion):
+    """
+    Change the score every tick, so the HUD overlay is rebuilt every frame.
+    """
+    game.game_stats.score += game.settings.alien_points
+    game.game_stats.notify()
+
+
+def replay_scenario(path: Path) -> Scenario:
+    """
+    Make a scenario that replays a recorded input log.
+
+    Args:
+        path (Path): The input log.
+
+    Returns:
+        Scenario: A headless scenario named after the file, covering every
+            recorded tick.
+    """
+    log = InputLog.load(path)
+    return Scenario(f'replay:{path.stem}', f'Replay of {path.name}.', log.end_tick - 1,
+                    configure=log.configure, script=lambda source, ticks: log.schedule(source),
+                    click_play=False, seed=log.seed)
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario('idle', 'Full fleet advancing with no input.', 5_000),
+    Scenario('firing', 'Sweeping ship firing at the maximum rate.', 5_000,
+             script=_sweep),
+    Scenario('level_storm', 'Fleet destroyed every tick, forcing level transitions.', 500,
+             per_tick=_clear_fleet),
+    Scenario('swarm_10k', 'NumPy fleet of 10,000 aliens under fire.', 1_000,
+             configure=_large_swarm, script=_tap_fire),
+    Scenario('hud_every_frame', 'Rendered play with HUD text updated every frame.', 1_000,
+             render=True, script=_sweep, per_tick=_score_every_tick),
+)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Find the checked metrics that regressed against a baseline.
+
+    Args:
+        results (dict): Scenario name mapped to its measurements.
+        baseline (dict): Scenario name mapped to baseline measurements.
+        tolerance (float): Allowed relative change, e.g. 0.2 for 20%.
+
+    Returns:
+        list: (scenario, metric, baseline value, current value) tuples.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric, higher_is_better in CHECKED_METRICS.items():
+            expected = baseline[name][metric]
+            actual = result[metric]
+            if higher_is_better:
+                regressed = actual < expected * (1 - tolerance)
+            else:
+                regressed = actual > expected * (1 + tolerance)
+            if regressed:
+                regressions.append((name, metric, expected, actual))
+    return regressions
+
+
+def main(argv=None) -> int:
+    """
+    Run the selected scenarios, print a report and check or save the baseline.
+
+    Args:
+        argv (list | None): Command-line arguments, defaulting to sys.argv.
+
+    Returns:
+        int: 1 if any scenario failed or any checked metric regressed,
+            otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description='Run the Alien Invasion benchmark suite.')
+    parser.add_argument('scenarios', nargs='*',
+                        help=f"scenarios to run (default: all): {', '.join(SCENARIOS)}")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE,
+                        help='baseline JSON file to compare against or save to')
+    parser.add_argument('--save', action='store_true',
+                        help='save the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed relative regression (default: 0.2)')
+    parser.add_argument('--replay', type=Path, action='append', default=[],
+                        help='also run a recorded input log as a scenario (repeatable)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+
+    scenarios = [SCENARIOS[name] for name in args.scenarios]
+    if not scenarios and not args.replay:
+        scenarios = list(SCENARIOS.values())
+    scenarios += [replay_scenario(path) for path in args.replay]
+
+    results = {}
+    failures = []
+    for scenario in scenarios:
+        name = scenario.name
+        try:
+            result = scenario.measure()
+        except Exception as error:
+            pygame.quit()
+            failures.append(name)
+            print(f'{name:<16} FAILED: {type(error).__name__}: {error}')
+            continue
+        results[name] = result
+        frame = result['phases']['frame']
+        print(f"{name:<16} {result['ticks_per_second']:>10,.0f} ticks/s"
+              f"  p50 {frame['p50']:.3f} ms  p99 {frame['p99']:.3f} ms"
+              f"  peak {result['peak_kib']:,.0f} KiB"
+              f"  {result['net_bytes_per_tick']:,.1f} B/tick  - {scenario.description}")
+
+    if args.save:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text())
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=4))
+        print(f'Saved baseline to {args.baseline}')
+        return 1 if failures else 0
+
+    if not args.baseline.exists():
+        print(f'No baseline at {args.baseline}; run with --save to create one.')
+        return 1 if failures else 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for name, metric, expected, actual in regressions:
+        print(f'REGRESSION {name}: {metric} {actual:,.1f} vs baseline {expected:,.1f}')
+    return 1 if failures or regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
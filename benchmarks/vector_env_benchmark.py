@@ -0,0 +1,44 @@
+"""
+vector_env_benchmark.py
+
+This module measures VectorEnv throughput in game-steps per second for several
+batch sizes. That a VectorEnv game follows the real headless game step for
+step is checked in tests/test_vector_env.py.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import time
+import numpy as np
+from vector_env import VectorEnv
+
+BATCH_SIZES = (256, 1_024, 4_096, 16_384)
+
+
+def throughput(num_games: int, warmup: int = 500, steps: int = 500) -> float:
+    """
+    Time random play once the games are past their opening steps.
+
+    Args:
+        num_games (int): Games in the batch.
+        warmup (int): Steps run before timing.
+        steps (int): Steps timed.
+
+    Returns:
+        float: Game-steps per second.
+    """
+    env = VectorEnv(num_games)
+    actions = np.random.default_rng(0).integers(0, 6, size=(warmup + steps, num_games))
+    for action in actions[:warmup]:
+        env.step(action)
+    start = time.perf_counter()
+    for action in actions[warmup:]:
+        env.step(action)
+    return num_games * steps / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    for num_games in BATCH_SIZES:
+        print(f'{num_games:>6} games: {throughput(num_games):>12,.0f} game-steps/s')
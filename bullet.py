@@ -3,6 +3,7 @@ bullet.py
 
 This module defines the Bullet class for managing projectile sprites fired by the player's ship.
 Bullets move vertically upward and are rendered on the screen each frame until removed.
+They are preallocated by the Arsenal and relaunched instead of being recreated.
 """
 
 import pygame
@@ -17,41 +18,86 @@ class Bullet(Sprite):
     A class representing a bullet fired by the player's ship.
 
     Attributes:
+        game (AlienInvasion): The main game instance.
         screen (pygame.Surface): The game screen to draw the bullet on.
         settings (object): Game settings object with bullet parameters.
-        image (pygame.Surface): The bullet image.
+        image (pygame.Surface): The bullet image, shared through the asset cache.
+        loaded_size (Tuple[float, float]): The bullet width and height `image`
+            was fetched for.
+        blend_flags (int): Blit flags matching the image's alpha mode.
         rect (pygame.Rect): The position and size of the bullet.
         y (float): The bullet's vertical position for smooth motion.
+        prev_y (float): `y` at the start of the last simulation step, for interpolation.
     """
 
     def __init__(self, game: 'AlienInvasion'):
         """
-        Initialize the bullet at the ship's current top center position.
+        Initialize an inactive bullet. Call `launch` to fire it.
 
         Args:
             game (AlienInvasion): The main game instance providing context and settings.
         """
         super().__init__()
+        self.game = game
         self.screen = game.screen
         self.settings = game.settings
 
-        self.image = pygame.image.load(str(self.settings.bullet_file))
-        self.image = pygame.transform.scale(
-            self.image, (self.settings.bullet_w, self.settings.bullet_h)
-        )
+        self.blend_flags = game.assets.blend_flags
+        self._load_image()
         self.rect = self.image.get_rect()
-        self.rect.midtop = game.ship.rect.midtop
         self.y = float(self.rect.y)
+        self.prev_y = self.y
+
+    def _load_image(self):
+        """
+        Fetch the bullet image for the current bullet size from the asset cache.
+        """
+        assets = self.game.assets
+        self.loaded_size = (self.settings.bullet_w, self.settings.bullet_h)
+        self.image = assets.get_image(
+            self.settings.bullet_file, self.loaded_size, assets.alpha_mode
+        )
+
+    def launch(self):
+        """
+        Reset the bullet to the ship's current top center position.
+
+        The image is fetched again only when the bullet size has changed since
+        it was loaded, so bullets reused after a difficulty change pick up the
+        new size without a cache lookup on every shot.
+        """
+        if self.loaded_size != (self.settings.bullet_w, self.settings.bullet_h):
+            self._load_image()
+            self.rect.size = self.image.get_size()
+        self.rect.midtop = self.game.ship.rect.midtop
+        self.y = float(self.rect.y)
+        self.prev_y = self.y
 
     def update(self):
         """
         Update the bullet's position by moving it upward.
         """
-        self.y -= self.settings.bullet_speed
+        self.prev_y = self.y
+        self.y -= self.settings.bullet_speed * self.settings.step_scale
         self.rect.y = self.y
 
+    def get_dest(self, alpha: float):
+        """
+        Get where to draw the bullet between the last two simulation steps.
+
+        Args:
+            alpha (float): How far between the previous and current step, from 0 to 1.
+
+        Returns:
+            pygame.Rect: The bullet's rect, shifted to the interpolated position.
+        """
+        if alpha >= 1.0:
+            return self.rect
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return self.rect.move(0, round(y) - self.rect.y)
+
     def draw_bullet(self):
         """
         Draw the bullet on the screen at its current position.
         """
-        self.screen.blit(self.image, self.rect)
+        self.screen.blit(self.image, self.rect, special_flags=self.blend_flags)
@@ -24,6 +24,9 @@ class Button:
         rect (pygame.Rect): The button’s rectangular area.
         msg_image (pygame.Surface): Rendered image of the button’s text.
         msg_image_rect (pygame.Rect): Rect of the rendered text image.
+
+    In headless mode only the button's rect is set up, so clicks still work
+    without loading a font.
     """
 
     def __init__(self, game: 'AlienInvasion', msg):
@@ -38,12 +41,14 @@ class Button:
         self.screen = game.screen
         self.boundaires = game.screen.get_rect()
         self.settings = game.settings
-        self.font = pygame.font.Font(self.settings.font_file,
-                                     self.settings.button_font_size)
 
         self.rect = pygame.Rect(0, 0, self.settings.button_w, self.settings.button_h)
         self.rect.center = self.boundaires.center
 
+        if game.headless:
+            return
+        self.font = pygame.font.Font(self.settings.font_file,
+                                     self.settings.button_font_size)
         self._prep_msg(msg)
 
     def _prep_msg(self, msg):
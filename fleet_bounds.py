@@ -0,0 +1,102 @@
+"""
+fleet_bounds.py
+
+This module defines the FleetBounds class, which tracks the extents of a rigid
+formation from per-column and per-row alive counts. The extents only change
+when a member is removed, so edge and bottom checks no longer need to scan
+every alien each frame.
+"""
+
+from collections import Counter
+
+
+class FleetBounds:
+    """
+    Track the leftmost, rightmost and lowest edges of a rigid formation.
+
+    Rects are given in formation coordinates, so moving the formation does not
+    change them. Removing the last member of an outer column or row falls back
+    to a scan over the remaining columns or rows, not over every member.
+
+    Attributes:
+        lefts (Counter): Number of members per left edge (one per column).
+        rights (Counter): Number of members per right edge.
+        bottoms (Counter): Number of members per bottom edge (one per row).
+        left (int | None): Leftmost edge, or None when empty.
+        right (int | None): Rightmost edge, or None when empty.
+        bottom (int | None): Lowest edge, or None when empty.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty bounds.
+        """
+        self.lefts = Counter()
+        self.rights = Counter()
+        self.bottoms = Counter()
+        self.left = None
+        self.right = None
+        self.bottom = None
+
+    def __len__(self) -> int:
+        return sum(self.lefts.values())
+
+    def add(self, rect):
+        """
+        Add a member covering the given rect.
+
+        Args:
+            rect (pygame.Rect): The member's rect in formation coordinates.
+        """
+        self.lefts[rect.left] += 1
+        self.rights[rect.right] += 1
+        self.bottoms[rect.bottom] += 1
+        if self.left is None or rect.left < self.left:
+            self.left = rect.left
+        if self.right is None or rect.right > self.right:
+            self.right = rect.right
+        if self.bottom is None or rect.bottom > self.bottom:
+            self.bottom = rect.bottom
+
+    def remove(self, rect):
+        """
+        Remove a member previously added with the same rect.
+
+        Args:
+            rect (pygame.Rect): The member's rect in formation coordinates.
+        """
+        if self._discard(self.lefts, rect.left):
+            self.left = min(self.lefts, default=None)
+        if self._discard(self.rights, rect.right):
+            self.right = max(self.rights, default=None)
+        if self._discard(self.bottoms, rect.bottom):
+            self.bottom = max(self.bottoms, default=None)
+
+    @staticmethod
+    def _discard(counts: Counter, edge: int) -> bool:
+        """
+        Decrement the count for an edge, dropping it when it reaches zero.
+
+        Args:
+            counts (Counter): The per-edge counts.
+            edge (int): The edge to decrement.
+
+        Returns:
+            bool: True if the edge no longer has any members.
+        """
+        counts[edge] -= 1
+        if counts[edge] > 0:
+            return False
+        del counts[edge]
+        return True
+
+    def clear(self):
+        """
+        Remove every member.
+        """
+        self.lefts.clear()
+        self.rights.clear()
+        self.bottoms.clear()
+        self.left = None
+        self.right = None
+        self.bottom = None
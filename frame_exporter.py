@@ -0,0 +1,210 @@
+"""
+frame_exporter.py
+
+This module renders a recorded session offline to a PNG frame sequence or a
+raw RGB24 video stream. The timeline is split into chunks that worker
+processes render in parallel on the SDL dummy video driver. The parent replays
+the input log headlessly once, taking a game snapshot at the start of each
+chunk; each worker restores its snapshot and draws every frame of the chunk
+through the game's Renderer. Replays are deterministic, so each chunk starts
+from exactly the state the session had. PNG frames are numbered globally; raw
+chunks are concatenated in order. For example:
+
+    python frame_exporter.py Assets/file/input.ailog frames/
+    python frame_exporter.py Assets/file/input.ailog session.rgb --format raw
+
+A raw stream plays with e.g. `ffplay -f rawvideo -pixel_format rgb24
+-video_size 1265x625 -framerate 60 session.rgb`.
+"""
+
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from multiprocessing import get_context
+from pathlib import Path
+from input_log import InputLog
+from scripted_input import ScriptedInput
+
+
+def split_frames(frames: int, chunks: int) -> list:
+    """
+    Split frame indices into contiguous, nearly equal ranges.
+
+    Args:
+        frames (int): Number of frames.
+        chunks (int): Number of ranges wanted.
+
+    Returns:
+        list: (first, stop) index pairs, in order, none of them empty.
+    """
+    chunks = max(1, min(chunks, frames))
+    bounds = [frames * i // chunks for i in range(chunks + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(chunks) if bounds[i] < bounds[i + 1]]
+
+
+def take_chunk_snapshots(log: InputLog, settings, ticks: list) -> list:
+    """
+    Replay a session headlessly once, snapshotting the game at given ticks.
+
+    Args:
+        log (InputLog): The recorded session.
+        settings (Settings): The settings to replay with; they are not modified.
+        ticks (list): Ticks to snapshot at, in increasing order.
+
+    Returns:
+        list: A snapshot for each tick.
+    """
+    from alien_invasion import AlienInvasion
+
+    game = AlienInvasion(headless=True, input_source=log.schedule(ScriptedInput()),
+        settings=copy(settings), seed=log.seed
+    )
+    snapshots = []
+    for target in ticks:
+        while game.running and game.tick < target:
+            game.step()
+        snapshots.append(game.snapshot())
+    return snapshots
+
+
+def render_chunk(log_path: Path, settings, snapshot: bytes, first: int, stop: int,
+                 ticks_per_frame: int, output: Path, fmt: str) -> int:
+    """
+    Render one range of frames in this process. Runs in a worker.
+
+    Frame n shows the game after tick n * ticks_per_frame.
+
+    Args:
+        log_path (Path): The input log.
+        settings (Settings): The settings to replay with.
+        snapshot (bytes): The game's snapshot at the chunk's first frame.
+        first (int): Index of the first frame to render.
+        stop (int): Index after the last frame to render.
+        ticks_per_frame (int): Simulation steps between frames.
+        output (Path): The PNG directory, or this chunk's raw file.
+        fmt (str): 'png' or 'raw'.
+
+    Returns:
+        int: Number of frames written.
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    import pygame
+    from alien_invasion import AlienInvasion
+
+    log = InputLog.load(log_path)
+    settings.dirty_rendering = False
+    settings.profile_frames = False
+    game = AlienInvasion(input_source=log.schedule(ScriptedInput()),
+        settings=settings, seed=log.seed
+    )
+    game.restore(snapshot)
+
+    raw = open(output, 'wb') if fmt == 'raw' else None
+    try:
+        for frame in range(first, stop):
+            target = frame * ticks_per_frame
+            while game.running and game.tick < target:
+                game.step()
+            game.renderer.render()
+            if raw:
+                raw.write(pygame.image.tobytes(game.screen, 'RGB'))
+            else:
+                pygame.image.save(game.screen, str(output / f'frame_{frame:06d}.png'))
+    finally:
+        if raw:
+            raw.close()
+        if game.audio:
+            game.audio.close()
+    pygame.quit()
+    return stop - first
+
+
+def export_frames(log_path: Path, output: Path, fmt: str = 'png', fps: int = 60,
+                  workers: int = None, chunks: int = None, settings=None) -> dict:
+    """
+    Render a recorded session to frames using a pool of worker processes.
+
+    Args:
+        log_path (Path): The input log.
+        output (Path): Directory for PNG frames, or the raw video file.
+        fmt (str): 'png' for numbered PNG files, 'raw' for one RGB24 stream.
+        fps (int): Output frames per second of game time; must divide the
+            recorded sim rate.
+        workers (int | None): Worker processes, defaulting to the CPU count.
+        chunks (int | None): Timeline chunks, defaulting to one per worker.
+        settings (Settings | None): Settings to use instead of the defaults;
+            the recorded rate and screen size are applied to them.
+
+    Returns:
+        dict: Frames written, frame size, seconds taken and frames per second.
+
+    Raises:
+        ValueError: If the format is unknown or fps does not divide the sim rate.
+    """
+    from settings import Settings
+
+    if fmt not in ('png', 'raw'):
+        raise ValueError(f'Unknown frame format: {fmt}')
+    log = InputLog.load(log_path)
+    settings = settings if settings is not None else Settings()
+    log.configure(settings)
+    if log.sim_rate % fps:
+        raise ValueError(f'fps {fps} does not divide the sim rate {log.sim_rate}')
+    ticks_per_frame = log.sim_rate // fps
+    frames = -(-log.end_tick // ticks_per_frame)
+
+    workers = workers or os.cpu_count() or 1
+    ranges = split_frames(frames, chunks or workers)
+    output = Path(output)
+    if fmt == 'png':
+        output.mkdir(parents=True, exist_ok=True)
+        targets = [output] * len(ranges)
+    else:
+        targets = [output.with_name(f'{output.name}.part{i}') for i in range(len(ranges))]
+
+    start = time.perf_counter()
+    snapshots = take_chunk_snapshots(log, settings,
+                                     [first * ticks_per_frame for first, _ in ranges])
+    with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as pool:
+        jobs = [pool.submit(render_chunk, log_path, settings, snapshot, first, stop,
+                            ticks_per_frame, target, fmt)
+                for (first, stop), target, snapshot in zip(ranges, targets, snapshots)]
+        written = sum(job.result() for job in jobs)
+
+    if fmt == 'raw':
+        with open(output, 'wb') as stream:
+            for part in targets:
+                with open(part, 'rb') as chunk:
+                    shutil.copyfileobj(chunk, stream)
+                part.unlink()
+    elapsed = time.perf_counter() - start
+    return {
+        'frames': written,
+        'size': log.screen_size,
+        'seconds': elapsed,
+        'frames_per_second': written / elapsed,
+    }
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render a recorded session to frames.')
+    parser.add_argument('log', type=Path, help='input log to render')
+    parser.add_argument('output', type=Path, help='PNG directory or raw video file')
+    parser.add_argument('--format', choices=('png', 'raw'), default='png',
+                        help='numbered PNG files or one RGB24 stream (default: png)')
+    parser.add_argument('--fps', type=int, default=60,
+                        help='frames per second of game time (default: 60)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunks', type=int, help='timeline chunks (default: one per worker)')
+    args = parser.parse_args()
+
+    result = export_frames(args.log, args.output, args.format, args.fps,
+                           args.workers, args.chunks)
+    width, height = result['size']
+    print(f"Wrote {result['frames']:,} {width}x{height} frames to {args.output} in "
+          f"{result['seconds']:.1f} s ({result['frames_per_second']:.1f} frames/s)")
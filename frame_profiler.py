@@ -0,0 +1,190 @@
+"""
+frame_profiler.py
+
+This module defines the FrameProfiler class, which times the phases of each
+frame of the game loop (event handling, simulation updates, collisions, each
+draw layer, the display update and the frame-cap wait). The most recent frames
+are kept in a fixed-size ring buffer, summarized as frame-time percentiles, and
+can be exported as a Chrome trace (viewable in chrome://tracing or Perfetto).
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from time import perf_counter_ns
+
+
+class FrameProfiler:
+    """
+    Record per-phase timings for the most recent frames.
+
+    The game only creates a profiler when profiling is enabled, and every
+    instrumented call site is guarded by `if profiler:`, so a disabled
+    profiler costs one truth test per phase.
+
+    A phase is timed by taking a timestamp with `start()` and passing it back to
+    `stop()`, which returns a fresh timestamp so consecutive phases can chain.
+
+    Attributes:
+        capacity (int): Number of frames kept in the ring buffer.
+        frames (deque): Finished frames, oldest first, as
+            (start_ns, duration_ns, phases) tuples where phases is a list of
+            (name, start_ns, duration_ns) tuples.
+        phases (list): Phases recorded so far in the current frame.
+        frame_start (int | None): Timestamp of the current frame's start.
+        frame_count (int): Number of frames finished since creation.
+        origin (int): Timestamp that trace times are measured from.
+    """
+
+    def __init__(self, capacity: int = 600):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            capacity (int): Number of frames to keep.
+        """
+        self.capacity = capacity
+        self.frames = deque(maxlen=capacity)
+        self.phases = []
+        self.frame_start = None
+        self.frame_count = 0
+        self.origin = perf_counter_ns()
+
+    def begin_frame(self):
+        """
+        Start timing a new frame.
+        """
+        self.phases = []
+        self.frame_start = perf_counter_ns()
+
+    def end_frame(self):
+        """
+        Finish the current frame and push it into the ring buffer.
+        """
+        if self.frame_start is None:
+            return
+        now = perf_counter_ns()
+        self.frames.append((self.frame_start, now - self.frame_start, self.phases))
+        self.frame_start = None
+        self.frame_count += 1
+
+    @staticmethod
+    def start() -> int:
+        """
+        Take a timestamp to start a phase.
+
+        Returns:
+            int: The current time in nanoseconds.
+        """
+        return perf_counter_ns()
+
+    def stop(self, name: str, start: int) -> int:
+        """
+        Record a phase that ran from `start` until now.
+
+        Args:
+            name (str): The phase name.
+            start (int): Timestamp returned by `start()` or a previous `stop()`.
+
+        Returns:
+            int: The current time in nanoseconds, to start the next phase.
+        """
+        now = perf_counter_ns()
+        self.phases.append((name, start, now - start))
+        return now
+
+    def frame_times(self) -> list:
+        """
+        Get the durations of the buffered frames.
+
+        Returns:
+            list: Frame durations in milliseconds, oldest first.
+        """
+        return [duration / 1_000_000 for _, duration, _ in self.frames]
+
+    def percentile(self, percent: float, name: str = None) -> float:
+        """
+        Get a percentile of the buffered frame or phase times.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+            name (str | None): A phase to summarize, totalled per frame, or
+                None for whole frames.
+
+        Returns:
+            float: The time in milliseconds, or 0.0 with no frames recorded.
+        """
+        if name is None:
+            times = self.frame_times()
+        else:
+            times = [sum(duration for phase, _, duration in phases if phase == name) / 1_000_000
+                     for _, _, phases in self.frames]
+        if not times:
+            return 0.0
+        times.sort()
+        index = round(percent / 100 * (len(times) - 1))
+        return times[index]
+
+    def summary(self) -> dict:
+        """
+        Summarize the buffered frames.
+
+        Returns:
+            dict: 'frame' and each phase name mapped to its p50 and p99 times
+                in milliseconds.
+        """
+        names = dict.fromkeys(name for _, _, phases in self.frames for name, _, _ in phases)
+        summary = {'frame': {'p50': self.percentile(50), 'p99': self.percentile(99)}}
+        for name in names:
+            summary[name] = {
+                'p50': self.percentile(50, name),
+                'p99': self.percentile(99, name),
+            }
+        return summary
+
+    def export_chrome_trace(self, path: Path):
+        """
+        Write the buffered frames as a Chrome trace event file.
+
+        Each frame and each phase becomes a complete ('X') event, with times in
+        microseconds since the profiler was created.
+
+        Args:
+            path (Path): The file to write.
+        """
+        events = []
+        for number, (frame_start, frame_duration, phases) in enumerate(self.frames):
+            events.append(self._trace_event('frame', frame_start, frame_duration,
+                {'frame': self.frame_count - len(self.frames) + number}))
+            events.extend(self._trace_event(name, start, duration)
+                          for name, start, duration in phases)
+        contents = json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+        try:
+            path.write_text(contents)
+        except FileNotFoundError as e:
+            print(f'File Not Found: {e}')
+
+    def _trace_event(self, name: str, start: int, duration: int, args: dict = None) -> dict:
+        """
+        Build a complete trace event.
+
+        Args:
+            name (str): The event name.
+            start (int): Start timestamp in nanoseconds.
+            duration (int): Duration in nanoseconds.
+            args (dict | None): Extra values shown with the event.
+
+        Returns:
+            dict: The trace event.
+        """
+        event = {
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self.origin) / 1_000,
+            'dur': duration / 1_000,
+            'pid': 1,
+            'tid': 1,
+        }
+        if args:
+            event['args'] = args
+        return event
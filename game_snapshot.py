@@ -0,0 +1,117 @@
+"""
+game_snapshot.py
+
+This module packs the whole simulation state of a running game into a compact
+binary blob and restores a game from one: the game state and tick, the
+settings that change during play, the statistics, the ship, the active
+bullets, the fleet's movement and alive mask, and the random number generator.
+Restoring reuses the game's existing objects, so it takes microseconds instead
+of rebuilding the level.
+"""
+
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+MAGIC = b'AISNAP02'
+STATES = ('playing', 'respawn')
+# Magic, tick, game_active, state index, respawn_ticks.
+GAME = struct.Struct('<8sI?BI')
+# Each of Settings.STATE_FIELDS as a double.
+SETTINGS = struct.Struct('<11d')
+# score, level, ships_left, max_score.
+STATS = struct.Struct('<qIiq')
+# x, prev_x, moving_right, moving_left.
+SHIP = struct.Struct('<dd??')
+COUNT = struct.Struct('<B')
+# Pool index, y, prev_y, rect x, y, width, height.
+BULLET = struct.Struct('<Bdd4i')
+# fleet_direction, shift, shift_px, prev_shift, drop, formation alien width and
+# height, alien count; the alive bitmask follows.
+FLEET = struct.Struct('<bdididdI')
+# Mersenne Twister state words and position, whether a Gaussian value is
+# cached, and that value.
+RNG = struct.Struct('<625I?d')
+
+
+def take_snapshot(game: 'AlienInvasion') -> bytes:
+    """
+    Pack a game's simulation state.
+
+    Args:
+        game (AlienInvasion): A game that has finished loading.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    bullets = game.ship.arsenal.get_state()
+    fleet = game.alien_fleet.get_state()
+    version, words, gauss = game.rng.getstate()
+    parts = [
+        GAME.pack(MAGIC, game.tick, game.game_active, STATES.index(game.state),
+                  game.respawn_ticks),
+        SETTINGS.pack(*game.settings.get_state()),
+        STATS.pack(*game.game_stats.get_state()),
+        SHIP.pack(*game.ship.get_state()),
+        COUNT.pack(len(bullets)),
+        *(BULLET.pack(*bullet) for bullet in bullets),
+        FLEET.pack(*fleet[:-1]),
+        fleet[-1],
+        RNG.pack(*words, gauss is not None, gauss or 0.0),
+    ]
+    return b''.join(parts)
+
+
+def restore_snapshot(game: 'AlienInvasion', snapshot: bytes):
+    """
+    Restore a game's simulation state from a snapshot.
+
+    The snapshot must come from a game with the same screen size and fleet
+    settings. The HUD is refreshed and the next frame fully redrawn.
+
+    Args:
+        game (AlienInvasion): A game that has finished loading.
+        snapshot (bytes): A snapshot from `take_snapshot`.
+
+    Raises:
+        ValueError: If the data is not a snapshot.
+    """
+    magic, tick, game_active, state, respawn_ticks = GAME.unpack_from(snapshot)
+    if magic != MAGIC:
+        raise ValueError('Not a game snapshot')
+    offset = GAME.size
+    settings = SETTINGS.unpack_from(snapshot, offset)
+    offset += SETTINGS.size
+    stats = STATS.unpack_from(snapshot, offset)
+    offset += STATS.size
+    ship = SHIP.unpack_from(snapshot, offset)
+    offset += SHIP.size
+    count, = COUNT.unpack_from(snapshot, offset)
+    offset += COUNT.size
+    bullets = [BULLET.unpack_from(snapshot, offset + i * BULLET.size) for i in range(count)]
+    offset += count * BULLET.size
+    fleet = FLEET.unpack_from(snapshot, offset)
+    offset += FLEET.size
+    mask_size = (fleet[-1] + 7) // 8
+    mask = snapshot[offset:offset + mask_size]
+    offset += mask_size
+    *words, has_gauss, gauss = RNG.unpack_from(snapshot, offset)
+
+    game.tick = tick
+    game.game_active = game_active
+    game.state = STATES[state]
+    game.respawn_ticks = respawn_ticks
+    game.settings.set_state(tuple(int(value) if value.is_integer() else value
+                                  for value in settings))
+    game.game_stats.set_state(stats)
+    game.ship.set_state(ship)
+    game.ship.arsenal.set_state(bullets)
+    direction, shift, shift_px, prev_shift, drop, alien_w, alien_h, alien_count = fleet
+    formation = tuple(int(value) if value.is_integer() else value for value in (alien_w, alien_h))
+    game.alien_fleet.set_state((direction, shift, shift_px, prev_shift, drop,
+                                *formation, alien_count, mask))
+    game.rng.setstate((3, tuple(words), gauss if has_gauss else None))
+    if game.renderer:
+        game.renderer.invalidate()
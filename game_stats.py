@@ -3,29 +3,45 @@ game_stats.py
 
 This module defines the GameStats class, which tracks and manages the player's
 score, level, lives, and high scores throughout the game session. It handles
-saving/loading persistent high scores using a JSON file.
+saving/loading persistent high scores through a ScoreStore, which writes them
+in the background whenever the score passes a milestone, and notifies listeners
+such as the HUD whenever a displayed statistic changes.
 """
 
-import json
+import time
+import uuid
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
+from score_store import ScoreStore, read_scores
+
 class GameStats:
     """
     Track statistics for Alien Invasion, including current score, high score,
     remaining ships, and current level. Also manages persistent score storage.
 
+    Listeners are called with no arguments after `update`, `update_level`,
+    `reset_stats` and any change to `ships_left`. Code that changes other
+    fields directly should call `notify` itself.
+
     Attributes:
         game (AlienInvasion): The main game instance.
         settings (object): Game settings object.
+        listeners (list): Callables notified when the statistics change.
         max_score (int): Maximum score in the current session.
         hi_score (int): All-time highest score loaded from file.
         ships_left (int): Number of remaining ships.
         score (int): Current score in the session.
         level (int): Current level of the game.
         path (Path): Path to the saved score file.
+        store (ScoreStore | None): Background writer for the scores and
+            leaderboard; None for headless and scripted games.
+        saved_hi_score (int): High score most recently queued for saving.
+        session_id (str): Leaderboard id of the current game.
+        session_started (float): Unix time the current game started.
+        next_milestone (int): Score at which the scores are next saved.
     """
 
     def __init__(self, game: 'AlienInvasion'):
@@ -37,6 +53,7 @@ class GameStats:
         """
         self.game = game
         self.settings = game.settings
+        self.listeners = []
         self.max_score = 0
         self.init_saved_scores()
         self.reset_stats()
@@ -45,40 +62,129 @@ class GameStats:
         """
         Load the high score from a file if it exists and is valid.
         Otherwise, initialize the file with a score of 0.
+
+        Unless the game is headless or driven by scripted input, such as a
+        replay, a ScoreStore is started to save scores in the background;
+        other games only read the file.
         """
         self.path = self.settings.scores_file
-        if self.path.exists() and self.path.__sizeof__() > 20:
-            contents = self.path.read_text()
-            scores = json.loads(contents)
-            self.hi_score = scores.get('hi_score', 0)
-        else:
-            self.hi_score = 0
-            self.save_scores()
+        self.store = None
+        if not self.game.headless and self.game.input_source is None:
+            leaderboard = self.settings.leaderboard_file if self.settings.leaderboard_enabled else None
+            self.store = ScoreStore(self.path, leaderboard)
+        scores = read_scores(self.path)
+        self.hi_score = scores.get('hi_score', 0)
+        self.saved_hi_score = self.hi_score
+        if not scores and self.store is not None:
+            self.store.save_scores({'hi_score': self.hi_score})
 
     def save_scores(self):
         """
-        Save the current high score to the designated file.
+        Save the high score and the current session, and wait until they are
+        written. Called when the game quits.
+        """
+        self._persist(finished=True)
+        if self.store is not None:
+            self.store.close()
+
+    def end_session(self):
+        """
+        Save the finished session when the game is over. Returns immediately.
+        """
+        self._persist(finished=True)
+
+    def _persist(self, finished: bool = False):
+        """
+        Queue the high score, if it changed, and the current session to the
+        score store.
+
+        Args:
+            finished (bool): Whether the session has ended.
+        """
+        if self.store is None:
+            return
+        if self.hi_score != self.saved_hi_score:
+            self.store.save_scores({'hi_score': self.hi_score})
+            self.saved_hi_score = self.hi_score
+        if self.score or self.level > 1:
+            self.store.save_session({
+                'id': self.session_id,
+                'player': self.settings.player_name,
+                'started_at': self.session_started,
+                'updated_at': time.time(),
+                'score': self.score,
+                'level': self.level,
+                'finished': finished,
+            })
+
+    def add_listener(self, listener):
+        """
+        Register a callable to be notified when the statistics change.
+
+        Args:
+            listener (Callable[[], None]): The callable to notify.
+        """
+        self.listeners.append(listener)
+
+    def notify(self):
+        """
+        Notify every listener that the statistics changed.
         """
-        scores = {
-            'hi_score': self.hi_score
-        }
-        contents = json.dumps(scores, indent=4)
-        try:
-            self.path.write_text(contents)
-        except FileNotFoundError as e:
-            print(f'File Not Found: {e}')
+        for listener in self.listeners:
+            listener()
+
+    @property
+    def ships_left(self) -> int:
+        """
+        int: Number of remaining ships. Setting it notifies listeners.
+        """
+        return self._ships_left
+
+    @ships_left.setter
+    def ships_left(self, value: int):
+        self._ships_left = value
+        self.notify()
 
     def reset_stats(self):
         """
         Reset statistics for a new game session.
         """
-        self.ships_left = self.settings.starting_ship_count
         self.score = 0
         self.level = 1
+        self.session_id = uuid.uuid4().hex
+        self.session_started = time.time()
+        self.next_milestone = self.settings.score_milestone
+        self.ships_left = self.settings.starting_ship_count
+
+    def get_state(self) -> tuple:
+        """
+        Get the session statistics for a snapshot. The high score is not
+        included, so restoring never lowers it.
+
+        Returns:
+            tuple: score, level, ships_left and max_score.
+        """
+        return self.score, self.level, self.ships_left, self.max_score
+
+    def set_state(self, state: tuple):
+        """
+        Restore the session statistics from a snapshot and notify listeners.
+        The high score is raised to the restored session's best if needed, as
+        it would have been during play.
+
+        Args:
+            state (tuple): Values from `get_state`.
+        """
+        self.score, self.level, self._ships_left, self.max_score = state
+        self.hi_score = max(self.hi_score, self.max_score)
+        milestone = self.settings.score_milestone
+        self.next_milestone = (self.score // milestone + 1) * milestone
+        self.notify()
 
     def update(self, collisions):
         """
         Update the score based on collisions, and update max/hi scores.
+        Passing a score milestone queues a save.
 
         Args:
             collisions (dict): Dictionary of sprite groups representing hits.
@@ -86,6 +192,11 @@ class GameStats:
         self._update_score(collisions)
         self._update_max_score()
         self._update_hi_score()
+        if self.score >= self.next_milestone:
+            milestone = self.settings.score_milestone
+            self.next_milestone = (self.score // milestone + 1) * milestone
+            self._persist()
+        self.notify()
 
     def _update_score(self, collisions):
         """
@@ -113,7 +224,8 @@ class GameStats:
 
     def update_level(self):
         """
-        Increment the current game level.
+        Increment the current game level and save the scores.
         """
         self.level += 1
-        print(self.level)
+        self._persist()
+        self.notify()
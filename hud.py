@@ -3,10 +3,14 @@ hud.py
 
 This module defines the HUD (Heads-Up Display) class responsible for rendering
 game statistics such as score, high score, max score, level, and remaining lives
-on the screen during gameplay.
+on the screen during gameplay. Rendered strings are cached, and a field is only
+re-rendered when its value changes. The statistics are composited into a single
+overlay surface that is rebuilt only when GameStats reports a change.
 """
 
+import pygame
 import pygame.font
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,6 +20,11 @@ class HUD:
     """
     A class to manage and draw the heads-up display (HUD) elements on the screen.
 
+    The scores, level and life icons do not overlap, so they are copied into
+    one transparent overlay with BLEND_RGBA_MAX, keeping their pixels exactly,
+    and drawn with a single run-length encoded blit. The overlay is marked
+    stale by GameStats notifications and rebuilt on the next draw.
+
     Attributes:
         game (AlienInvasion): The main game instance.
         settings (object): Game settings including text size, colors, etc.
@@ -24,6 +33,17 @@ class HUD:
         game_stats (GameStats): Tracks current game statistics.
         font (pygame.font.Font): Font used for rendering text.
         padding (int): Padding between HUD elements.
+        text_cache (OrderedDict): Rendered text surfaces keyed by string, least
+            recently used first.
+        text_cache_capacity (int): Maximum number of cached text surfaces.
+        rendered_values (dict): The value each text field was last rendered
+            with, keyed by field name.
+        overlay (pygame.Surface | None): The composited statistics.
+        overlay_rect (pygame.Rect): Where the overlay is drawn on the screen.
+        overlay_stale (bool): Whether the overlay must be rebuilt before drawing.
+        overlay_version (int): Incremented every time the overlay is rebuilt.
+        profile_image (pygame.Surface | None): Rendered frame-time overlay, or
+            None when it is not shown.
     """
 
     def __init__(self, game: 'AlienInvasion'):
@@ -41,24 +61,80 @@ class HUD:
         self.font = pygame.font.Font(self.settings.font_file,
                                      self.settings.HUD_font_size)
         self.padding = 20
+        self.text_cache = OrderedDict()
+        self.text_cache_capacity = self.settings.HUD_text_cache_capacity
+        self.rendered_values = {}
+        self.overlay = None
+        self.overlay_rect = pygame.Rect(0, 0, 0, 0)
+        self.overlay_stale = True
+        self.overlay_version = 0
+        self.profile_image = None
         self.update_scores()
         self._setup_life_image()
         self.update_level()
+        self.game_stats.add_listener(self.mark_stale)
 
     def _setup_life_image(self):
         """
         Load and scale the ship image to be used for representing lives.
+
+        The icons are copied into the overlay, which is drawn with ordinary
+        alpha blending, so they always use straight alpha.
         """
-        self.life_image = pygame.image.load(self.settings.ship_file)
-        self.life_image = pygame.transform.scale(
-            self.life_image, (self.settings.ship_w, self.settings.ship_h)
+        self.life_image = self.game.assets.get_image(
+            self.settings.ship_file, (self.settings.ship_w, self.settings.ship_h),
+            'alpha'
         )
         self.life_rect = self.life_image.get_rect()
 
+    def mark_stale(self):
+        """
+        Mark the overlay for rebuilding. Registered as a GameStats listener.
+        """
+        self.overlay_stale = True
+
+    def _render_text(self, text: str) -> pygame.Surface:
+        """
+        Render a string with the HUD font, reusing a cached surface when the
+        same string was rendered recently.
+
+        Args:
+            text (str): The string to render.
+
+        Returns:
+            pygame.Surface: The rendered text. Shared, so treat it as read-only.
+        """
+        image = self.text_cache.get(text)
+        if image is not None:
+            self.text_cache.move_to_end(text)
+            return image
+        image = self.font.render(text, True, self.settings.text_color, None)
+        self.text_cache[text] = image
+        if len(self.text_cache) > self.text_cache_capacity:
+            self.text_cache.popitem(last=False)
+        return image
+
+    def _changed(self, field: str, value) -> bool:
+        """
+        Check whether a field needs re-rendering, and record its new value.
+
+        Args:
+            field (str): The HUD field name.
+            value (object): The field's current value.
+
+        Returns:
+            bool: True if the value differs from the one last rendered.
+        """
+        if field in self.rendered_values and self.rendered_values[field] == value:
+            return False
+        self.rendered_values[field] = value
+        return True
+
     def update_scores(self):
         """
         Update all score-related text elements: max score, current score, and high score.
         """
+        self.overlay_stale = True
         self._update_max_score()
         self._update_score()
         self._update_hi_score()
@@ -67,8 +143,10 @@ class HUD:
         """
         Render and position the current score text.
         """
+        if not self._changed('score', self.game_stats.score):
+            return
         score_str = f'Score: {self.game_stats.score: ,.0f}'
-        self.score_image = self.font.render(score_str, True, self.settings.text_color, None)
+        self.score_image = self._render_text(score_str)
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.boundaires.right - self.padding
         self.score_rect.top = self.max_score_rect.bottom + self.padding
@@ -77,8 +155,10 @@ class HUD:
         """
         Render and position the max score text.
         """
+        if not self._changed('max_score', self.game_stats.max_score):
+            return
         max_score_str = f'MAX SCORE: {self.game_stats.max_score: ,.0f}'
-        self.max_score_image = self.font.render(max_score_str, True, self.settings.text_color, None)
+        self.max_score_image = self._render_text(max_score_str)
         self.max_score_rect = self.max_score_image.get_rect()
         self.max_score_rect.right = self.boundaires.right - self.padding
         self.max_score_rect.top = self.padding
@@ -87,8 +167,10 @@ class HUD:
         """
         Render and center the high score text at the top of the screen.
         """
+        if not self._changed('hi_score', self.game_stats.hi_score):
+            return
         hi_score_str = f'HI-SCORE: {self.game_stats.hi_score: ,.0f}'
-        self.hi_score_image = self.font.render(hi_score_str, True, self.settings.text_color, None)
+        self.hi_score_image = self._render_text(hi_score_str)
         self.hi_score_rect = self.hi_score_image.get_rect()
         self.hi_score_rect.midtop = (self.boundaires.centerx, self.padding)
 
@@ -96,28 +178,97 @@ class HUD:
         """
         Render and position the current level text on the screen.
         """
+        self.overlay_stale = True
+        if not self._changed('level', self.game_stats.level):
+            return
         level_str = f'LEVEL: {self.game_stats.level: ,.0f}'
-        self.level_image = self.font.render(level_str, True, self.settings.text_color, None)
+        self.level_image = self._render_text(level_str)
         self.level_rect = self.level_image.get_rect()
         self.level_rect.left = self.padding
         self.level_rect.top = self.life_rect.bottom + self.padding
 
-    def _draw_lives(self):
+    def update_profile(self, p50: float, p99: float):
+        """
+        Render and position the frame-time overlay in the bottom-left corner.
+
+        Args:
+            p50 (float): Median frame time in milliseconds.
+            p99 (float): 99th percentile frame time in milliseconds.
+        """
+        profile_str = f'FRAME p50: {p50:.1f} ms  p99: {p99:.1f} ms'
+        self.profile_image = self.font.render(profile_str, True, self.settings.text_color, None)
+        self.profile_rect = self.profile_image.get_rect()
+        self.profile_rect.left = self.padding
+        self.profile_rect.bottom = self.boundaires.bottom - self.padding
+
+    def _get_life_blits(self) -> list:
+        """
+        Build the blit sequence for the remaining ships (lives).
+
+        Returns:
+            list: (image, dest, area, special_flags) tuples for `Surface.blits`.
+        """
+        step = self.life_rect.width + self.padding
+        return [(self.life_image, self.life_rect.move(self.padding + i * step, self.padding))
+                for i in range(self.game_stats.ships_left)]
+
+    def _build_overlay(self):
+        """
+        Re-render any changed fields and composite every statistic into a new
+        overlay surface sized to fit them.
+        """
+        self.update_scores()
+        self.update_level()
+        blits = [
+            (self.hi_score_image, self.hi_score_rect),
+            (self.max_score_image, self.max_score_rect),
+            (self.score_image, self.score_rect),
+            (self.level_image, self.level_rect),
+        ]
+        blits.extend(self._get_life_blits())
+        bounds = blits[0][1].unionall([rect for _, rect in blits])
+
+        overlay = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        overlay.blits([(image, rect.move(-bounds.x, -bounds.y), None, pygame.BLEND_RGBA_MAX)
+                       for image, rect in blits], False)
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert_alpha()
+        overlay.set_alpha(255, pygame.RLEACCEL)
+
+        self.overlay = overlay
+        self.overlay_rect = bounds
+        self.overlay_stale = False
+        self.overlay_version += 1
+
+    def get_overlay(self) -> tuple:
+        """
+        Get the statistics overlay, rebuilding it first if it is stale.
+
+        Returns:
+            Tuple[pygame.Surface, pygame.Rect]: The overlay and its screen rect.
         """
-        Draw icons for the remaining ships (lives) on the screen.
+        if self.overlay_stale:
+            self._build_overlay()
+        return self.overlay, self.overlay_rect
+
+    def get_blits(self, alpha: float = 1.0) -> list:
+        """
+        Build the blit sequence for the HUD elements that change every few
+        frames rather than on statistics changes: the frame-time overlay.
+
+        Args:
+            alpha (float): Unused; HUD elements do not move between steps.
+
+        Returns:
+            list: (image, dest) tuples.
         """
-        current_x = self.padding
-        current_y = self.padding
-        for _ in range(self.game_stats.ships_left):
-            self.screen.blit(self.life_image, (current_x, current_y))
-            current_x += self.life_rect.width + self.padding
+        if self.profile_image is None:
+            return []
+        return [(self.profile_image, self.profile_rect)]
 
     def draw(self):
         """
         Draw all HUD elements to the screen: scores, level, and lives.
         """
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self._draw_lives()
+        self.screen.blit(*self.get_overlay())
+        self.screen.blits(self.get_blits(), False)
@@ -0,0 +1,200 @@
+"""
+input_log.py
+
+This module defines the InputLog class, which records the input events the game
+handles, with the tick each was handled on, into a compact binary file, and
+turns a saved log back into scripted input. Since the simulation advances in
+fixed steps, replaying the same events on the same ticks with the same seed and
+settings reproduces the session exactly, headless or rendered, and as fast as
+the machine allows. Replay a log from the project root with:
+
+    python input_log.py Assets/file/input.ailog [--render] [--render-every N]
+"""
+
+import os
+import struct
+from pathlib import Path
+import pygame
+from scripted_input import ScriptedInput
+
+MAGIC = b'AIINPUT1'
+# Magic, seed, sim_rate, screen_w, screen_h, end tick, event count.
+HEADER = struct.Struct('<8sQHHHII')
+# Tick, kind, value: the key code, or the click position packed as x | y << 16.
+EVENT = struct.Struct('<IBI')
+
+KEY_DOWN = 0
+KEY_UP = 1
+CLICK = 2
+
+
+class InputLog:
+    """
+    A recorded input stream: the handled events by tick, the RNG seed and the
+    settings the simulation depends on.
+
+    Attributes:
+        seed (int): Seed of the game's random number generator.
+        sim_rate (int): Simulation steps per second of the recording.
+        screen_size (Tuple[int, int]): Screen width and height of the recording.
+        events (list): (tick, kind, value) tuples in the order they were handled.
+        end_tick (int): The tick the session ended on; replays stop before it.
+    """
+
+    def __init__(self, seed: int, settings, events=(), end_tick: int = 0):
+        """
+        Initialize the log.
+
+        Args:
+            seed (int): Seed of the game's random number generator.
+            settings (Settings): The settings the session runs with.
+            events (Iterable[Tuple[int, int, int]]): Initial (tick, kind,
+                value) records.
+            end_tick (int): The tick the session ended on.
+        """
+        self.seed = seed
+        self.sim_rate = settings.sim_rate
+        self.screen_size = (settings.screen_w, settings.screen_h)
+        self.events = list(events)
+        self.end_tick = end_tick
+
+    def record(self, tick: int, event: pygame.event.Event):
+        """
+        Add a handled key or mouse event. Other events are ignored.
+
+        Args:
+            tick (int): The tick the event was handled on.
+            event (pygame.event.Event): The event.
+        """
+        if event.type == pygame.KEYDOWN:
+            self.events.append((tick, KEY_DOWN, event.key))
+        elif event.type == pygame.KEYUP:
+            self.events.append((tick, KEY_UP, event.key))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            x, y = event.pos
+            self.events.append((tick, CLICK, x | y << 16))
+
+    def save(self, path: Path, end_tick: int):
+        """
+        Write the log to a file.
+
+        Args:
+            path (Path): The file to write.
+            end_tick (int): The tick the session ended on.
+        """
+        self.end_tick = end_tick
+        data = bytearray(HEADER.pack(MAGIC, self.seed, self.sim_rate,
+            *self.screen_size, end_tick, len(self.events)
+        ))
+        for record in self.events:
+            data += EVENT.pack(*record)
+        Path(path).write_bytes(data)
+
+    @classmethod
+    def load(cls, path: Path) -> 'InputLog':
+        """
+        Read a log from a file.
+
+        Args:
+            path (Path): The file to read.
+
+        Returns:
+            InputLog: The log.
+
+        Raises:
+            ValueError: If the file is not an input log.
+        """
+        data = Path(path).read_bytes()
+        magic, seed, sim_rate, screen_w, screen_h, end_tick, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f'Not an input log: {path}')
+        log = cls.__new__(cls)
+        log.seed = seed
+        log.sim_rate = sim_rate
+        log.screen_size = (screen_w, screen_h)
+        log.events = list(EVENT.iter_unpack(data[HEADER.size:HEADER.size + count * EVENT.size]))
+        log.end_tick = end_tick
+        return log
+
+    def configure(self, settings):
+        """
+        Apply the recorded simulation rate and screen size to settings.
+
+        Args:
+            settings (Settings): The settings to replay with.
+        """
+        settings.sim_rate = self.sim_rate
+        settings.screen_w, settings.screen_h = self.screen_size
+
+    def schedule(self, source: ScriptedInput) -> ScriptedInput:
+        """
+        Add the recorded events to a scripted input.
+
+        Args:
+            source (ScriptedInput): The schedule to add to.
+
+        Returns:
+            ScriptedInput: The schedule.
+        """
+        for tick, kind, value in self.events:
+            if kind == KEY_DOWN:
+                source.key_down(tick, value)
+            elif kind == KEY_UP:
+                source.key_up(tick, value)
+            else:
+                source.click(tick, (value & 0xFFFF, value >> 16))
+        return source
+
+
+def replay(path: Path, render: bool = False, render_every: int = 1, settings=None):
+    """
+    Replay a recorded session as fast as possible.
+
+    Args:
+        path (Path): The input log.
+        render (bool): Draw the game in a window while replaying.
+        render_every (int): Draw one frame per this many ticks when rendering.
+        settings (Settings | None): Settings to use instead of the defaults;
+            the recorded rate and screen size are applied to them.
+
+    Returns:
+        AlienInvasion: The game, stopped on the recording's last tick.
+    """
+    from alien_invasion import AlienInvasion
+    from settings import Settings
+
+    log = InputLog.load(path)
+    settings = settings if settings is not None else Settings()
+    log.configure(settings)
+    game = AlienInvasion(headless=not render, input_source=log.schedule(ScriptedInput()),
+        settings=settings, seed=log.seed
+    )
+    while game.running and game.tick < log.end_tick:
+        game.step()
+        if render and game.tick % render_every == 0:
+            pygame.event.pump()
+            game._update_screen()
+    return game
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Replay a recorded Alien Invasion session.')
+    parser.add_argument('log', type=Path, help='input log to replay')
+    parser.add_argument('--render', action='store_true', help='draw the replay in a window')
+    parser.add_argument('--render-every', type=int, default=1,
+                        help='ticks per drawn frame when rendering (default: 1)')
+    args = parser.parse_args()
+    if not args.render:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    start = time.perf_counter()
+    game = replay(args.log, args.render, args.render_every)
+    elapsed = time.perf_counter() - start
+    stats = game.game_stats
+    print(f'Replayed {game.tick:,} ticks in {elapsed:.2f} s '
+          f'({game.tick / game.settings.sim_rate / elapsed:.1f}x real time): '
+          f'score {stats.score}, level {stats.level}, ships left {stats.ships_left}')
@@ -0,0 +1,213 @@
+"""
+renderer.py
+
+This module defines the Renderer class, which draws each frame of the game.
+Elements are drawn from a layered render list, one batched `Surface.blits`
+call per layer, with the HUD statistics drawn from one cached overlay. The
+renderer can either redraw the whole screen and flip it,
+or run in dirty-rectangle mode where only the regions touched by moving
+elements are restored and sent to the display.
+"""
+
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+class Renderer:
+    """
+    Draw the background, sprites, HUD and button to the screen every frame.
+
+    In dirty-rectangle mode the renderer remembers the rects drawn on the
+    previous frame. Each frame it restores the background under the previous
+    and current rects, redraws every element, and updates only those areas of
+    the display. When the dirty area grows past `dirty_threshold` of the screen,
+    it falls back to a full redraw and flip.
+
+    The HUD overlay only counts as dirty on frames where it was rebuilt. On
+    other frames, the bounding box of the dirty rects that cross it is
+    restored and the overlay is redrawn once within it, so no overlay pixel is
+    blended twice.
+
+    Attributes:
+        game (AlienInvasion): The main game instance.
+        settings (object): Game settings.
+        screen (pygame.Surface): The display surface.
+        screen_area (int): Area of the screen in pixels.
+        dirty (bool): Whether dirty-rectangle mode is enabled.
+        dirty_threshold (float): Fraction of the screen area above which a full
+            flip is used instead of a partial update.
+        previous_rects (list): Rects drawn on the previous frame.
+        full_redraw (bool): Whether the next frame must redraw the whole screen.
+        layers (list): (name, get_blits) pairs in back-to-front draw order.
+        overlay_version (int | None): HUD overlay version drawn last frame.
+        profiler (FrameProfiler | None): Times each draw call when profiling.
+    """
+
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initialize the renderer.
+
+        Args:
+            game (AlienInvasion): The main game instance.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.screen = game.screen
+        self.screen_area = self.settings.screen_w * self.settings.screen_h
+        self.dirty = self.settings.dirty_rendering
+        self.dirty_threshold = self.settings.dirty_area_threshold
+        self.previous_rects = []
+        self.full_redraw = True
+        self.layers = [
+            ('bullets', game.ship.arsenal.get_blits),
+            ('ship', game.ship.get_blits),
+            ('aliens', game.alien_fleet.get_blits),
+            ('hud', game.HUD.get_blits),
+        ]
+        self.overlay_version = None
+        self.profiler = game.profiler
+
+    def invalidate(self):
+        """
+        Force the next frame to redraw and flip the whole screen.
+        """
+        self.full_redraw = True
+
+    def render(self, alpha: float = 1.0):
+        """
+        Draw the current frame and push it to the display.
+
+        Args:
+            alpha (float): How far between the previous and current simulation
+                step to draw moving sprites, from 0 to 1.
+        """
+        profiler = self.profiler
+        if profiler:
+            start = profiler.start()
+        frame = [get_blits(alpha) for _, get_blits in self.layers]
+        overlay = self.game.HUD.get_overlay()
+        if profiler:
+            profiler.stop('draw.build', start)
+        if self.dirty:
+            self._render_dirty(frame, overlay)
+        else:
+            self._render_full(frame, overlay)
+
+    def _render_full(self, frame: list, overlay: tuple):
+        """
+        Redraw the whole background and every element, then flip the display.
+
+        Args:
+            frame (list): One blit sequence per layer.
+            overlay (Tuple[pygame.Surface, pygame.Rect]): The HUD overlay.
+        """
+        profiler = self.profiler
+        if profiler:
+            start = profiler.start()
+        self.screen.blit(self.game.bg, (0, 0))
+        if profiler:
+            profiler.stop('draw.background', start)
+        self._draw_elements(frame, overlay, overlay[1])
+        if profiler:
+            start = profiler.start()
+        pygame.display.flip()
+        if profiler:
+            profiler.stop('display.flip', start)
+
+    def _render_dirty(self, frame: list, overlay: tuple):
+        """
+        Restore and redraw only the regions touched this frame or the last one.
+
+        Args:
+            frame (list): One blit sequence per layer.
+            overlay (Tuple[pygame.Surface, pygame.Rect]): The HUD overlay.
+        """
+        current_rects = self._collect_rects(frame)
+        version = self.game.HUD.overlay_version
+        if version != self.overlay_version:
+            self.overlay_version = version
+            current_rects.append(overlay[1].copy())
+        dirty_rects = self.previous_rects + current_rects
+        self.previous_rects = current_rects
+
+        dirty_area = sum(rect.w * rect.h for rect in dirty_rects)
+        if self.full_redraw or dirty_area > self.dirty_threshold * self.screen_area:
+            self.full_redraw = False
+            self._render_full(frame, overlay)
+            return
+
+        overlay_rect = overlay[1]
+        crossing = [rect.clip(overlay_rect) for rect in dirty_rects
+                    if rect.colliderect(overlay_rect)]
+        overlay_clip = None
+        if crossing:
+            overlay_clip = crossing[0].unionall(crossing)
+            dirty_rects.append(overlay_clip)
+
+        profiler = self.profiler
+        if profiler:
+            start = profiler.start()
+        bg = self.game.bg
+        for rect in dirty_rects:
+            self.screen.blit(bg, rect, rect)
+        if profiler:
+            profiler.stop('draw.background', start)
+        self._draw_elements(frame, overlay, overlay_clip)
+        if profiler:
+            start = profiler.start()
+        pygame.display.update(dirty_rects)
+        if profiler:
+            profiler.stop('display.update', start)
+
+    def _draw_elements(self, frame: list, overlay: tuple, overlay_clip):
+        """
+        Draw each layer with one batched blit, then the HUD overlay within the
+        clip rect, then the play button when the game is inactive.
+
+        Args:
+            frame (list): One blit sequence per layer.
+            overlay (Tuple[pygame.Surface, pygame.Rect]): The HUD overlay.
+            overlay_clip (pygame.Rect | None): Screen area to redraw the overlay
+                within, or None to skip it.
+        """
+        blits = self.screen.blits
+        profiler = self.profiler
+        if profiler:
+            start = profiler.start()
+            for (name, _), layer_blits in zip(self.layers, frame):
+                blits(layer_blits, False)
+                start = profiler.stop(f'draw.{name}', start)
+        else:
+            for layer_blits in frame:
+                blits(layer_blits, False)
+
+        if overlay_clip:
+            image, rect = overlay
+            area = rect.clip(overlay_clip)
+            self.screen.blit(image, area, area.move(-rect.x, -rect.y))
+        if profiler:
+            start = profiler.stop('draw.overlay', start)
+
+        if not self.game.game_active:
+            self.game.play_button.draw()
+            if profiler:
+                profiler.stop('draw.button', start)
+
+    def _collect_rects(self, frame: list) -> list:
+        """
+        Gather the screen areas every element will draw into this frame.
+
+        Args:
+            frame (list): One blit sequence per layer.
+
+        Returns:
+            list: Rects for each blit in the frame, plus the play button.
+        """
+        rects = [pygame.Rect(blit[1][0], blit[1][1], *blit[0].get_size())
+                 for layer_blits in frame for blit in layer_blits]
+        if not self.game.game_active:
+            button = self.game.play_button
+            rects.append(button.rect.union(button.msg_image_rect))
+        return rects
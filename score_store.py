@@ -0,0 +1,248 @@
+"""
+score_store.py
+
+This module handles saving scores without blocking the game loop. The high
+score file is replaced atomically, so a crash mid-write can never leave it
+half-written, and all writes are done by a write-behind thread. An optional
+SQLite leaderboard keeps every session's score per player, indexed for top-N
+and history queries.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from queue import Queue
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    player TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    finished INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_score ON sessions (score DESC);
+CREATE INDEX IF NOT EXISTS sessions_by_player ON sessions (player, started_at DESC);
+"""
+
+UPSERT_SESSION = """
+INSERT INTO sessions (id, player, started_at, updated_at, score, level, finished)
+VALUES (:id, :player, :started_at, :updated_at, :score, :level, :finished)
+ON CONFLICT (id) DO UPDATE SET
+    updated_at = excluded.updated_at,
+    score = excluded.score,
+    level = excluded.level,
+    finished = excluded.finished
+"""
+
+
+def atomic_write_text(path: Path, text: str):
+    """
+    Replace a file's contents so readers only ever see the old or new version.
+
+    The text is written and synced to a temporary file in the same directory,
+    which is then renamed over the target.
+
+    Args:
+        path (Path): The file to write.
+        text (str): The new contents.
+    """
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def read_scores(path: Path) -> dict:
+    """
+    Read the saved scores file.
+
+    Args:
+        path (Path): The scores JSON file.
+
+    Returns:
+        dict: The saved scores, or an empty dict if the file is missing,
+            empty or not valid JSON.
+    """
+    try:
+        if path.stat().st_size == 0:
+            return {}
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+class ScoreStore:
+    """
+    Write scores and leaderboard sessions on a background thread.
+
+    Writes are queued and return immediately. The SQLite connection used for
+    writing lives on the worker thread; leaderboard queries open their own
+    connection, and the database runs in WAL mode so they never wait on a write.
+
+    Attributes:
+        scores_file (Path): The high score JSON file.
+        leaderboard_file (Path | None): The SQLite leaderboard, or None when
+            the leaderboard is disabled.
+        jobs (Queue): Pending (kind, data) writes; None stops the worker.
+        thread (threading.Thread): The write-behind worker.
+        writes (int): Number of writes completed.
+    """
+
+    def __init__(self, scores_file: Path, leaderboard_file: Path = None):
+        """
+        Initialize the store and start its worker thread.
+
+        Args:
+            scores_file (Path): The high score JSON file.
+            leaderboard_file (Path | None): The SQLite leaderboard to keep, if any.
+        """
+        self.scores_file = scores_file
+        self.leaderboard_file = leaderboard_file
+        self.jobs = Queue()
+        self.writes = 0
+        self.thread = threading.Thread(target=self._run, name='score-store', daemon=True)
+        self.thread.start()
+
+    def save_scores(self, scores: dict):
+        """
+        Queue an atomic rewrite of the scores file.
+
+        Args:
+            scores (dict): The scores to save.
+        """
+        self.jobs.put(('scores', dict(scores)))
+
+    def save_session(self, session: dict):
+        """
+        Queue an insert or update of a leaderboard session. Ignored when the
+        leaderboard is disabled.
+
+        Args:
+            session (dict): The session's id, player, started_at, updated_at,
+                score, level and finished values.
+        """
+        if self.leaderboard_file is not None:
+            self.jobs.put(('session', dict(session)))
+
+    def flush(self):
+        """
+        Block until every queued write has completed.
+        """
+        self.jobs.join()
+
+    def close(self):
+        """
+        Finish the queued writes and stop the worker.
+        """
+        self.jobs.put(None)
+        self.thread.join()
+
+    def _run(self):
+        """
+        Perform queued writes in order until told to stop.
+
+        If the leaderboard cannot be opened, session writes are dropped but
+        every job is still taken off the queue, so `flush` and `close` never
+        block on a dead worker.
+        """
+        connection = None
+        if self.leaderboard_file is not None:
+            try:
+                connection = self._connect()
+                connection.executescript(SCHEMA)
+            except sqlite3.Error as e:
+                print(f'Could not open the leaderboard: {e}')
+                if connection is not None:
+                    connection.close()
+                connection = None
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                kind, data = job
+                if kind == 'scores':
+                    atomic_write_text(self.scores_file, json.dumps(data, indent=4))
+                elif connection is not None:
+                    with connection:
+                        connection.execute(UPSERT_SESSION, data)
+                else:
+                    continue
+                self.writes += 1
+            except (OSError, sqlite3.Error) as e:
+                print(f'Could not save scores: {e}')
+            finally:
+                self.jobs.task_done()
+                if job is None and connection is not None:
+                    connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the leaderboard in WAL mode.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.leaderboard_file)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def top_scores(self, limit: int = 10) -> list:
+        """
+        Get the best sessions across all players. Not meant for every frame.
+
+        Args:
+            limit (int): Maximum number of sessions.
+
+        Returns:
+            list: Session dicts, highest score first.
+        """
+        return self._query(
+            'SELECT * FROM sessions ORDER BY score DESC LIMIT ?', (limit,))
+
+    def history(self, player: str, limit: int = 20) -> list:
+        """
+        Get a player's sessions, most recent first. Not meant for every frame.
+
+        Args:
+            player (str): The player name.
+            limit (int): Maximum number of sessions.
+
+        Returns:
+            list: Session dicts.
+        """
+        return self._query(
+            'SELECT * FROM sessions WHERE player = ? ORDER BY started_at DESC LIMIT ?',
+            (player, limit))
+
+    def _query(self, sql: str, params: tuple) -> list:
+        """
+        Run a read-only leaderboard query on a short-lived connection.
+
+        Args:
+            sql (str): The query.
+            params (tuple): Its parameters.
+
+        Returns:
+            list: Matching rows as dicts, or an empty list without a readable
+                leaderboard.
+        """
+        if self.leaderboard_file is None or not self.leaderboard_file.exists():
+            return []
+        connection = None
+        try:
+            connection = self._connect()
+            return [dict(row) for row in connection.execute(sql, params)]
+        except sqlite3.Error:
+            return []
+        finally:
+            if connection is not None:
+                connection.close()
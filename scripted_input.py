@@ -0,0 +1,139 @@
+"""
+scripted_input.py
+
+This module defines the ScriptedInput class, an input source that replays a
+fixed schedule of Pygame events by game tick. It replaces the live event queue
+when the game runs headless, so simulations are repeatable.
+"""
+
+import pygame
+from collections import defaultdict
+
+
+class ScriptedInput:
+    """
+    A schedule of input events keyed by the tick they should be handled on.
+
+    The builder methods return the instance so a script can be chained, e.g.
+    `ScriptedInput().click(0, pos).hold(1, 120, pygame.K_RIGHT)`.
+
+    Attributes:
+        events (defaultdict): Lists of pygame events keyed by tick.
+    """
+
+    def __init__(self, events=()):
+        """
+        Initialize the schedule.
+
+        Args:
+            events (Iterable[Tuple[int, pygame.event.Event]]): Initial
+                (tick, event) pairs.
+        """
+        self.events = defaultdict(list)
+        for tick, event in events:
+            self.events[tick].append(event)
+
+    def add(self, tick: int, event: pygame.event.Event) -> 'ScriptedInput':
+        """
+        Schedule an event.
+
+        Args:
+            tick (int): The tick the event is handled on.
+            event (pygame.event.Event): The event.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        self.events[tick].append(event)
+        return self
+
+    def key_down(self, tick: int, key: int) -> 'ScriptedInput':
+        """
+        Schedule a key press.
+
+        Args:
+            tick (int): The tick the key is pressed on.
+            key (int): The pygame key code.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        return self.add(tick, pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def key_up(self, tick: int, key: int) -> 'ScriptedInput':
+        """
+        Schedule a key release.
+
+        Args:
+            tick (int): The tick the key is released on.
+            key (int): The pygame key code.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        return self.add(tick, pygame.event.Event(pygame.KEYUP, key=key))
+
+    def tap(self, tick: int, key: int) -> 'ScriptedInput':
+        """
+        Schedule a key press followed by its release on the next tick.
+
+        Args:
+            tick (int): The tick the key is pressed on.
+            key (int): The pygame key code.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        return self.key_down(tick, key).key_up(tick + 1, key)
+
+    def hold(self, start: int, end: int, key: int) -> 'ScriptedInput':
+        """
+        Schedule a key held down from one tick until another.
+
+        Args:
+            start (int): The tick the key is pressed on.
+            end (int): The tick the key is released on.
+            key (int): The pygame key code.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        return self.key_down(start, key).key_up(end, key)
+
+    def click(self, tick: int, pos) -> 'ScriptedInput':
+        """
+        Schedule a left mouse click.
+
+        Args:
+            tick (int): The tick the click is handled on.
+            pos (Tuple[int, int]): The click position.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        return self.add(tick, pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, pos=tuple(pos), button=1))
+
+    def quit(self, tick: int) -> 'ScriptedInput':
+        """
+        Schedule a window close, which ends the game loop.
+
+        Args:
+            tick (int): The tick the game stops on.
+
+        Returns:
+            ScriptedInput: This schedule.
+        """
+        return self.add(tick, pygame.event.Event(pygame.QUIT))
+
+    def get_events(self, tick: int) -> list:
+        """
+        Get the events scheduled for a tick.
+
+        Args:
+            tick (int): The current tick.
+
+        Returns:
+            list: The events to handle, in the order they were scheduled.
+        """
+        return self.events.get(tick, [])
@@ -16,10 +16,33 @@ class Settings:
         name (str): The name of the game window.
         screen_w (int): Screen width in pixels.
         screen_h (int): Screen height in pixels.
-        FPS (int): Frames per second (frame rate).
+        FPS (int): Frames per second (render frame rate cap).
+        sim_rate (int): Simulation steps per second, independent of FPS.
+        speed_reference_rate (int): Speeds are given in pixels per 1/speed_reference_rate seconds.
+        max_frame_time (float): Longest frame, in seconds, the simulation catches up on.
+        interpolate (bool): Draw sprites between the last two simulation steps.
+        respawn_pause (float): Seconds the simulation holds after a life is lost.
         bg_file (Path): File path to the background image.
         difficulty_scale (float): Multiplier to increase difficulty over time.
         scores_file (Path): File path to the saved scores JSON file.
+        score_milestone (int): Points between background saves of the scores during a game.
+        player_name (str): Name the player's sessions are recorded under in the leaderboard.
+        leaderboard_enabled (bool): Record every session in the SQLite leaderboard.
+        leaderboard_file (Path): File path to the SQLite leaderboard database.
+        record_input (bool): Record the handled input so the session can be replayed.
+        input_log_file (Path): File path the input log is written to on exit.
+        asset_cache_capacity (int): Maximum number of scaled surfaces kept in the asset cache.
+        premultiply_alpha (bool): Prepare sprite art with pre-multiplied alpha.
+        asset_bundle_file (Path): File path to the prebuilt asset bundle, used when it exists.
+        asset_bundle_levels (int): Levels whose alien and bullet sizes are prebuilt into the bundle.
+        dirty_rendering (bool): Update only the changed screen areas instead of flipping.
+        dirty_area_threshold (float): Fraction of the screen above which a full flip is used.
+        fleet_render_mode (str): 'sprites' to blit each alien, 'composite' for one fleet blit.
+        profile_frames (bool): Time each phase of every frame with a FrameProfiler.
+        profile_capacity (int): Number of recent frames the profiler keeps.
+        profile_overlay (bool): Show p50/p99 frame times in the HUD while profiling.
+        profile_overlay_interval (int): Frames between overlay text refreshes.
+        profile_trace_file (Path): File path the Chrome trace is written to on exit.
 
         ship_file (Path): File path to the ship image.
         ship_w (int): Ship width.
@@ -28,11 +51,17 @@ class Settings:
         bullet_file (Path): File path to the bullet image.
         laser_sound (Path): File path to the laser sound.
         impact_sound (Path): File path to the impact sound.
+        audio_volume (float): Volume of the sound effects, from 0 to 1.
+        audio_channels (dict): Reserved mixer channels per effect, which caps its simultaneous plays.
+        audio_fadeouts (dict): Fade-out length in milliseconds per effect.
 
         alien_file (Path): File path to the alien image.
         alien_w (int): Alien width.
         alien_h (int): Alien height.
         fleet_direction (int): Initial direction of alien fleet movement.
+        fleet_base_width (int): Aliens in the widest row of the triangle formation.
+        fleet_backend (str): 'sprites' for one Sprite per alien, 'numpy' for the array-backed SwarmFleet.
+        fleet_grid_cell (int): Cell size in pixels of the fleet's collision grid.
 
         button_w (int): Button width.
         button_h (int): Button height.
@@ -40,6 +69,7 @@ class Settings:
         text_color (tuple): RGB color of the text.
         button_font_size (int): Font size for button text.
         HUD_font_size (int): Font size for HUD text.
+        HUD_text_cache_capacity (int): Maximum number of rendered HUD strings kept.
         font_file (Path): File path to the font used in HUD and UI.
 
     Dynamic Settings (set in `initialize__dynamic_settings`):
@@ -54,6 +84,13 @@ class Settings:
         alien_points (int): Points awarded per alien destroyed.
     """
 
+    # Settings that change during a game, saved in game snapshots.
+    STATE_FIELDS = (
+        'ship_speed', 'starting_ship_count', 'bullet_speed', 'bullet_w', 'bullet_h',
+        'bullet_amount', 'fleet_speed', 'fleet_drop_speed', 'alien_points',
+        'alien_w', 'alien_h',
+    )
+
     def __init__(self):
         """
         Initialize static settings for the game.
@@ -62,9 +99,32 @@ class Settings:
         self.screen_w = 1265
         self.screen_h = 625
         self.FPS = 60
-        self.bg_file = Path.cwd() / 'Assets' / 'images' / 'mybackground.png'
+        self.sim_rate = 120
+        self.speed_reference_rate = 60
+        self.max_frame_time = 0.25
+        self.interpolate = True
+        self.respawn_pause = 0.5
+        self.bg_file = Path.cwd() / 'Assets' / 'images' / 'Starbasesnow.png'
         self.difficulty_scale = 1.1
         self.scores_file = Path.cwd() / 'Assets' / 'file' / 'scores.json'
+        self.score_milestone = 500
+        self.player_name = 'Player'
+        self.leaderboard_enabled = False
+        self.leaderboard_file = Path.cwd() / 'Assets' / 'file' / 'leaderboard.sqlite3'
+        self.record_input = False
+        self.input_log_file = Path.cwd() / 'Assets' / 'file' / 'input.ailog'
+        self.asset_cache_capacity = 32
+        self.premultiply_alpha = False
+        self.asset_bundle_file = Path.cwd() / 'Assets' / 'assets.bundle'
+        self.asset_bundle_levels = 30
+        self.dirty_rendering = False
+        self.dirty_area_threshold = 0.5
+        self.fleet_render_mode = 'sprites'
+        self.profile_frames = False
+        self.profile_capacity = 600
+        self.profile_overlay = False
+        self.profile_overlay_interval = 30
+        self.profile_trace_file = Path.cwd() / 'Assets' / 'file' / 'frame_trace.json'
 
         self.ship_file = Path.cwd() / 'Assets' / 'images' / 'myship.png'
         self.ship_w = 30
@@ -73,11 +133,17 @@ class Settings:
         self.bullet_file = Path.cwd() / 'Assets' / 'images' / 'mybeam.png'
         self.laser_sound = Path.cwd() / 'Assets' / 'sound' / 'laser6.mp3'
         self.impact_sound = Path.cwd() / 'Assets' / 'sound' / 'mechanical_explosion.mp3'
+        self.audio_volume = 0.3
+        self.audio_channels = {'laser': 4, 'impact': 4}
+        self.audio_fadeouts = {'laser': 250, 'impact': 500}
 
         self.alien_file = Path.cwd() / 'Assets' / 'images' / 'myalien.png'
         self.alien_w = 40
         self.alien_h = 40
         self.fleet_direction = 1
+        self.fleet_base_width = 17
+        self.fleet_backend = 'sprites'
+        self.fleet_grid_cell = 64
 
         self.button_w = 200
         self.button_h = 50
@@ -86,6 +152,7 @@ class Settings:
         self.text_color = (255, 255, 255)
         self.button_font_size = 40
         self.HUD_font_size = 20
+        self.HUD_text_cache_capacity = 64
         self.font_file = Path.cwd() / 'Assets' / 'Fonts' / 'MajorMonoDisplay-Regular.ttf'
 
     def initialize__dynamic_settings(self):
@@ -115,3 +182,30 @@ class Settings:
         self.fleet_speed += self.difficulty_scale
         self.alien_w -= self.difficulty_scale
         self.alien_h -= self.difficulty_scale
+
+    def get_state(self) -> tuple:
+        """
+        Get the settings that change during a game, for a snapshot: the
+        dynamic settings and the alien size, which `increase_difficulty` shrinks.
+
+        Returns:
+            tuple: The values of `STATE_FIELDS`.
+        """
+        return tuple(getattr(self, name) for name in self.STATE_FIELDS)
+
+    def set_state(self, state: tuple):
+        """
+        Restore the settings that change during a game from a snapshot.
+
+        Args:
+            state (tuple): Values from `get_state`.
+        """
+        for name, value in zip(self.STATE_FIELDS, state):
+            setattr(self, name, value)
+
+    @property
+    def step_scale(self) -> float:
+        """
+        float: Factor converting a speed into distance moved per simulation step.
+        """
+        return self.speed_reference_rate / self.sim_rate
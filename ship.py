@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
     from arsenal import Arsenal
+    from alien_fleet import AlienFleet
 
 class Ship:
     """
@@ -22,8 +23,10 @@ class Ship:
         screen (pygame.Surface): Game display surface.
         boundaries (pygame.Rect): Screen boundaries for movement limits.
         image (pygame.Surface): The ship sprite image.
+        blend_flags (int): Blit flags matching the image's alpha mode.
         rect (pygame.Rect): The position and size of the ship.
         x (float): Floating-point x position for smooth movement.
+        prev_x (float): `x` at the start of the last simulation step, for interpolation.
         moving_right (bool): Whether the ship is moving right.
         moving_left (bool): Whether the ship is moving left.
         arsenal (Arsenal): Object managing bullets fired by the ship.
@@ -42,10 +45,11 @@ class Ship:
         self.screen = game.screen
         self.boundaries = self.screen.get_rect()
 
-        self.image = pygame.image.load(self.settings.ship_file)
-        self.image = pygame.transform.scale(
-            self.image, (self.settings.ship_w, self.settings.ship_h)
+        self.image = game.assets.get_image(
+            self.settings.ship_file, (self.settings.ship_w, self.settings.ship_h),
+            game.assets.alpha_mode
         )
+        self.blend_flags = game.assets.blend_flags
 
         self.rect = self.image.get_rect()
         self._center_ship()
@@ -59,6 +63,7 @@ class Ship:
         """
         self.rect.midbottom = self.boundaries.midbottom
         self.x = float(self.rect.x)
+        self.prev_x = self.x
 
     def update(self):
         """
@@ -71,7 +76,8 @@ class Ship:
         """
         Adjust the ship's horizontal position based on movement flags.
         """
-        temp_speed = self.settings.ship_speed
+        self.prev_x = self.x
+        temp_speed = self.settings.ship_speed * self.settings.step_scale
         if self.moving_right and self.rect.right < self.boundaries.right:
             self.x += temp_speed
         if self.moving_left and self.rect.left > self.boundaries.left:
@@ -79,12 +85,29 @@ class Ship:
 
         self.rect.x = self.x
 
+    def get_blits(self, alpha: float = 1.0) -> list:
+        """
+        Build the blit sequence for the ship itself.
+
+        Args:
+            alpha (float): How far between the previous and current simulation
+                step to draw the ship, from 0 to 1.
+
+        Returns:
+            list: A single (image, rect, area, special_flags) tuple.
+        """
+        rect = self.rect
+        if alpha < 1.0:
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            rect = rect.move(round(x) - rect.x, 0)
+        return [(self.image, rect, None, self.blend_flags)]
+
     def draw(self):
         """
         Draw the ship and all active bullets to the screen.
         """
         self.arsenal.draw()
-        self.screen.blit(self.image, self.rect)
+        self.screen.blit(self.image, self.rect, special_flags=self.blend_flags)
 
     def fire(self) -> bool:
         """
@@ -95,17 +118,36 @@ class Ship:
         """
         return self.arsenal.fire_bullet()
 
-    def check_collisions(self, other_group) -> bool:
+    def get_state(self) -> tuple:
+        """
+        Get the ship's simulation state for a snapshot.
+
+        Returns:
+            tuple: x, prev_x, moving_right and moving_left.
+        """
+        return self.x, self.prev_x, self.moving_right, self.moving_left
+
+    def set_state(self, state: tuple):
+        """
+        Restore the ship from a snapshot.
+
+        Args:
+            state (tuple): Values from `get_state`.
+        """
+        self.x, self.prev_x, self.moving_right, self.moving_left = state
+        self.rect.x = self.x
+
+    def check_collisions(self, fleet: 'AlienFleet') -> bool:
         """
-        Check for collisions between the ship and another sprite group (e.g., alien fleet).
+        Check for collisions between the ship and the alien fleet.
 
         Args:
-            other_group (pygame.sprite.Group): The group to check collisions against.
+            fleet (AlienFleet): The fleet to check collisions against.
 
         Returns:
             bool: True if a collision occurred and ship was recentered, False otherwise.
         """
-        if pygame.sprite.spritecollideany(self, other_group):
+        if fleet.collide_rect(self.rect):
             self._center_ship()
             return True
         return False
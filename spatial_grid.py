@@ -0,0 +1,121 @@
+"""
+spatial_grid.py
+
+This module defines the SpatialGrid class, a uniform-grid spatial index used as
+a collision broadphase. Items are bucketed by the grid cells their rects cover,
+so a query only has to test the items in the cells it overlaps.
+"""
+
+from collections import defaultdict
+
+
+class SpatialGrid:
+    """
+    A uniform grid of items keyed by the cells their rects overlap.
+
+    The grid does not move items itself. A rigid group such as the alien fleet
+    can store rects in its own local coordinates and translate queries instead,
+    so moving the whole group costs nothing.
+
+    Attributes:
+        cell_size (int): Width and height of a grid cell in pixels.
+        cells (defaultdict): Lists of items keyed by (column, row).
+        item_cells (dict): The cell keys each item was inserted into.
+        order (dict): Insertion sequence number of each item.
+    """
+
+    def __init__(self, cell_size: int):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.item_cells = {}
+        self.order = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self.item_cells)
+
+    def _cell_keys(self, rect) -> list:
+        """
+        List the cells a rect overlaps.
+
+        Args:
+            rect (pygame.Rect): The area to cover.
+
+        Returns:
+            list: (column, row) keys.
+        """
+        size = self.cell_size
+        left = rect.left // size
+        right = (rect.right - 1) // size
+        top = rect.top // size
+        bottom = (rect.bottom - 1) // size
+        return [(column, row)
+                for column in range(left, right + 1)
+                for row in range(top, bottom + 1)]
+
+    def insert(self, item, rect):
+        """
+        Add an item covering the given rect.
+
+        Args:
+            item (Hashable): The item to index.
+            rect (pygame.Rect): The area the item covers.
+        """
+        keys = self._cell_keys(rect)
+        for key in keys:
+            self.cells[key].append(item)
+        self.item_cells[item] = keys
+        self.order[item] = self._next_order
+        self._next_order += 1
+
+    def remove(self, item):
+        """
+        Remove an item from every cell it was inserted into.
+
+        Args:
+            item (Hashable): The item to remove. Unknown items are ignored.
+        """
+        keys = self.item_cells.pop(item, None)
+        if keys is None:
+            return
+        del self.order[item]
+        for key in keys:
+            bucket = self.cells[key]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[key]
+
+    def clear(self):
+        """
+        Remove every item from the grid.
+        """
+        self.cells.clear()
+        self.item_cells.clear()
+        self.order.clear()
+        self._next_order = 0
+
+    def query(self, rect) -> list:
+        """
+        Find the items stored in the cells a rect overlaps.
+
+        This is a broadphase: callers still need an exact overlap test.
+
+        Args:
+            rect (pygame.Rect): The area to search.
+
+        Returns:
+            list: Candidate items in insertion order, without duplicates.
+        """
+        cells = self.cells
+        found = set()
+        for key in self._cell_keys(rect):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
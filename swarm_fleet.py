@@ -0,0 +1,386 @@
+"""
+swarm_fleet.py
+
+This module defines the SwarmFleet class, a NumPy-backed alternative to
+AlienFleet for very large formations. Alien positions, sizes and alive flags
+are stored in arrays, so movement, edge detection, dropping, bottom checks and
+bullet collisions run as vectorized operations instead of per-sprite Python.
+"""
+
+import numpy as np
+import pygame
+from pygame.sprite import Sprite
+from alien_fleet import AlienFleet
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+class SwarmAlien(Sprite):
+    """
+    A lightweight sprite view of one alien stored in a SwarmFleet.
+
+    Views are created on demand, for example as collision dictionary keys or
+    when code iterates the fleet, and are not updated as the fleet moves.
+
+    Attributes:
+        index (int): Position of the alien in the fleet arrays.
+        image (pygame.Surface): The shared alien image.
+        blend_flags (int): Blit flags matching the image's alpha mode.
+        rect (pygame.Rect): The alien's rect when the view was created.
+    """
+
+    def __init__(self, swarm: 'SwarmFleet', index: int):
+        """
+        Initialize a view of one alien.
+
+        Args:
+            swarm (SwarmFleet): The fleet holding the alien's data.
+            index (int): Position of the alien in the fleet arrays.
+        """
+        super().__init__()
+        self.index = index
+        self.image = swarm.image
+        self.blend_flags = swarm.blend_flags
+        self.rect = pygame.Rect(int(swarm.x[index]), int(swarm.y[index]),
+                                int(swarm.w[index]), int(swarm.h[index]))
+
+class AlienArray:
+    """
+    A sprite-group-like view of the living aliens in a SwarmFleet.
+
+    It supports `len`, truth testing, iteration and `empty()`, so code written
+    against `pygame.sprite.Group` keeps working with the array backend.
+
+    Attributes:
+        swarm (SwarmFleet): The fleet this view reads from.
+    """
+
+    def __init__(self, swarm: 'SwarmFleet'):
+        """
+        Initialize the view.
+
+        Args:
+            swarm (SwarmFleet): The fleet this view reads from.
+        """
+        self.swarm = swarm
+
+    def __len__(self) -> int:
+        return self.swarm.alive_count
+
+    def __bool__(self) -> bool:
+        return self.swarm.alive_count > 0
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def sprites(self) -> list:
+        """
+        Build views of every living alien.
+
+        Returns:
+            list: SwarmAlien views in creation order.
+        """
+        return [SwarmAlien(self.swarm, int(index))
+                for index in np.flatnonzero(self.swarm.alive)]
+
+    def empty(self):
+        """
+        Remove every alien from the fleet.
+        """
+        self.swarm.alive[:] = False
+        self.swarm.alive_count = 0
+
+class SwarmFleet(AlienFleet):
+    """
+    Manages a fleet of aliens stored as NumPy arrays.
+
+    The public API matches AlienFleet, so the game can use either backend.
+    Unlike AlienFleet, `create_fleet` replaces the current formation instead of
+    adding to it, and the fleet is always drawn one alien at a time.
+
+    Attributes:
+        fleet (AlienArray): Group-like view of the living aliens.
+        image (pygame.Surface | None): The alien image shared by the fleet.
+        blend_flags (int): Blit flags matching the image's alpha mode.
+        origin_x (np.ndarray): Horizontal position each alien was created at.
+        origin_y (np.ndarray): Vertical position each alien was created at.
+        x (np.ndarray): Current horizontal rect position of each alien.
+        y (np.ndarray): Current vertical rect position of each alien.
+        w (np.ndarray): Width of each alien.
+        h (np.ndarray): Height of each alien.
+        alive (np.ndarray): Whether each alien is still in the fleet.
+        alive_count (int): Number of living aliens.
+    """
+
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initialize the swarm fleet.
+
+        Args:
+            game (AlienInvasion): The game instance managing settings and screen.
+        """
+        self.image = None
+        self.blend_flags = 0
+        super().__init__(game)
+        self.fleet = AlienArray(self)
+        self.render_mode = 'sprites'
+
+    def _set_arrays(self, x, y, alien_w: int, alien_h: int):
+        """
+        Replace the fleet arrays with a new formation.
+
+        Args:
+            x (np.ndarray): Horizontal rect positions.
+            y (np.ndarray): Vertical rect positions.
+            alien_w (int): Width of every alien.
+            alien_h (int): Height of every alien.
+        """
+        count = len(x)
+        self.origin_x = x
+        self.origin_y = y
+        self.x = x.copy()
+        self.y = y.copy()
+        self.w = np.full(count, alien_w, dtype=np.int64)
+        self.h = np.full(count, alien_h, dtype=np.int64)
+        self.alive = np.ones(count, dtype=bool)
+        self.alive_count = count
+
+    def _create_triangle_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
+        """
+        Create a triangle-shaped formation of aliens as arrays.
+
+        Positions are rounded the same way assigning floats to a `pygame.Rect`
+        rounds them, so the layout matches AlienFleet pixel for pixel.
+
+        Args:
+            alien_w (int): Width of each alien.
+            alien_h (int): Height of each alien.
+            fleet_w (int): Number of aliens in a row at the widest point.
+            fleet_h (int): Number of rows.
+            x_offset (int): Horizontal margin offset.
+            y_offset (int): Vertical margin offset.
+        """
+        triangle_base_width = self.settings.fleet_base_width
+        rows = np.arange((triangle_base_width + 1) // 2)
+        aliens_in_row = triangle_base_width - 2 * rows
+        row = np.repeat(rows, aliens_in_row)
+        row_start = np.cumsum(aliens_in_row) - aliens_in_row
+        column = np.arange(len(row)) - np.repeat(row_start, aliens_in_row)
+
+        start_x = (self.settings.screen_w - aliens_in_row * alien_w) // 2
+        x = start_x[row] + column * alien_w
+        y = y_offset + row * alien_h
+
+        assets = self.game.assets
+        self.image = assets.get_image(self.settings.alien_file,
+                (alien_w, alien_h), assets.alpha_mode
+                )
+        self.blend_flags = assets.blend_flags
+        image_w, image_h = self.image.get_size()
+        self._set_arrays(self._round_half_away(x), self._round_half_away(y),
+                         image_w, image_h)
+
+    @staticmethod
+    def _round_half_away(values) -> np.ndarray:
+        """
+        Round to whole pixels, halves away from zero, like `pygame.Rect`.
+
+        Args:
+            values (np.ndarray): Float positions.
+
+        Returns:
+            np.ndarray: Integer positions.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+    def _index_fleet(self):
+        """
+        Skip the collision grid; the array backend tests collisions directly.
+        """
+
+    def _check_fleet_edges(self):
+        """
+        Reverse and drop the fleet if any living alien touches a screen edge.
+        """
+        if not self.alive_count:
+            return
+        alive = self.alive
+        x = self.x[alive]
+        if ((x + self.w[alive] >= self.settings.screen_w).any()
+                or (x <= 0).any()):
+            self._drop_alien_fleet()
+            self.fleet_direction *= -1
+
+    def _drop_alien_fleet(self):
+        """
+        Drop the entire fleet downward when hitting the screen edge.
+        """
+        self.drop += self.fleet_drop_speed
+        self.y += self.fleet_drop_speed
+
+    def update_fleet(self):
+        """
+        Update fleet position and check for edge collisions.
+        """
+        self._check_fleet_edges()
+        self.prev_shift = self.shift
+        self.shift += self.settings.fleet_speed * self.settings.step_scale * self.fleet_direction
+        self.shift_px = round(self.shift)
+        np.add(self.origin_x, self.shift_px, out=self.x)
+
+    def get_blits(self, alpha: float = 1.0) -> list:
+        """
+        Build the blit sequence for every living alien.
+
+        Args:
+            alpha (float): How far between the previous and current simulation
+                step to draw the fleet, from 0 to 1.
+
+        Returns:
+            list: (image, dest, area, special_flags) tuples for `Surface.blits`.
+        """
+        alive = self.alive
+        image = self.image
+        flags = self.blend_flags
+        x = self.x[alive] + self._interpolated_dx(alpha)
+        return [(image, dest, None, flags)
+                for dest in zip(x.tolist(), self.y[alive].tolist())]
+
+    def _overlaps(self, index, rects):
+        """
+        Test aliens against rects with the same rules as `Rect.colliderect`.
+
+        Args:
+            index (np.ndarray): Indices of the aliens to test.
+            rects (np.ndarray): (count, 4) array of x, y, width, height.
+
+        Returns:
+            np.ndarray: Boolean matrix, one row per alien and one column per rect.
+        """
+        ax = self.x[index][:, None]
+        ay = self.y[index][:, None]
+        aw = self.w[index][:, None]
+        ah = self.h[index][:, None]
+        bx, by, bw, bh = rects.T
+        return ((ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+                & (aw > 0) & (ah > 0) & (bw > 0) & (bh > 0))
+
+    def collide_rect(self, rect):
+        """
+        Find the first living alien overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): The area to test, in screen coordinates.
+
+        Returns:
+            SwarmAlien | None: A view of the colliding alien, or None.
+        """
+        if not self.alive_count:
+            return None
+        index = np.flatnonzero(self.alive)
+        overlap = self._overlaps(index, np.array([tuple(rect)]))[:, 0]
+        if not overlap.any():
+            return None
+        return SwarmAlien(self, int(index[overlap.argmax()]))
+
+    def check_collisions(self, other_group):
+        """
+        Detect and process collisions with another sprite group.
+
+        Matches `pygame.sprite.groupcollide(fleet, other_group, True, True)`:
+        each colliding sprite is credited to the first living alien it overlaps,
+        and both are removed.
+
+        Args:
+            other_group (pygame.sprite.Group): The group to check collisions against.
+
+        Returns:
+            dict: SwarmAlien views mapped to the sprites that hit them.
+        """
+        sprites = other_group.sprites()
+        if not sprites or not self.alive_count:
+            return {}
+
+        index = np.flatnonzero(self.alive)
+        overlap = self._overlaps(index, np.array([tuple(sprite.rect) for sprite in sprites]))
+        hit = overlap.any(axis=0)
+        if not hit.any():
+            return {}
+
+        first_alien = index[overlap.argmax(axis=0)]
+        hits = {}
+        for sprite_index in np.flatnonzero(hit):
+            alien_index = int(first_alien[sprite_index])
+            hits.setdefault(alien_index, []).append(sprites[sprite_index])
+
+        collisions = {}
+        for alien_index in sorted(hits):
+            collisions[SwarmAlien(self, alien_index)] = hits[alien_index]
+            self.alive[alien_index] = False
+            for sprite in hits[alien_index]:
+                sprite.kill()
+        self.alive_count -= len(hits)
+        return collisions
+
+    def get_state(self) -> tuple:
+        """
+        Get the fleet's simulation state for a snapshot.
+
+        Returns:
+            tuple: fleet_direction, shift, shift_px, prev_shift, drop, the
+                formation's alien width and height, its alien count and a
+                bitmask of the living aliens.
+        """
+        return (self.fleet_direction, self.shift, self.shift_px, self.prev_shift,
+                self.drop, *self.formation, len(self.alive),
+                np.packbits(self.alive, bitorder='little').tobytes())
+
+    def set_state(self, state: tuple):
+        """
+        Restore the fleet from a snapshot.
+
+        The arrays are reused; the formation is only rebuilt when the
+        snapshot's formation has a different alien size.
+
+        Args:
+            state (tuple): Values from `get_state`.
+
+        Raises:
+            ValueError: If the snapshot's formation has a different alien count.
+        """
+        direction, shift, shift_px, prev_shift, drop, alien_w, alien_h, count, mask = state
+        if self.formation != (alien_w, alien_h):
+            self.create_fleet((alien_w, alien_h))
+        if count != len(self.alive):
+            raise ValueError(f'Snapshot has {count} aliens, the formation has {len(self.alive)}')
+        self.fleet_direction = direction
+        self.shift = shift
+        self.shift_px = shift_px
+        self.prev_shift = prev_shift
+        self.drop = drop
+        self.alive[:] = np.unpackbits(np.frombuffer(mask, dtype=np.uint8),
+                                      count=count, bitorder='little')
+        self.alive_count = int(np.count_nonzero(self.alive))
+        np.add(self.origin_x, shift_px, out=self.x)
+        np.add(self.origin_y, drop, out=self.y)
+
+    def check_fleet_bottom(self) -> bool:
+        """
+        Check if any living alien has reached the bottom of the screen.
+
+        Returns:
+            bool: True if any alien touches the bottom; False otherwise.
+        """
+        alive = self.alive
+        return bool((self.y[alive] + self.h[alive] >= self.settings.screen_h).any())
+
+    def check_destroyed_status(self) -> bool:
+        """
+        Check if the entire fleet has been destroyed.
+
+        Returns:
+            bool: True if no aliens are alive; False otherwise.
+        """
+        return self.alive_count == 0
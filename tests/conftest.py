@@ -0,0 +1,25 @@
+"""
+conftest.py
+
+Shared pytest setup: the game runs on the SDL dummy drivers, imports from the
+project root, and resolves its Assets paths from there.
+"""
+
+import os
+import sys
+from pathlib import Path
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    """
+    Run each test from the project root, since Settings paths are relative to it.
+    """
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,67 @@
+"""
+test_asset_bundle.py
+
+Tests that a bundle built from the default Settings serves the game's images
+and sounds, and that frames drawn from it match frames drawn from decoded files.
+"""
+
+import hashlib
+import pygame
+from alien_invasion import AlienInvasion
+from asset_bundle import build_bundle, get_bundle_keys
+from scripted_input import ScriptedInput
+from settings import Settings
+
+TICKS = 300
+
+
+def play(bundle_file) -> list:
+    """
+    Play a scripted session, drawing after every tick.
+
+    Args:
+        bundle_file (Path): The asset bundle the game should look for.
+
+    Returns:
+        list: A digest of the screen after each frame.
+    """
+    settings = Settings()
+    settings.asset_bundle_file = bundle_file
+    source = ScriptedInput()
+    game = AlienInvasion(input_source=source, settings=settings, seed=1)
+    assert (game.bundle is not None) == bundle_file.exists()
+    source.click(0, game.play_button.rect.center)
+    source.hold(1, TICKS, pygame.K_RIGHT)
+    for tick in range(1, TICKS, 10):
+        source.tap(tick, pygame.K_SPACE)
+
+    digests = []
+    for _ in range(TICKS):
+        game.step()
+        game._update_screen()
+        digests.append(hashlib.md5(pygame.image.tobytes(game.screen, 'RGB')).digest())
+    if game.bundle is not None:
+        assert game.assets.bundled > 0
+        assert game.assets.loads == 0
+    # Stop the sound thread before the mixer goes away.
+    game.audio.close()
+    pygame.quit()
+    return digests
+
+
+def test_bundled_frames_match_decoded_frames(tmp_path):
+    settings = Settings()
+    settings.initialize__dynamic_settings()
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.mixer.init()
+    bundle_file = tmp_path / 'assets.bundle'
+    result = build_bundle(settings, bundle_file)
+    pygame.quit()
+    assert result['images'] == len(get_bundle_keys(settings))
+    assert result['sounds'] == 2
+
+    decoded = play(tmp_path / 'missing.bundle')
+    bundled = play(bundle_file)
+    mismatches = [frame for frame, (a, b) in enumerate(zip(decoded, bundled)) if a != b]
+    assert not mismatches, f'first differing frame: {mismatches[0]}'
@@ -0,0 +1,42 @@
+"""
+test_asset_cache.py
+
+Tests that AssetCache decodes each file once and hands out one shared source
+surface, even when a loader thread preloads while the main thread builds
+surfaces from the same files.
+"""
+
+import threading
+from asset_cache import AssetCache
+from settings import Settings
+
+
+def test_concurrent_preload_decodes_each_file_once():
+    settings = Settings()
+    paths = [settings.bg_file, settings.ship_file, settings.alien_file, settings.bullet_file]
+    for _ in range(5):
+        cache = AssetCache()
+        start = threading.Barrier(3)
+        results = []
+
+        def load():
+            start.wait()
+            results.append([cache._load_source(str(path)) for path in paths])
+
+        def preload():
+            start.wait()
+            for path in paths:
+                cache.preload(path)
+
+        threads = [threading.Thread(target=load), threading.Thread(target=load),
+                   threading.Thread(target=preload)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.loads == len(paths)
+        assert sorted(cache.sources) == sorted(str(path) for path in paths)
+        for surfaces in results:
+            assert all(surface is cache.sources[str(path)]
+                       for surface, path in zip(surfaces, paths))
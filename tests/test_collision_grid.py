@@ -0,0 +1,92 @@
+"""
+test_collision_grid.py
+
+Tests that the fleet's spatial-grid collision broadphase finds exactly the
+hits the brute-force `pygame.sprite` scans find, for fleets of different sizes
+as they move and lose aliens.
+"""
+
+import random
+import pygame
+import pytest
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+
+def build_game(base_width: int, backend: str) -> AlienInvasion:
+    """
+    Create a headless game whose fleet is a triangle with the given widest row.
+
+    Args:
+        base_width (int): Aliens in the widest row of the formation.
+        backend (str): The fleet backend.
+
+    Returns:
+        AlienInvasion: The game.
+    """
+    settings = Settings()
+    settings.fleet_backend = backend
+    settings.fleet_base_width = base_width
+    settings.alien_w = settings.alien_h = min(40, settings.screen_w // base_width)
+    return AlienInvasion(headless=True, input_source=ScriptedInput(), settings=settings)
+
+
+def random_probes(fleet, rng: random.Random, count: int) -> pygame.sprite.Group:
+    """
+    Make bullet-like sprites scattered over and around the formation.
+    """
+    aliens = fleet.fleet.sprites()
+    area = aliens[0].rect.unionall([alien.rect for alien in aliens]).inflate(80, 80)
+    probes = pygame.sprite.Group()
+    for _ in range(count):
+        probe = pygame.sprite.Sprite()
+        probe.rect = pygame.Rect(rng.randrange(area.left, area.right),
+                                 rng.randrange(area.top, area.bottom),
+                                 rng.randrange(1, 40), rng.randrange(1, 70))
+        probes.add(probe)
+    return probes
+
+
+def identify(alien):
+    """
+    Identify an alien across calls: NumPy fleets return a new view each time,
+    so their aliens are compared by array index.
+    """
+    if alien is None:
+        return None
+    return getattr(alien, 'index', alien)
+
+
+@pytest.mark.parametrize('backend', ['sprites', 'numpy'])
+@pytest.mark.parametrize('base_width', [17, 63])
+def test_grid_matches_brute_force(base_width, backend):
+    rng = random.Random(base_width)
+    game = build_game(base_width, backend)
+    fleet = game.alien_fleet
+    ship = game.ship
+
+    for _ in range(40):
+        probes = random_probes(fleet, rng, 8)
+        expected = {probe: identify(pygame.sprite.spritecollideany(probe, fleet.fleet))
+                    for probe in probes}
+        expected = {probe: alien for probe, alien in expected.items() if alien is not None}
+        for probe, alien in expected.items():
+            assert identify(fleet.collide_rect(probe.rect)) == alien
+        ship_hit = identify(pygame.sprite.spritecollideany(ship, fleet.fleet))
+        assert identify(fleet.collide_rect(ship.rect)) == ship_hit
+
+        misses = [probe for probe in probes if probe not in expected]
+        hit_aliens = set(expected.values())
+        order = [identify(alien) for alien in fleet.fleet if identify(alien) in hit_aliens]
+        collisions = fleet.check_collisions(probes)
+        assert [identify(alien) for alien in collisions] == order
+        actual = {probe: identify(alien) for alien, hit in collisions.items() for probe in hit}
+        assert actual == expected
+        assert not hit_aliens & {identify(alien) for alien in fleet.fleet}
+        assert probes.sprites() == misses
+
+        for _ in range(rng.randrange(1, 60)):
+            fleet.update_fleet()
+        if not fleet.fleet:
+            break
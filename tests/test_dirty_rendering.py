@@ -0,0 +1,73 @@
+"""
+test_dirty_rendering.py
+
+Tests that dirty-rectangle rendering leaves the screen pixel-identical to full
+redraws, frame by frame, on the SDL dummy video driver.
+"""
+
+import hashlib
+import pygame
+import pytest
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+TICKS = 600
+
+
+def play(dirty: bool, render_mode: str) -> tuple:
+    """
+    Play a scripted session, drawing after every tick.
+
+    Args:
+        dirty (bool): Use dirty-rectangle rendering.
+        render_mode (str): The fleet render mode.
+
+    Returns:
+        tuple: A digest of the screen after each frame, and the number of
+            frames drawn with a partial update.
+    """
+    settings = Settings()
+    settings.dirty_rendering = dirty
+    # Never fall back to full redraws, so every dirty frame takes the partial path.
+    settings.dirty_area_threshold = 2.0
+    settings.fleet_render_mode = render_mode
+    settings.interpolate = False
+    source = ScriptedInput()
+    game = AlienInvasion(input_source=source, settings=settings, seed=1)
+    source.click(0, game.play_button.rect.center)
+    for start in range(1, TICKS, 240):
+        source.hold(start, start + 120, pygame.K_RIGHT)
+        source.hold(start + 120, start + 240, pygame.K_LEFT)
+    for tick in range(1, TICKS, 10):
+        source.tap(tick, pygame.K_SPACE)
+
+    renderer = game.renderer
+    render_full = renderer._render_full
+    full_frames = 0
+
+    def count_full(*args):
+        nonlocal full_frames
+        full_frames += 1
+        render_full(*args)
+
+    renderer._render_full = count_full
+    digests = []
+    for _ in range(TICKS):
+        game.step()
+        game._update_screen()
+        digests.append(hashlib.md5(pygame.image.tobytes(game.screen, 'RGB')).digest())
+    assert game.game_stats.score > 0
+    # Stop the sound thread before the mixer goes away.
+    game.audio.close()
+    pygame.quit()
+    return digests, TICKS - full_frames
+
+
+@pytest.mark.parametrize('render_mode', ['sprites', 'composite'])
+def test_dirty_frames_match_full_redraws(render_mode):
+    full, _ = play(False, render_mode)
+    dirty, partial_frames = play(True, render_mode)
+    assert partial_frames > TICKS // 2
+    mismatches = [frame for frame, (a, b) in enumerate(zip(full, dirty)) if a != b]
+    assert not mismatches, f'first differing frame: {mismatches[0]}'
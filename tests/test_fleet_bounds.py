@@ -0,0 +1,91 @@
+"""
+test_fleet_bounds.py
+
+Tests that the AlienFleet edge and bottom checks, which read the extents
+tracked by FleetBounds, give the same answers as the per-alien scans they
+replaced, while aliens are destroyed and the fleet is reset and levelled up.
+"""
+
+import random
+import pygame
+import pytest
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+
+def scan_edges(fleet) -> bool:
+    """
+    The original edge check: does any alien touch a screen edge?
+    """
+    return any(alien.check_edges() for alien in fleet.fleet)
+
+
+def scan_bottom(fleet) -> bool:
+    """
+    The original bottom check: does any alien touch the bottom of the screen?
+    """
+    return any(alien.rect.bottom >= fleet.settings.screen_h for alien in fleet.fleet)
+
+
+def pick_target(fleet, rng: random.Random):
+    """
+    Choose an alien to destroy: any alien, one from the lowest row to leave it
+    ragged, or one from an outer column.
+    """
+    aliens = fleet.fleet.sprites()
+    roll = rng.random()
+    if roll < 0.4:
+        lowest = max(alien.rect.bottom for alien in aliens)
+        aliens = [alien for alien in aliens if alien.rect.bottom == lowest]
+    elif roll < 0.6:
+        left = min(alien.rect.left for alien in aliens)
+        right = max(alien.rect.right for alien in aliens)
+        aliens = [alien for alien in aliens if alien.rect.left == left or alien.rect.right == right]
+    return rng.choice(aliens)
+
+
+def shoot(fleet, alien):
+    """
+    Destroy an alien through the fleet's collision path, as a bullet would.
+    """
+    probe = pygame.sprite.Sprite()
+    probe.rect = alien.rect.copy()
+    fleet.check_collisions(pygame.sprite.Group(probe))
+
+
+@pytest.mark.parametrize('base_width', [17, 16])
+@pytest.mark.parametrize('seed', range(3))
+def test_bounds_match_per_alien_scan(seed, base_width):
+    rng = random.Random(seed)
+    settings = Settings()
+    settings.fleet_base_width = base_width
+    game = AlienInvasion(headless=True, input_source=ScriptedInput(), settings=settings,
+                         seed=seed)
+    settings.fleet_speed = 8
+    fleet = game.alien_fleet
+    seen = {'edge': set(), 'bottom': set()}
+    resets = level_ups = 0
+
+    for tick in range(20_000):
+        at_edge = fleet._at_screen_edge()
+        at_bottom = fleet.check_fleet_bottom()
+        assert at_edge == scan_edges(fleet), f'edge check differs on tick {tick}'
+        assert at_bottom == scan_bottom(fleet), f'bottom check differs on tick {tick}'
+        seen['edge'].add(at_edge)
+        seen['bottom'].add(at_bottom)
+
+        if not fleet.fleet:
+            settings.increase_difficulty()
+            game._reset_level()
+            level_ups += 1
+        elif at_bottom:
+            game._reset_level()
+            resets += 1
+        else:
+            if rng.random() < 0.05:
+                shoot(fleet, pick_target(fleet, rng))
+            fleet.update_fleet()
+
+    assert seen == {'edge': {True, False}, 'bottom': {True, False}}
+    assert resets and level_ups
@@ -0,0 +1,62 @@
+"""
+test_frame_exporter.py
+
+Tests that exporting a recorded session gives the same raw video however the
+timeline is split into chunks, since each chunk starts from a snapshot taken
+during one replay.
+"""
+
+import hashlib
+import pygame
+from alien_invasion import AlienInvasion
+from frame_exporter import export_frames, split_frames
+from input_log import InputLog
+from scripted_input import ScriptedInput
+from settings import Settings
+
+TICKS = 720
+FPS = 10
+
+
+def record_session(path):
+    """
+    Record a short scripted session on a small screen.
+
+    Args:
+        path (Path): The input log to write.
+    """
+    settings = Settings()
+    settings.screen_w, settings.screen_h = 800, 500
+    source = ScriptedInput()
+    game = AlienInvasion(headless=True, input_source=source, settings=settings, seed=3)
+    game.recorder = InputLog(game.seed, game.settings)
+    source.click(0, game.play_button.rect.center)
+    for start in range(1, TICKS, 240):
+        source.hold(start, start + 120, pygame.K_LEFT)
+        source.hold(start + 120, start + 240, pygame.K_RIGHT)
+    for tick in range(1, TICKS, 9):
+        source.tap(tick, pygame.K_SPACE)
+    for _ in range(TICKS):
+        game.step()
+    assert game.game_stats.score > 0
+    game.recorder.save(path, TICKS)
+
+
+def test_split_frames_covers_every_frame():
+    assert split_frames(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert split_frames(2, 5) == [(0, 1), (1, 2)]
+
+
+def test_chunked_raw_export_matches_single_chunk(tmp_path):
+    log_path = tmp_path / 'session.ailog'
+    record_session(log_path)
+    digests = []
+    for chunks in (1, 3):
+        output = tmp_path / f'session{chunks}.rgb'
+        result = export_frames(log_path, output, 'raw', FPS, workers=chunks, chunks=chunks)
+        assert result['frames'] == TICKS * FPS // Settings().sim_rate
+        assert output.stat().st_size == result['frames'] * 800 * 500 * 3
+        assert list(tmp_path.glob('*.part*')) == []
+        digests.append(hashlib.sha256(output.read_bytes()).digest())
+        output.unlink()
+    assert digests[0] == digests[1]
@@ -0,0 +1,123 @@
+"""
+test_game_snapshot.py
+
+Tests that restoring a snapshot into a game on another level rebuilds the
+snapshot's formation, so play continues exactly as it did in the original game,
+through the next level clear.
+"""
+
+import pygame
+import pytest
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+OFFSET = 12
+MAX_TICKS = 10_000
+AFTER_CLEAR = 300
+
+
+def build_game(backend: str, source: ScriptedInput) -> AlienInvasion:
+    """
+    Create a headless game with the Play button clicked.
+
+    Args:
+        backend (str): The fleet backend.
+        source (ScriptedInput): The game's scripted input.
+
+    Returns:
+        AlienInvasion: The game.
+    """
+    settings = Settings()
+    settings.fleet_backend = backend
+    game = AlienInvasion(headless=True, input_source=source, settings=settings, seed=0)
+    source.click(0, game.play_button.rect.center)
+    return game
+
+
+def steer(game: AlienInvasion):
+    """
+    Pick the arrow key that moves the ship beside the lowest alien.
+
+    Args:
+        game (AlienInvasion): The game to read.
+
+    Returns:
+        int | None: The key to hold, or None to stand still.
+    """
+    aliens = game.alien_fleet.fleet.sprites()
+    if not aliens:
+        return None
+    target = max(aliens, key=lambda alien: (alien.rect.bottom, -alien.rect.x))
+    dx = target.rect.centerx + OFFSET - game.ship.rect.centerx
+    if abs(dx) < 4:
+        return None
+    return pygame.K_RIGHT if dx > 0 else pygame.K_LEFT
+
+
+def observe(game: AlienInvasion) -> tuple:
+    """
+    Collect the state a restored game must reproduce, including alien sizes.
+    """
+    stats = game.game_stats
+    aliens = sorted(tuple(alien.rect) for alien in game.alien_fleet.fleet.sprites())
+    return stats.score, stats.level, stats.ships_left, game.game_active, aliens
+
+
+def play_through_level_clear(backend: str) -> tuple:
+    """
+    Play until the second level is cleared, then a little longer.
+
+    Returns:
+        tuple: The input script, the tick the second level was cleared on, and
+            a (snapshot, observation) pair after every tick.
+    """
+    source = ScriptedInput()
+    game = build_game(backend, source)
+    held = None
+    cleared = None
+    history = []
+    for tick in range(MAX_TICKS):
+        if tick:
+            key = steer(game)
+            if key != held:
+                if held is not None:
+                    source.key_up(tick, held)
+                if key is not None:
+                    source.key_down(tick, key)
+            if tick % 2:
+                source.tap(tick, pygame.K_SPACE)
+            held = key
+        game.step()
+        history.append((game.snapshot(), observe(game)))
+        if cleared is None and game.game_stats.level == 3:
+            cleared = tick
+        if cleared is not None and tick == cleared + AFTER_CLEAR:
+            break
+    assert cleared is not None, 'the second level was never cleared'
+    return source, cleared, history
+
+
+@pytest.mark.parametrize('backend', ['sprites', 'numpy'])
+def test_restore_into_later_level(backend):
+    source, cleared, history = play_through_level_clear(backend)
+    start = cleared - 20
+    snapshot, observation = history[start]
+    assert observation[1] == 2
+
+    later = build_game(backend, source)
+    for _ in range(3):
+        # Clear a level the way the game does: the next formation is built
+        # before the settings shrink the aliens.
+        later._reset_level()
+        later.settings.increase_difficulty()
+        later.game_stats.level += 1
+    assert later.alien_fleet.formation != (later.settings.alien_w, later.settings.alien_h)
+
+    later.restore(snapshot)
+    assert observe(later) == observation
+    for tick in range(start + 1, len(history)):
+        later.step()
+        snapshot, observation = history[tick]
+        assert observe(later) == observation, f'restored game differs on tick {tick}'
+        assert later.snapshot() == snapshot
@@ -0,0 +1,101 @@
+"""
+test_input_log.py
+
+Tests that input logs survive a save and load unchanged and that replaying a
+recorded session reproduces it exactly, up to the recorded end tick.
+"""
+
+import pygame
+from alien_invasion import AlienInvasion
+from input_log import CLICK, KEY_DOWN, KEY_UP, InputLog, replay
+from scripted_input import ScriptedInput
+from settings import Settings
+
+TICKS = 1500
+
+
+def record_session() -> tuple:
+    """
+    Play a scripted headless session while recording its handled input.
+
+    Returns:
+        tuple: The game's recorder and a snapshot of the game after every tick.
+    """
+    source = ScriptedInput()
+    game = AlienInvasion(headless=True, input_source=source, settings=Settings(), seed=7)
+    game.recorder = InputLog(game.seed, game.settings)
+    source.click(0, (0, 0))
+    source.click(3, game.play_button.rect.center)
+    for start in range(5, TICKS, 300):
+        source.hold(start, start + 150, pygame.K_LEFT)
+        source.hold(start + 150, start + 300, pygame.K_RIGHT)
+    for tick in range(5, TICKS, 7):
+        source.tap(tick, pygame.K_SPACE)
+
+    snapshots = [game.snapshot()]
+    for _ in range(TICKS):
+        game.step()
+        snapshots.append(game.snapshot())
+    assert game.game_stats.score > 0
+    return game.recorder, snapshots
+
+
+def test_save_and_load_round_trip(tmp_path):
+    settings = Settings()
+    settings.sim_rate = 240
+    settings.screen_w, settings.screen_h = 1024, 768
+    events = [
+        (0, CLICK, 1023 | 767 << 16),
+        (1, KEY_DOWN, pygame.K_RIGHT),
+        (1, KEY_DOWN, pygame.K_SPACE),
+        (2 ** 32 - 1, KEY_UP, pygame.K_RIGHT),
+    ]
+    path = tmp_path / 'session.ailog'
+    InputLog(2 ** 64 - 1, settings, events).save(path, 2 ** 32 - 1)
+
+    log = InputLog.load(path)
+    assert log.seed == 2 ** 64 - 1
+    assert log.events == events
+    assert log.end_tick == 2 ** 32 - 1
+    replay_settings = Settings()
+    log.configure(replay_settings)
+    assert replay_settings.sim_rate == 240
+    assert (replay_settings.screen_w, replay_settings.screen_h) == (1024, 768)
+
+    source = log.schedule(ScriptedInput())
+    click, = source.get_events(0)
+    assert (click.type, click.pos, click.button) == (pygame.MOUSEBUTTONDOWN, (1023, 767), 1)
+    assert [(event.type, event.key) for event in source.get_events(1)] == [
+        (pygame.KEYDOWN, pygame.K_RIGHT), (pygame.KEYDOWN, pygame.K_SPACE)]
+    release, = source.get_events(2 ** 32 - 1)
+    assert (release.type, release.key) == (pygame.KEYUP, pygame.K_RIGHT)
+
+
+def test_records_handled_events():
+    recorder, _ = record_session()
+    kinds = {kind for _, kind, _ in recorder.events}
+    assert kinds == {KEY_DOWN, KEY_UP, CLICK}
+    assert recorder.events[0] == (0, CLICK, 0)
+    assert [tick for tick, _, _ in recorder.events] == sorted(
+        tick for tick, _, _ in recorder.events)
+
+
+def test_replay_reproduces_the_session(tmp_path):
+    recorder, snapshots = record_session()
+    path = tmp_path / 'session.ailog'
+    recorder.save(path, TICKS)
+    game = replay(path)
+    assert game.tick == TICKS
+    assert game.snapshot() == snapshots[TICKS]
+
+
+def test_replay_stops_at_the_end_tick(tmp_path):
+    recorder, snapshots = record_session()
+    end_tick = TICKS // 2
+    assert any(tick >= end_tick for tick, _, _ in recorder.events)
+    path = tmp_path / 'session.ailog'
+    recorder.save(path, end_tick)
+    game = replay(path)
+    assert game.tick == end_tick
+    assert game.snapshot() == snapshots[end_tick]
+    assert game.snapshot() != snapshots[TICKS]
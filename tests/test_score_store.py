@@ -0,0 +1,92 @@
+"""
+test_score_store.py
+
+Tests the atomic scores file writes and the write-behind ScoreStore, including
+a leaderboard that cannot be opened.
+"""
+
+import json
+import os
+import threading
+import pytest
+from score_store import ScoreStore, atomic_write_text, read_scores
+
+TIMEOUT = 5
+
+
+def finishes(call) -> bool:
+    """
+    Run a call on a helper thread and report whether it returned in time.
+
+    Args:
+        call (callable): The call to run.
+
+    Returns:
+        bool: True if it returned within TIMEOUT seconds.
+    """
+    thread = threading.Thread(target=call, daemon=True)
+    thread.start()
+    thread.join(TIMEOUT)
+    return not thread.is_alive()
+
+
+def test_atomic_write_replaces_contents(tmp_path):
+    path = tmp_path / 'scores.json'
+    atomic_write_text(path, '{"hi_score": 10}')
+    atomic_write_text(path, '{"hi_score": 20}')
+    assert read_scores(path) == {'hi_score': 20}
+    assert os.listdir(tmp_path) == ['scores.json']
+
+
+def test_failed_atomic_write_keeps_old_contents(tmp_path, monkeypatch):
+    path = tmp_path / 'scores.json'
+    atomic_write_text(path, '{"hi_score": 10}')
+
+    def fail(fd):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(os, 'fsync', fail)
+    with pytest.raises(OSError):
+        atomic_write_text(path, '{"hi_score": 20}')
+    assert read_scores(path) == {'hi_score': 10}
+
+
+@pytest.mark.parametrize('contents', [None, '', 'not json'])
+def test_read_scores_tolerates_missing_and_bad_files(tmp_path, contents):
+    path = tmp_path / 'scores.json'
+    if contents is not None:
+        path.write_text(contents)
+    assert read_scores(path) == {}
+
+
+def test_store_writes_scores_and_sessions(tmp_path):
+    store = ScoreStore(tmp_path / 'scores.json', tmp_path / 'leaderboard.db')
+    for score in (10, 30, 20):
+        store.save_scores({'hi_score': score})
+        store.save_session({'id': f's{score}', 'player': 'ace', 'started_at': score,
+                            'updated_at': score, 'score': score, 'level': 1,
+                            'finished': 1})
+    assert finishes(store.flush)
+    assert store.writes == 6
+    assert json.loads((tmp_path / 'scores.json').read_text()) == {'hi_score': 20}
+    assert [row['score'] for row in store.top_scores(2)] == [30, 20]
+    assert [row['id'] for row in store.history('ace')] == ['s30', 's20', 's10']
+    assert finishes(store.close)
+
+
+@pytest.mark.parametrize('leaderboard', ['missing_dir', 'corrupt'])
+def test_dead_leaderboard_drops_sessions_without_blocking(tmp_path, leaderboard):
+    if leaderboard == 'missing_dir':
+        leaderboard_file = tmp_path / 'missing' / 'leaderboard.db'
+    else:
+        leaderboard_file = tmp_path / 'leaderboard.db'
+        leaderboard_file.write_bytes(b'not a database' * 100)
+    store = ScoreStore(tmp_path / 'scores.json', leaderboard_file)
+    store.save_session({'id': 's1', 'player': 'ace', 'started_at': 0,
+                        'updated_at': 0, 'score': 5, 'level': 1, 'finished': 0})
+    store.save_scores({'hi_score': 5})
+    assert finishes(store.flush)
+    assert store.writes == 1
+    assert read_scores(tmp_path / 'scores.json') == {'hi_score': 5}
+    assert store.top_scores() == []
+    assert finishes(store.close)
@@ -0,0 +1,87 @@
+"""
+test_swarm_fleet.py
+
+Tests that the NumPy SwarmFleet backend plays exactly like the sprite-based
+AlienFleet: the same input gives the same score, level, ships and alien rects
+on every tick.
+"""
+
+import pygame
+import pytest
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+
+TICKS = 8_000
+
+
+def build_game(backend: str, seed: int) -> tuple:
+    """
+    Create a headless game with the Play button clicked.
+
+    Args:
+        backend (str): The fleet backend.
+        seed (int): Seed for the game's random number generator.
+
+    Returns:
+        tuple: The game and its scripted input.
+    """
+    settings = Settings()
+    settings.fleet_backend = backend
+    source = ScriptedInput()
+    game = AlienInvasion(headless=True, input_source=source, settings=settings, seed=seed)
+    source.click(0, game.play_button.rect.center)
+    return game, source
+
+
+def steer(game: AlienInvasion, offset: int):
+    """
+    Pick the arrow key that moves the ship under the lowest alien.
+
+    Args:
+        game (AlienInvasion): The game to read.
+        offset (int): Pixels to aim to the side of the alien's center.
+
+    Returns:
+        int | None: The key to hold, or None to stand still.
+    """
+    aliens = game.alien_fleet.fleet.sprites()
+    if not aliens:
+        return None
+    target = max(aliens, key=lambda alien: (alien.rect.bottom, -alien.rect.x))
+    dx = target.rect.centerx + offset - game.ship.rect.centerx
+    if abs(dx) < 4:
+        return None
+    return pygame.K_RIGHT if dx > 0 else pygame.K_LEFT
+
+
+def observe(game: AlienInvasion) -> tuple:
+    """
+    Collect the state both backends must agree on.
+    """
+    stats = game.game_stats
+    aliens = sorted(tuple(alien.rect) for alien in game.alien_fleet.fleet.sprites())
+    return stats.score, stats.level, stats.ships_left, game.game_active, aliens
+
+
+@pytest.mark.parametrize('offset', [0, 12])
+def test_swarm_matches_sprite_fleet(offset):
+    sprites, sprites_input = build_game('sprites', offset)
+    swarm, swarm_input = build_game('numpy', offset)
+    held = None
+    for tick in range(TICKS):
+        if tick:
+            key = steer(sprites, offset)
+            for source in (sprites_input, swarm_input):
+                if key != held:
+                    if held is not None:
+                        source.key_up(tick, held)
+                    if key is not None:
+                        source.key_down(tick, key)
+                if tick % 2:
+                    source.tap(tick, pygame.K_SPACE)
+            held = key
+        sprites.step()
+        swarm.step()
+        assert observe(swarm) == observe(sprites), f'backends differ on tick {tick}'
+    assert sprites.game_stats.level > 1
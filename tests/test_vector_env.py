@@ -0,0 +1,75 @@
+"""
+test_vector_env.py
+
+Tests that a one-game VectorEnv follows the real headless game step for step
+under the same random inputs, through the first level clear.
+"""
+
+import numpy as np
+import pygame
+import pytest
+from alien_invasion import AlienInvasion
+from scripted_input import ScriptedInput
+from settings import Settings
+from vector_env import VectorEnv
+
+STEPS = 10_000
+
+
+def random_actions(seed: int, steps: int) -> np.ndarray:
+    """
+    Make a firing-heavy random policy with runs of movement.
+
+    Args:
+        seed (int): Random seed.
+        steps (int): Number of actions.
+
+    Returns:
+        np.ndarray: Actions from 0 to 5.
+    """
+    rng = np.random.default_rng(seed)
+    move = 1
+    actions = np.empty(steps, dtype=np.int64)
+    for step in range(steps):
+        if rng.random() < 0.05:
+            move = int(rng.integers(0, 3))
+        actions[step] = move + 3 * (rng.random() < 0.5)
+    return actions
+
+
+@pytest.mark.parametrize('seed', [1, 2])
+@pytest.mark.parametrize('fleet_backend', ['sprites', 'numpy'])
+def test_vector_env_matches_game(fleet_backend, seed):
+    settings = Settings()
+    settings.fleet_backend = fleet_backend
+    source = ScriptedInput()
+    game = AlienInvasion(headless=True, input_source=source, settings=settings)
+    source.click(0, game.play_button.rect.center)
+    env = VectorEnv(1)
+
+    actions = random_actions(seed, STEPS)
+    held = {pygame.K_LEFT: False, pygame.K_RIGHT: False}
+    for step, action in enumerate(actions):
+        move = action % 3 - 1
+        for key, wanted in ((pygame.K_LEFT, move == -1), (pygame.K_RIGHT, move == 1)):
+            if held[key] != wanted:
+                (source.key_down if wanted else source.key_up)(step, key)
+                held[key] = wanted
+        if action >= 3:
+            source.key_down(step, pygame.K_SPACE)
+
+    for step, action in enumerate(actions):
+        game.step()
+        env.step(np.array([action]))
+        assert game.game_active
+        stats, fleet = game.game_stats, game.alien_fleet
+        expected = (stats.score, stats.level, stats.ships_left, game.ship.rect.x,
+                    fleet.shift_px, fleet.drop, fleet.fleet_direction, len(fleet.fleet),
+                    sorted(tuple(bullet.rect.topleft) for bullet in game.ship.arsenal.arsenal))
+        actual = (env.score[0], env.level[0], env.ships_left[0], env.ship_rx[0],
+                  env.shift_px[0], env.drop[0], env.direction[0],
+                  np.bitwise_count(env.alive[0]).sum(),
+                  sorted(zip(env.bullet_rx[0][env.bullet_active[0]].tolist(),
+                             env.bullet_ry[0][env.bullet_active[0]].tolist())))
+        assert tuple(actual) == expected, f'VectorEnv differs on step {step}'
+    assert game.game_stats.level > 1
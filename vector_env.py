@@ -0,0 +1,480 @@
+"""
+vector_env.py
+
+This module defines the VectorEnv class, which steps many independent games of
+Alien Invasion at once in NumPy arrays, for automated players and difficulty
+tuning. It reproduces the rules of Ship, Arsenal, AlienFleet,
+`Settings.increase_difficulty` and the game's collision, respawn and level
+logic step for step, without pygame.
+
+Each game's formation is stored as one bitmask of living aliens per row, and
+per-level tables map a rect's horizontal extent to the columns it overlaps, so
+a collision test costs a few array operations per row instead of one per alien.
+"""
+
+from copy import copy
+import numpy as np
+from settings import Settings
+
+ONE = np.uint64(1)
+
+
+def _round_half_away(values) -> np.ndarray:
+    """
+    Round to whole pixels, halves away from zero, like assigning to `pygame.Rect`.
+
+    Args:
+        values (np.ndarray | float): Float positions.
+
+    Returns:
+        np.ndarray: Integer positions.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+
+def _lowest_bit_index(masks: np.ndarray) -> np.ndarray:
+    """
+    Find the index of the lowest set bit of each nonzero mask.
+
+    Args:
+        masks (np.ndarray): uint64 masks.
+
+    Returns:
+        np.ndarray: Bit indices.
+    """
+    return np.bitwise_count((masks & (~masks + ONE)) - ONE).astype(np.int64)
+
+
+def _highest_bit_index(masks: np.ndarray) -> np.ndarray:
+    """
+    Find the index of the highest set bit of each nonzero mask.
+
+    Args:
+        masks (np.ndarray): uint64 masks.
+
+    Returns:
+        np.ndarray: Bit indices.
+    """
+    masks = masks.copy()
+    for shift in (1, 2, 4, 8, 16, 32):
+        masks |= masks >> np.uint64(shift)
+    return np.bitwise_count(masks).astype(np.int64) - 1
+
+
+class VectorEnv:
+    """
+    A batch of independent Alien Invasion games stepped together.
+
+    Every step applies one action per game and advances it by one simulation
+    step, exactly as `AlienInvasion.step` would with the matching keys held:
+    actions 0, 1 and 2 move left, stay and move right, and actions 3 to 5 do
+    the same while pressing fire. Rewards are the points scored in the step.
+    A game that ends is reported done and immediately replaced by a new game,
+    as if freshly started.
+
+    Levels are precomputed from the settings until the alien or bullet size
+    would drop below one pixel; games beyond that keep the last level's rules.
+
+    Attributes:
+        settings (Settings): The settings the games follow.
+        num_games (int): Number of games in the batch.
+        num_levels (int): Number of precomputed difficulty levels.
+        rows (int): Rows in the triangle formation.
+        difficulty (np.ndarray): Times each game's difficulty was increased.
+        level (np.ndarray): Each game's level.
+        score (np.ndarray): Each game's score.
+        ships_left (np.ndarray): Each game's remaining ships.
+        respawn (np.ndarray): Steps left in each game's respawn pause.
+        ship_x (np.ndarray): Float x position of each ship.
+        ship_rx (np.ndarray): Rect x position of each ship.
+        bullet_active (np.ndarray): (games, bullets) flags for fired bullets.
+        bullet_y (np.ndarray): Float y position of each bullet.
+        bullet_rx (np.ndarray): Rect x position of each bullet.
+        bullet_ry (np.ndarray): Rect y position of each bullet.
+        formation (np.ndarray): Level index each game's fleet was created at.
+        alive (np.ndarray): (games, rows) uint64 bitmasks of living aliens.
+        shift (np.ndarray): Distance each fleet has travelled horizontally.
+        shift_px (np.ndarray): `shift` rounded to whole pixels.
+        drop (np.ndarray): Distance each fleet has dropped.
+        direction (np.ndarray): Direction each fleet is moving.
+        left (np.ndarray): Left edge of each fleet's living aliens, in formation
+            coordinates.
+        right (np.ndarray): Right edge of each fleet's living aliens.
+        bottom (np.ndarray): Bottom edge of each fleet's living aliens.
+    """
+
+    OBSERVATION_FIELDS = (
+        'ship_x', 'fleet_x', 'fleet_y', 'fleet_direction', 'fleet_left', 'fleet_right',
+        'fleet_bottom', 'aliens_left', 'level', 'ships_left', 'respawn',
+    )
+
+    def __init__(self, num_games: int, settings: Settings = None):
+        """
+        Build the level tables and start every game.
+
+        Args:
+            num_games (int): Number of games to run.
+            settings (Settings | None): Settings to follow instead of the defaults.
+
+        Raises:
+            ValueError: If the formation is too wide for 64-bit row masks.
+        """
+        self.settings = settings if settings is not None else Settings()
+        self.settings.initialize__dynamic_settings()
+        if self.settings.fleet_base_width > 63:
+            raise ValueError('VectorEnv supports formations up to 63 aliens wide')
+        self.num_games = num_games
+        self._build_tables()
+
+        n = num_games
+        bullets = self.settings.bullet_amount
+        self.difficulty = np.zeros(n, dtype=np.int64)
+        self.level = np.ones(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.ships_left = np.zeros(n, dtype=np.int64)
+        self.respawn = np.zeros(n, dtype=np.int64)
+        self.ship_x = np.zeros(n)
+        self.ship_rx = np.zeros(n, dtype=np.int64)
+        self.bullet_active = np.zeros((n, bullets), dtype=bool)
+        self.bullet_y = np.zeros((n, bullets))
+        self.bullet_rx = np.zeros((n, bullets), dtype=np.int64)
+        self.bullet_ry = np.zeros((n, bullets), dtype=np.int64)
+        self.formation = np.zeros(n, dtype=np.int64)
+        self.alive = np.zeros((n, self.rows), dtype=np.uint64)
+        self.shift = np.zeros(n)
+        self.shift_px = np.zeros(n, dtype=np.int64)
+        self.drop = np.zeros(n, dtype=np.int64)
+        self.direction = np.zeros(n, dtype=np.int64)
+        self.left = np.zeros(n, dtype=np.int64)
+        self.right = np.zeros(n, dtype=np.int64)
+        self.bottom = np.zeros(n, dtype=np.int64)
+        self.reset()
+
+    def _build_tables(self):
+        """
+        Precompute every level's speeds, sizes and formation layout.
+        """
+        settings = self.settings
+        step_scale = settings.step_scale
+        screen_w, screen_h = settings.screen_w, settings.screen_h
+        base = settings.fleet_base_width
+        self.rows = (base + 1) // 2
+        counts = base - 2 * np.arange(self.rows)
+
+        # Formation x coordinates a rect can have, with margin for fleet shifts.
+        self.x_offset = screen_w + 256
+        width = 3 * screen_w + 512
+
+        level = copy(settings)
+        level.initialize__dynamic_settings()
+        ship_step, bullet_step, fleet_step, bullet_size, alien_size = [], [], [], [], []
+        alien_x, row_top, column_lo, column_hi, full, bounds = [], [], [], [], [], []
+        while len(ship_step) < 1000:
+            alien_w, alien_h = int(level.alien_w), int(level.alien_h)
+            bullet_w, bullet_h = int(level.bullet_w), int(level.bullet_h)
+            if min(alien_w, alien_h, bullet_w, bullet_h) < 1:
+                break
+            ship_step.append(level.ship_speed * step_scale)
+            bullet_step.append(level.bullet_speed * step_scale)
+            fleet_step.append(level.fleet_speed * step_scale)
+            bullet_size.append((bullet_w, bullet_h))
+            alien_size.append((alien_w, alien_h))
+
+            # The triangle layout of AlienFleet, rounded like pygame.Rect.
+            fleet_h = (screen_h // 2) // level.alien_h
+            fleet_h = int(fleet_h - (1 if fleet_h % 2 == 0 else 2))
+            y_offset = (screen_h // 2 - fleet_h * level.alien_h) // 2
+            xs = np.full((self.rows, base), 1 << 30, dtype=np.int64)
+            for row, count in enumerate(counts):
+                start_x = (screen_w - count * level.alien_w) // 2
+                xs[row, :count] = _round_half_away(start_x + np.arange(count) * level.alien_w)
+            tops = _round_half_away(y_offset + np.arange(self.rows) * level.alien_h)
+            alien_x.append(xs)
+            row_top.append(tops)
+
+            # Columns of each row overlapped by a rect: those from the number of
+            # aliens ending at or before its left edge, up to the number starting
+            # before its right edge.
+            pixels = np.arange(width) - self.x_offset
+            column_lo.append((xs[:, None, :] + alien_w <= pixels[None, :, None]).sum(2))
+            column_hi.append((xs[:, None, :] < pixels[None, :, None]).sum(2))
+
+            masks = np.array([(1 << int(count)) - 1 for count in counts], dtype=np.uint64)
+            full.append(masks)
+            bounds.append((xs[:, 0].min(), (xs[np.arange(self.rows), counts - 1]).max() + alien_w,
+                           tops[-1] + alien_h))
+            level.increase_difficulty()
+
+        if not ship_step:
+            raise ValueError('The settings start with an alien or bullet smaller than a pixel')
+        self.num_levels = len(ship_step)
+        self.ship_step = np.array(ship_step)
+        self.bullet_step = np.array(bullet_step)
+        self.fleet_step = np.array(fleet_step)
+        self.bullet_w, self.bullet_h = np.array(bullet_size, dtype=np.int64).T
+        self.alien_w, self.alien_h = np.array(alien_size, dtype=np.int64).T
+        self.alien_x = np.array(alien_x)
+        self.row_top = np.array(row_top)
+        self.column_lo = np.array(column_lo, dtype=np.uint64)
+        self.column_hi = np.array(column_hi, dtype=np.uint64)
+        self.full_alive = np.array(full)
+        self.full_bounds = np.array(bounds, dtype=np.int64)
+        self.row_index = np.arange(self.rows)
+
+        self.ship_w, self.ship_h = int(settings.ship_w), int(settings.ship_h)
+        self.ship_start = float(screen_w // 2 - self.ship_w // 2)
+        self.ship_top = screen_h - self.ship_h
+        self.respawn_steps = round(settings.respawn_pause * settings.sim_rate)
+
+    def reset(self) -> np.ndarray:
+        """
+        Start a new game in every slot.
+
+        Returns:
+            np.ndarray: The observations.
+        """
+        self._new_games(np.arange(self.num_games))
+        return self.observe()
+
+    def _new_games(self, games: np.ndarray):
+        """
+        Replace games with freshly started ones.
+
+        Args:
+            games (np.ndarray): Indices of the games.
+        """
+        self.difficulty[games] = 0
+        self.level[games] = 1
+        self.score[games] = 0
+        self.ships_left[games] = self.settings.starting_ship_count
+        self.respawn[games] = 0
+        self.ship_x[games] = self.ship_start
+        self.ship_rx[games] = int(self.ship_start)
+        self.direction[games] = self.settings.fleet_direction
+        self._reset_level(games)
+
+    def _reset_level(self, games: np.ndarray):
+        """
+        Clear the bullets and create a new fleet at each game's current difficulty.
+
+        Like AlienFleet, the fleet keeps its direction.
+
+        Args:
+            games (np.ndarray): Indices of the games.
+        """
+        formation = self.difficulty[games]
+        self.bullet_active[games] = False
+        self.formation[games] = formation
+        self.alive[games] = self.full_alive[formation]
+        self.shift[games] = 0.0
+        self.shift_px[games] = 0
+        self.drop[games] = 0
+        self.left[games], self.right[games], self.bottom[games] = self.full_bounds[formation].T
+
+    def _overlaps(self, games: np.ndarray, x, y, w, h) -> np.ndarray:
+        """
+        Find the living aliens overlapping a rect in each game, with the same
+        rules as `Rect.colliderect`.
+
+        Args:
+            games (np.ndarray): Index of the game of each rect.
+            x (np.ndarray): Rect x positions, in screen coordinates.
+            y (np.ndarray | int): Rect y positions.
+            w (np.ndarray | int): Rect widths.
+            h (np.ndarray | int): Rect heights.
+
+        Returns:
+            np.ndarray: (rects, rows) bitmasks of the overlapped living aliens.
+        """
+        formation = self.formation[games]
+        local_x = x - self.shift_px[games] + self.x_offset
+        local_y = y - self.drop[games]
+        top = self.row_top[formation]
+        vertical = ((top < (local_y + h)[:, None])
+                    & (top + self.alien_h[formation][:, None] > local_y[:, None]))
+
+        # Only look up the columns of rows the rect overlaps vertically.
+        rect, row = np.nonzero(vertical)
+        formation = formation[rect]
+        last = self.column_lo.shape[2] - 1
+        lo = self.column_lo[formation, row, np.clip(local_x[rect], 0, last)]
+        hi = self.column_hi[formation, row, np.clip((local_x + w)[rect], 0, last)]
+        overlaps = np.zeros(vertical.shape, dtype=np.uint64)
+        overlaps[rect, row] = ((ONE << hi) - (ONE << lo)) & self.alive[games[rect], row]
+        return overlaps
+
+    def _update_bounds(self, games: np.ndarray):
+        """
+        Recompute the edges of the living aliens after some were destroyed.
+
+        Args:
+            games (np.ndarray): Indices of games whose fleets are not empty.
+        """
+        alive = self.alive[games]
+        occupied = alive != 0
+        formation = self.formation[games]
+        xs = self.alien_x[formation]
+        safe = np.where(occupied, alive, ONE)
+        first = np.take_along_axis(xs, _lowest_bit_index(safe)[:, :, None], 2)[:, :, 0]
+        last = np.take_along_axis(xs, _highest_bit_index(safe)[:, :, None], 2)[:, :, 0]
+        big = np.int64(1 << 40)
+        self.left[games] = np.where(occupied, first, big).min(1)
+        self.right[games] = np.where(occupied, last, -big).max(1) + self.alien_w[formation]
+        lowest = self.rows - 1 - occupied[:, ::-1].argmax(1)
+        self.bottom[games] = (self.row_top[formation, lowest] + self.alien_h[formation])
+
+    def _lose_ship(self, games: np.ndarray, over: np.ndarray):
+        """
+        Apply `_check_game_status`: use up a ship, reset the level and pause,
+        or end the game when no ships are left.
+
+        Args:
+            games (np.ndarray): Indices of the games that lost a life.
+            over (np.ndarray): Game-over flags, updated in place.
+        """
+        has_ships = self.ships_left[games] > 0
+        over[games[~has_ships]] = True
+        games = games[has_ships]
+        self.ships_left[games] -= 1
+        self._reset_level(games)
+        self.respawn[games] = self.respawn_steps
+
+    def step(self, actions) -> tuple:
+        """
+        Advance every game by one simulation step.
+
+        Args:
+            actions (np.ndarray): One action from 0 to 5 per game.
+
+        Returns:
+            tuple: Observations, rewards and done flags for every game. Done
+                games have already been replaced by new ones.
+        """
+        actions = np.asarray(actions)
+        move = actions % 3 - 1
+        fire = actions >= 3
+        playing = self.respawn == 0
+        self.respawn[~playing] -= 1
+        d = self.difficulty
+        screen_w = self.settings.screen_w
+
+        # Events: fire from the ship's top center if a bullet is free.
+        active = self.bullet_active
+        can_fire = playing & fire & (active.sum(1) < self.settings.bullet_amount)
+        games = np.flatnonzero(can_fire)
+        slots = active[games].argmin(1)
+        bullet_w = self.bullet_w[d[games]]
+        active[games, slots] = True
+        self.bullet_rx[games, slots] = self.ship_rx[games] + self.ship_w // 2 - bullet_w // 2
+        self.bullet_ry[games, slots] = self.ship_top
+        self.bullet_y[games, slots] = self.ship_top
+
+        # Ship and bullets.
+        speed = self.ship_step[d]
+        right = playing & (move == 1) & (self.ship_rx + self.ship_w < screen_w)
+        left = playing & (move == -1) & (self.ship_rx > 0)
+        self.ship_x += np.where(right, speed, 0.0)
+        self.ship_x -= np.where(left, speed, 0.0)
+        self.ship_rx = _round_half_away(self.ship_x)
+
+        moving = active & playing[:, None]
+        self.bullet_y -= np.where(moving, self.bullet_step[d][:, None], 0.0)
+        self.bullet_ry = _round_half_away(self.bullet_y)
+        active &= ~(self.bullet_ry + self.bullet_h[d][:, None] <= 0)
+
+        # Fleet: reverse and drop at an edge, then advance.
+        edge = playing & ((self.right + self.shift_px >= screen_w) | (self.left + self.shift_px <= 0))
+        self.drop += np.where(edge, self.settings.fleet_drop_speed, 0)
+        self.direction = np.where(edge, -self.direction, self.direction)
+        self.shift += np.where(playing, self.fleet_step[d] * self.direction, 0.0)
+        self.shift_px = np.round(self.shift).astype(np.int64)
+
+        # Collisions, in the order of AlienInvasion._check_collisions.
+        over = np.zeros(self.num_games, dtype=bool)
+        low = np.flatnonzero(playing & (self.bottom + self.drop > self.ship_top))
+        if len(low):
+            hit = self._overlaps(low, self.ship_rx[low], self.ship_top, self.ship_w,
+                                 self.ship_h).any(1)
+            games = low[hit]
+            self.ship_x[games] = self.ship_start
+            self.ship_rx[games] = int(self.ship_start)
+            self._lose_ship(games, over)
+
+        games = np.flatnonzero(playing & (self.bottom + self.drop >= self.settings.screen_h))
+        if len(games):
+            self._lose_ship(games, over)
+
+        rewards = np.zeros(self.num_games, dtype=np.int64)
+        games, slots = np.nonzero(active & playing[:, None])
+        if len(games):
+            # Skip bullets outside the box around the living aliens.
+            x = self.bullet_rx[games, slots]
+            y = self.bullet_ry[games, slots]
+            shift_px, drop = self.shift_px[games], self.drop[games]
+            near = ((y < self.bottom[games] + drop)
+                    & (y + self.bullet_h[d[games]] > self.row_top[self.formation[games], 0] + drop)
+                    & (x < self.right[games] + shift_px)
+                    & (x + self.bullet_w[d[games]] > self.left[games] + shift_px))
+            games, slots = games[near], slots[near]
+        if len(games):
+            hits = self._overlaps(games, self.bullet_rx[games, slots], self.bullet_ry[games, slots],
+                                  self.bullet_w[d[games]], self.bullet_h[d[games]])
+            found = hits != 0
+            hit = found.any(1)
+            games, slots, hits, found = games[hit], slots[hit], hits[hit], found[hit]
+            if len(games):
+                row = found.argmax(1)
+                masks = hits[np.arange(len(games)), row]
+                killed = np.zeros((self.num_games, self.rows), dtype=np.uint64)
+                np.bitwise_or.at(killed, (games, row), masks & (~masks + ONE))
+                active[games, slots] = False
+                self.alive &= ~killed
+                points = np.bitwise_count(killed).sum(1, dtype=np.int64) * self.settings.alien_points
+                rewards += points
+                self.score += points
+
+                games = np.unique(games)
+                cleared = ~self.alive[games].any(1)
+                if cleared.any():
+                    won = games[cleared]
+                    self._reset_level(won)
+                    self.difficulty[won] = np.minimum(self.difficulty[won] + 1, self.num_levels - 1)
+                    self.level[won] += 1
+                remaining = games[~cleared]
+                if len(remaining):
+                    self._update_bounds(remaining)
+
+        done = over
+        if done.any():
+            self._new_games(np.flatnonzero(done))
+        return self.observe(), rewards, done
+
+    def observe(self) -> np.ndarray:
+        """
+        Build each game's observation: the values of `OBSERVATION_FIELDS`,
+        then the x and y of each bullet slot, -1 when the slot is free.
+        Positions are rect positions in screen coordinates.
+
+        Returns:
+            np.ndarray: (games, fields) float32 observations.
+        """
+        bullets = self.settings.bullet_amount
+        observations = np.empty((self.num_games, len(self.OBSERVATION_FIELDS) + 2 * bullets),
+                                dtype=np.float32)
+        observations[:, 0] = self.ship_rx
+        observations[:, 1] = self.shift_px
+        observations[:, 2] = self.drop
+        observations[:, 3] = self.direction
+        observations[:, 4] = self.left + self.shift_px
+        observations[:, 5] = self.right + self.shift_px
+        observations[:, 6] = self.bottom + self.drop
+        observations[:, 7] = np.bitwise_count(self.alive).sum(1)
+        observations[:, 8] = self.level
+        observations[:, 9] = self.ships_left
+        observations[:, 10] = self.respawn
+        start = len(self.OBSERVATION_FIELDS)
+        active = self.bullet_active
+        observations[:, start:start + bullets] = np.where(active, self.bullet_rx, -1)
+        observations[:, start + bullets:] = np.where(active, self.bullet_ry, -1)
+        return observations